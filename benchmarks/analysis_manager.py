@@ -0,0 +1,110 @@
+"""Report the address analysis time saved by sharing an `AnalysisManager`.
+
+Compiles a synthetic circuit with the QASM2 pipeline (`QASM2.emit`, which shares
+the address analysis between `GlobalToParallel` and `ParallelToUOp`) and with the
+STIM pipeline (`SquinToStimPass`), and reports how often the address analysis
+actually ran, the time spent in it, and the time saved by reusing cached results.
+
+Run with:
+
+    python benchmarks/analysis_manager.py --qubits 32 --depth 20
+"""
+
+import time
+import argparse
+import contextlib
+
+from bloqade import qasm2, squin
+from bloqade.stim.passes import SquinToStimPass
+from bloqade.analysis.address import AddressAnalysis
+from bloqade.analysis.manager import AnalysisManager
+
+
+@contextlib.contextmanager
+def instrument():
+    stats = {"runs": 0, "time": 0.0, "managers": []}
+    analysis_run = AddressAnalysis.run
+    manager_run = AnalysisManager.run
+
+    def timed_analysis_run(self, *args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return analysis_run(self, *args, **kwargs)
+        finally:
+            stats["runs"] += 1
+            stats["time"] += time.perf_counter() - start
+
+    def tracked_manager_run(self, *args, **kwargs):
+        if not any(manager is self for manager in stats["managers"]):
+            stats["managers"].append(self)
+        return manager_run(self, *args, **kwargs)
+
+    AddressAnalysis.run = timed_analysis_run  # type: ignore
+    AnalysisManager.run = tracked_manager_run  # type: ignore
+    try:
+        yield stats
+    finally:
+        AddressAnalysis.run = analysis_run  # type: ignore
+        AnalysisManager.run = manager_run  # type: ignore
+
+
+def qasm2_kernel(num_qubits: int, depth: int):
+    @qasm2.extended
+    def main():
+        q = qasm2.qreg(num_qubits)
+        for _ in range(depth):
+            for i in range(num_qubits - 1):
+                qasm2.h(q[i])
+                qasm2.cx(q[i], q[i + 1])
+
+    return main
+
+
+def squin_kernel(num_qubits: int, depth: int):
+    @squin.kernel
+    def main():
+        q = squin.qalloc(num_qubits)
+        for _ in range(depth):
+            for i in range(num_qubits - 1):
+                squin.h(q[i])
+                squin.cx(q[i], q[i + 1])
+        squin.broadcast.measure(q)
+
+    return main
+
+
+def report(name: str, stats: dict, elapsed: float):
+    saved = sum(manager.time_saved for manager in stats["managers"])
+    hits = sum(manager.hits for manager in stats["managers"])
+    print(
+        f"{name:>6} {elapsed:>9.2f} {stats['runs']:>5} {stats['time']:>13.2f} "
+        f"{hits:>5} {saved:>10.2f}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--qubits", type=int, default=32)
+    parser.add_argument("--depth", type=int, default=20)
+    args = parser.parse_args()
+
+    print(
+        f"{'target':>6} {'total [s]':>9} {'runs':>5} {'analysis [s]':>13} "
+        f"{'hits':>5} {'saved [s]':>10}"
+    )
+
+    kernel = qasm2_kernel(args.qubits, args.depth)
+    with instrument() as stats:
+        start = time.perf_counter()
+        qasm2.emit.QASM2().emit(kernel)
+        report("qasm2", stats, time.perf_counter() - start)
+
+    kernel = squin_kernel(args.qubits, args.depth)
+    with instrument() as stats:
+        start = time.perf_counter()
+        SquinToStimPass(kernel.dialects)(kernel)
+        report("stim", stats, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
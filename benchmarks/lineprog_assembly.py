@@ -0,0 +1,65 @@
+"""Benchmark the matrix assembly of `LPProblem` for growing circuit sizes.
+
+The problems mimic the ones built by `bloqade.cirq_utils.parallelize.solve_epochs`:
+one variable per gate, an ordering constraint per dependency, an absolute value
+objective per pair of similar gates and a linear objective over all gates.
+
+Run with:
+
+    python benchmarks/lineprog_assembly.py --sizes 1000 10000 100000
+"""
+
+import time
+import random
+import argparse
+
+from bloqade.cirq_utils.lineprog import Variable, LPProblem, Expression
+
+
+def build_problem(num_gates: int, seed: int = 0) -> LPProblem:
+    rng = random.Random(seed)
+    basis = [Variable() for _ in range(num_gates)]
+
+    lp = LPProblem()
+    for var in basis:
+        lp.add_gez(1.0 * var)
+
+    # NOTE: a few dependencies and similar gates per gate, as in a layered circuit
+    for i in range(1, num_gates):
+        for j in rng.sample(range(max(0, i - 16), i), min(i, 2)):
+            lp.add_gez(basis[i] - basis[j] - 1.0)
+        j = rng.randrange(max(0, i - 16), i)
+        lp.add_abs((basis[i] - basis[j]) * 0.5)
+
+    lp.add_linear(0.01 * Expression(dict.fromkeys(basis, 1)))
+    return lp
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 3_000, 10_000, 30_000]
+    )
+    parser.add_argument("--solve", action="store_true", help="also time the solver")
+    args = parser.parse_args()
+
+    print(f"{'gates':>8} {'variables':>10} {'build [s]':>10} {'assemble [s]':>13}")
+    for size in args.sizes:
+        start = time.perf_counter()
+        lp = build_problem(size)
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        basis, *_ = lp._assemble()
+        assemble = time.perf_counter() - start
+
+        line = f"{size:>8} {len(basis):>10} {build:>10.3f} {assemble:>13.3f}"
+        if args.solve:
+            start = time.perf_counter()
+            lp.solve()
+            line += f" solve: {time.perf_counter() - start:.3f}s"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Report the cost of the measurement ID analysis on a large measurement.
+
+Measures all the qubits of a register a number of times, flattens the kernel as
+`SquinToStimPass` does, and reports the time and peak memory of
+`MeasurementIDAnalysis`.
+
+Run with:
+
+    python benchmarks/measure_id_compact.py --qubits 10000 --rounds 10
+"""
+
+import time
+import argparse
+import tracemalloc
+
+from bloqade import squin
+from bloqade.analysis.measure_id import MeasurementIDAnalysis
+from bloqade.stim.passes.flatten import Flatten
+
+
+def kernel(num_qubits: int, rounds: int):
+    @squin.kernel
+    def main():
+        q = squin.qalloc(num_qubits)
+        for _ in range(rounds):
+            m = squin.broadcast.measure(q)
+            squin.broadcast.is_one(m)
+
+    return main
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--qubits", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+
+    mt = kernel(args.qubits, args.rounds)
+    Flatten(mt.dialects).fixpoint(mt)
+    analysis = MeasurementIDAnalysis(mt.dialects)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    analysis.run(mt)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{'qubits':>8} {'rounds':>6} {'time [s]':>9} {'peak [MiB]':>10}")
+    print(f"{args.qubits:>8} {args.rounds:>6} {elapsed:>9.3f} {peak / 2**20:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
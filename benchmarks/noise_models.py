@@ -0,0 +1,47 @@
+"""Report the time of adding noise to long circuits with the Gemini noise models.
+
+Builds random circuits of native gates, alternating layers of PhasedXZ and CZ
+gates, and reports the time of `transform_circuit` with the one-zone and the
+two-zone noise models, along with the number of moments of the noisy circuit.
+The time should grow linearly with the number of moments.
+
+Run with:
+
+    python benchmarks/noise_models.py --depth 1000 10000 100000
+"""
+
+import time
+import argparse
+
+from suite import native_circuit
+
+from bloqade.cirq_utils.noise import (
+    GeminiOneZoneNoiseModel,
+    GeminiTwoZoneNoiseModel,
+    transform_circuit,
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depth", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--qubits", type=int, default=20)
+    args = parser.parse_args()
+
+    models = {
+        "one-zone": GeminiOneZoneNoiseModel(),
+        "two-zone": GeminiTwoZoneNoiseModel(),
+    }
+
+    print(f"{'model':<9} {'depth':>7} {'moments':>8} {'time [s]':>9}")
+    for depth in args.depth:
+        circuit = native_circuit(args.qubits, depth)
+        for name, model in models.items():
+            start = time.perf_counter()
+            noisy = transform_circuit(circuit, to_native_gateset=False, model=model)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<9} {depth:>7} {len(noisy):>8} {elapsed:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
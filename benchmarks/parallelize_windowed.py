@@ -0,0 +1,59 @@
+"""Compare windowed and global `parallelize` on random circuits.
+
+For each window configuration, reports the number of moments of the parallelized
+circuit and the time it took, next to the global solve over the whole circuit.
+
+Run with:
+
+    python benchmarks/parallelize_windowed.py --qubits 10 --depth 60 --window 20 --overlap 5
+"""
+
+import time
+import argparse
+
+import cirq
+
+from bloqade.cirq_utils import parallelize
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--qubits", type=int, default=10)
+    parser.add_argument("--depth", type=int, default=60)
+    parser.add_argument("--window", type=int, nargs="+", default=[10, 20, 40])
+    parser.add_argument("--overlap", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--skip-global", action="store_true", help="do not run the global solve"
+    )
+    args = parser.parse_args()
+
+    circuit = cirq.testing.random_circuit(
+        cirq.LineQubit.range(args.qubits),
+        n_moments=args.depth,
+        op_density=0.8,
+        random_state=args.seed,
+    )
+
+    configs: list[int | None] = list(args.window)
+    if not args.skip_global:
+        configs.insert(0, None)
+
+    print(f"{'window':>8} {'overlap':>8} {'moments':>8} {'time [s]':>9}")
+    for window in configs:
+        start = time.perf_counter()
+        result = parallelize(
+            circuit,
+            window_depth=window,
+            window_overlap=args.overlap if window is not None else 0,
+            max_workers=args.workers,
+        )
+        elapsed = time.perf_counter() - start
+        label = "global" if window is None else str(window)
+        overlap = args.overlap if window is not None else 0
+        print(f"{label:>8} {overlap:>8} {len(result.moments):>8} {elapsed:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
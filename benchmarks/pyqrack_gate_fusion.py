@@ -0,0 +1,64 @@
+"""Compare the per-shot latency of PyQrack tapes with and without gate fusion.
+
+Loads random circuits from cirq, either of Clifford+T gates or of the native
+PhasedXZ and CZ gates (each PhasedXZ being three rotations in PyQrack), and
+reports the number of simulator calls of their tape and the time per shot of
+`batch_run`, interpreting the kernel, replaying its tape, and replaying its
+tape with the single-qubit gates fused.
+
+Run with:
+
+    python benchmarks/pyqrack_gate_fusion.py --qubits 4 8 16
+"""
+
+import time
+import argparse
+
+from suite import native_circuit, clifford_t_circuit
+
+from bloqade.pyqrack import StackMemorySimulator
+from bloqade.cirq_utils import load_circuit
+
+
+def per_shot(task, shots: int, **kwargs) -> float:
+    start = time.perf_counter()
+    task.batch_run(shots, **kwargs)
+    return (time.perf_counter() - start) / shots
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--qubits", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument("--depth", type=int, default=40)
+    parser.add_argument("--shots", type=int, default=200)
+    args = parser.parse_args()
+
+    circuits = {
+        "clifford+t": clifford_t_circuit,
+        "native": native_circuit,
+    }
+
+    print(
+        f"{'circuit':<11} {'qubits':>6} {'calls':>6} {'fused':>6} "
+        f"{'interp [ms]':>11} {'tape [ms]':>9} {'fused [ms]':>10}"
+    )
+    for name, circuit in circuits.items():
+        for num_qubits in args.qubits:
+            kernel = load_circuit(circuit(num_qubits, args.depth))
+            task = StackMemorySimulator(min_qubits=num_qubits).task(kernel)
+            tape = task.compile_tape()
+            fused = task.compile_tape(fuse_gates=True)
+            assert tape is not None and fused is not None
+
+            interp = per_shot(task, max(args.shots // 20, 1))
+            replay = per_shot(task, args.shots, tape=True)
+            replay_fused = per_shot(task, args.shots, tape=True, fuse_gates=True)
+            print(
+                f"{name:<11} {num_qubits:>6} {len(tape.instructions):>6} "
+                f"{len(fused.instructions):>6} {interp * 1e3:>11.3f} "
+                f"{replay * 1e3:>9.3f} {replay_fused * 1e3:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark the rich and plain-text printers of the QASM2 AST.
+
+Builds a synthetic program with the given number of instructions, then serializes
+it with the rich `Printer` (recording console, as used by `QASM2.emit_str` before)
+and with the plain-text `TextPrinter` (`qasm2.parse.dumps`), checking that both
+produce the same text.
+
+Run with:
+
+    python benchmarks/qasm2_emit_text.py --instructions 100000
+"""
+
+import io
+import time
+import random
+import argparse
+
+from rich.console import Console
+
+from bloqade.qasm2.parse import ast, dumps, pprint
+
+
+def build_program(num_instructions: int, num_qubits: int, seed: int = 0):
+    rng = random.Random(seed)
+
+    def bit(addr: int):
+        return ast.Bit(ast.Name("q"), addr)
+
+    statements: list[ast.Statement] = [
+        ast.Include("qelib1.inc"),
+        ast.QReg("q", num_qubits),
+        ast.CReg("c", num_qubits),
+    ]
+    for _ in range(num_instructions):
+        a, b = rng.sample(range(num_qubits), 2)
+        kind = rng.randrange(3)
+        if kind == 0:
+            statements.append(ast.Instruction(ast.Name("h"), [], [bit(a)]))
+        elif kind == 1:
+            theta = ast.Number(round(rng.random(), 6))
+            statements.append(ast.Instruction(ast.Name("rz"), [theta], [bit(a)]))
+        else:
+            statements.append(ast.CXGate(bit(a), bit(b)))
+
+    return ast.MainProgram(ast.OPENQASM(ast.Version(2, 0)), statements)
+
+
+def rich_str(program: ast.MainProgram) -> str:
+    console = Console(file=io.StringIO(), force_terminal=False, record=True)
+    pprint(program, console=console)
+    return console.export_text()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--instructions", type=int, default=100_000)
+    parser.add_argument("--qubits", type=int, default=64)
+    args = parser.parse_args()
+
+    program = build_program(args.instructions, args.qubits)
+    results = {}
+    print(f"{'printer':>8} {'time [s]':>9} {'instr/s':>10}")
+    for name, fn in (("rich", rich_str), ("plain", dumps)):
+        start = time.perf_counter()
+        results[name] = fn(program)
+        elapsed = time.perf_counter() - start
+        print(f"{name:>8} {elapsed:>9.2f} {args.instructions / elapsed:>10.0f}")
+
+    assert results["rich"] == results["plain"], "printers disagree"
+
+
+if __name__ == "__main__":
+    main()
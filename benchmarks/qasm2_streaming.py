@@ -0,0 +1,73 @@
+"""Benchmark regular and streaming loading of large QASM2 files.
+
+Generates a synthetic program with the given number of gates, then loads it with
+`qasm2.loadfile` and `qasm2.loadfile(..., streaming=True)`, reporting the time and
+the peak memory allocated by Python (via `tracemalloc`) of each.
+
+Run with:
+
+    python benchmarks/qasm2_streaming.py --gates 1000000
+"""
+
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from bloqade import qasm2
+
+
+def write_program(path: Path, num_gates: int, num_qubits: int, seed: int = 0):
+    rng = random.Random(seed)
+    with path.open("w") as f:
+        f.write('OPENQASM 2.0;\ninclude "qelib1.inc";\n')
+        f.write(f"qreg q[{num_qubits}];\ncreg c[{num_qubits}];\n")
+        for _ in range(num_gates):
+            a, b = rng.sample(range(num_qubits), 2)
+            kind = rng.randrange(3)
+            if kind == 0:
+                f.write(f"h q[{a}];\n")
+            elif kind == 1:
+                f.write(f"rz({rng.random():.6f}) q[{a}];\n")
+            else:
+                f.write(f"CX q[{a}], q[{b}];\n")
+        f.write("measure q -> c;\n")
+
+
+def measure(path: Path, streaming: bool) -> tuple[float, float]:
+    start = time.perf_counter()
+    qasm2.loadfile(path, streaming=streaming)
+    elapsed = time.perf_counter() - start
+
+    # NOTE: tracing slows down the loading, measure the memory in a separate run
+    tracemalloc.start()
+    qasm2.loadfile(path, streaming=streaming)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--gates", type=int, default=1_000_000)
+    parser.add_argument("--qubits", type=int, default=64)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / "program.qasm"
+        write_program(path, args.gates, args.qubits)
+        size = path.stat().st_size / 2**20
+        print(f"{args.gates} gates, {size:.1f} MiB")
+
+        print(f"{'mode':>10} {'time [s]':>9} {'gates/s':>10} {'peak [MiB]':>11}")
+        for streaming in (False, True):
+            elapsed, peak = measure(path, streaming)
+            mode = "streaming" if streaming else "regular"
+            rate = args.gates / elapsed
+            print(f"{mode:>10} {elapsed:>9.2f} {rate:>10.0f} {peak:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare the per-shot latency of squin kernels with and without inlined stdlib calls.
+
+Builds brickwork kernels of `squin.h`, `squin.rz` and `squin.cx` calls, i.e. of
+the single-qubit wrappers of the standard library, compiled once as they are
+and once with `squin.kernel(inline_stdlib=True)`, and reports the time per shot
+of interpreting each of them with `StackMemorySimulator`.
+
+Run with:
+
+    python benchmarks/squin_inline_stdlib.py --qubits 4 8 16
+"""
+
+import time
+import argparse
+
+from bloqade import squin
+from bloqade.pyqrack import StackMemorySimulator
+
+
+def brickwork(num_qubits: int, depth: int, inline_stdlib: bool):
+    @squin.kernel(inline_stdlib=inline_stdlib)
+    def main():
+        q = squin.qalloc(num_qubits)
+        for _ in range(depth):
+            for i in range(num_qubits):
+                squin.h(q[i])
+                squin.rz(0.3, q[i])
+            for i in range(num_qubits - 1):
+                squin.cx(q[i], q[i + 1])
+        return squin.broadcast.measure(q)
+
+    return main
+
+
+def per_shot(task, shots: int) -> float:
+    start = time.perf_counter()
+    task.batch_run(shots)
+    return (time.perf_counter() - start) / shots
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--qubits", type=int, nargs="+", default=[4, 8, 16])
+    parser.add_argument("--depth", type=int, default=10)
+    parser.add_argument("--shots", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'qubits':>6} {'calls [ms]':>10} {'inlined [ms]':>12}")
+    for num_qubits in args.qubits:
+        times = []
+        for inline_stdlib in (False, True):
+            kernel = brickwork(num_qubits, args.depth, inline_stdlib)
+            task = StackMemorySimulator(min_qubits=num_qubits).task(kernel)
+            times.append(per_shot(task, args.shots))
+
+        print(f"{num_qubits:>6} {times[0] * 1e3:>10.3f} {times[1] * 1e3:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
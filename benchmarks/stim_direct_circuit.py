@@ -0,0 +1,59 @@
+"""Compare building a `stim.Circuit` from a flat kernel with and without
+lowering it to the stim dialect.
+
+Loads a noisy surface code memory experiment from cirq, which gives a
+straight-line kernel, and reports the time to build its circuit with
+`SquinToStimPass` followed by the emitter, and with the direct builder of
+`bloqade.stim.emit.direct`, checking that both give the same circuit.
+
+Run with:
+
+    python benchmarks/stim_direct_circuit.py --distance 3 5 7
+"""
+
+import time
+import argparse
+
+import cirq
+from suite import surface_code_circuit
+
+import stim
+from bloqade.cirq_utils import load_circuit
+from bloqade.stim.circuit import _CircuitWriter, emit_to_stream
+from bloqade.stim.emit.direct import build_circuit
+
+
+def lower(mt) -> stim.Circuit:
+    circuit = stim.Circuit()
+    writer = _CircuitWriter(circuit)
+    emit_to_stream(mt, writer)  # type: ignore
+    writer.flush()
+    return circuit
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--distance", type=int, nargs="+", default=[3, 5, 7])
+    parser.add_argument("--noise", type=float, default=1e-3)
+    args = parser.parse_args()
+
+    print(f"{'distance':>8} {'statements':>10} {'pass [s]':>9} {'direct [s]':>10}")
+    for distance in args.distance:
+        circuit = surface_code_circuit(distance, rounds=distance)
+        mt = load_circuit(circuit.with_noise(cirq.depolarize(args.noise)))
+        size = sum(1 for _ in mt.callable_region.walk())
+
+        start = time.perf_counter()
+        expected = lower(mt)
+        lowered = time.perf_counter() - start
+
+        start = time.perf_counter()
+        direct = build_circuit(mt)
+        built = time.perf_counter() - start
+
+        assert direct == expected, "the direct builder gave a different circuit"
+        print(f"{distance:>8} {size:>10} {lowered:>9.3f} {built:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
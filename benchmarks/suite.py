@@ -0,0 +1,469 @@
+"""Run the benchmark suite of the compile pipelines and simulators.
+
+Each workload is run on synthetic inputs of growing size, and the wall time (best
+of `--repeat` runs) and the peak memory allocated by Python (one extra run under
+`tracemalloc`) are reported for every size, so that scaling regressions are
+visible. Building the input of a workload is not measured.
+
+Results can be saved with `--json` and compared against a previous run with
+`--compare`, which exits with a non-zero status if a workload got slower or
+bigger than `--threshold` times the baseline.
+
+Run with:
+
+    python benchmarks/suite.py
+    python benchmarks/suite.py --only qasm2 --quick
+    python benchmarks/suite.py --json main.json
+    python benchmarks/suite.py --compare main.json --threshold 1.5
+"""
+
+import sys
+import json
+import time
+import random
+import argparse
+import tracemalloc
+from typing import Any, Callable
+from dataclasses import dataclass
+
+import cirq
+
+
+@dataclass(frozen=True)
+class Workload:
+    """A benchmarked operation, run on inputs of growing size."""
+
+    name: str
+    description: str
+    sizes: tuple[int, ...]
+    setup: Callable[[int], Any]
+    """Build the input of the given size, outside of the measurement."""
+    run: Callable[[Any], Any]
+    """The measured operation, called on the input built by `setup`."""
+
+
+@dataclass(frozen=True)
+class Measurement:
+    workload: str
+    size: int
+    time: float
+    """The best wall time, in seconds."""
+    peak: int
+    """The peak memory allocated by Python, in bytes."""
+
+
+# --- inputs ---
+
+
+def surface_code_circuit(distance: int, rounds: int) -> cirq.Circuit:
+    """Memory experiment of a rotated surface code, without noise."""
+    data = {
+        (i, j): cirq.GridQubit(2 * i + 1, 2 * j + 1)
+        for i in range(distance)
+        for j in range(distance)
+    }
+
+    x_stabilizers, z_stabilizers = [], []
+    for i in range(-1, distance):
+        for j in range(-1, distance):
+            is_x = (i + j) % 2 == 0
+            on_row_boundary = j in (-1, distance - 1)
+            on_col_boundary = i in (-1, distance - 1)
+            if on_row_boundary and on_col_boundary:
+                continue
+            if (on_row_boundary and not is_x) or (on_col_boundary and is_x):
+                continue
+
+            ancilla = cirq.GridQubit(2 * i + 2, 2 * j + 2)
+            # NOTE: N-shaped order for X and Z-shaped order for Z stabilizers
+            order = (
+                [(0, 0), (1, 0), (0, 1), (1, 1)]
+                if is_x
+                else [(0, 0), (0, 1), (1, 0), (1, 1)]
+            )
+            neighbours = [data.get((i + di, j + dj)) for di, dj in order]
+            (x_stabilizers if is_x else z_stabilizers).append((ancilla, neighbours))
+
+    x_ancillas = [ancilla for ancilla, _ in x_stabilizers]
+    ancillas = x_ancillas + [ancilla for ancilla, _ in z_stabilizers]
+
+    circuit = cirq.Circuit()
+    for _ in range(rounds):
+        circuit.append(cirq.H.on_each(*x_ancillas))
+        for layer in range(4):
+            moment = []
+            for ancilla, neighbours in x_stabilizers:
+                if (qubit := neighbours[layer]) is not None:
+                    moment.append(cirq.CNOT(ancilla, qubit))
+            for ancilla, neighbours in z_stabilizers:
+                if (qubit := neighbours[layer]) is not None:
+                    moment.append(cirq.CNOT(qubit, ancilla))
+            circuit.append(cirq.Moment(moment))
+        circuit.append(cirq.H.on_each(*x_ancillas))
+        circuit.append(cirq.measure(*ancillas))
+        circuit.append(cirq.ResetChannel().on_each(*ancillas))
+    circuit.append(cirq.measure(*data.values()))
+    return circuit
+
+
+def clifford_t_circuit(num_qubits: int, depth: int, seed: int = 0) -> cirq.Circuit:
+    return cirq.testing.random_circuit(
+        cirq.LineQubit.range(num_qubits),
+        n_moments=depth,
+        op_density=0.8,
+        gate_domain={cirq.H: 1, cirq.S: 1, cirq.T: 1, cirq.CNOT: 2, cirq.CZ: 2},
+        random_state=seed,
+    )
+
+
+def native_circuit(num_qubits: int, depth: int, seed: int = 0) -> cirq.Circuit:
+    """Random circuit of the native gates of the noise models, alternating layers
+    of PhasedXZ and CZ gates on half of the qubits, then measuring all of them."""
+    rng = random.Random(seed)
+    qubits = cirq.LineQubit.range(num_qubits)
+    circuit = cirq.Circuit()
+    for layer in range(depth):
+        chosen = rng.sample(qubits, num_qubits // 2)
+        if layer % 2:
+            moment = cirq.Moment(
+                cirq.CZ(a, b) for a, b in zip(chosen[::2], chosen[1::2])
+            )
+        else:
+            moment = cirq.Moment(
+                cirq.PhasedXZGate(
+                    x_exponent=0.5, z_exponent=rng.random(), axis_phase_exponent=0.25
+                ).on(qubit)
+                for qubit in chosen
+            )
+        circuit.append(moment)
+    circuit.append(cirq.measure(*qubits))
+    return circuit
+
+
+def qasm2_program(num_instructions: int, num_qubits: int = 32, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    lines = ["OPENQASM 2.0;", 'include "qelib1.inc";', f"qreg q[{num_qubits}];"]
+    for _ in range(num_instructions):
+        a, b = rng.sample(range(num_qubits), 2)
+        match rng.randrange(3):
+            case 0:
+                lines.append(f"h q[{a}];")
+            case 1:
+                lines.append(f"rz({rng.random():.6f}) q[{a}];")
+            case _:
+                lines.append(f"cx q[{a}], q[{b}];")
+    return "\n".join(lines) + "\n"
+
+
+# --- workloads ---
+
+
+def setup_stim(distance: int):
+    from bloqade.cirq_utils import load_circuit
+
+    return load_circuit(surface_code_circuit(distance, rounds=distance))
+
+
+def run_stim(mt):
+    from bloqade.stim.passes import SquinToStimPass
+
+    SquinToStimPass(mt.dialects)(mt)
+
+
+def setup_stim_circuit(distance: int):
+    from bloqade.cirq_utils import load_circuit
+
+    circuit = surface_code_circuit(distance, rounds=distance)
+    return load_circuit(circuit.with_noise(cirq.depolarize(1e-3)))
+
+
+def run_stim_circuit(mt):
+    from bloqade import stim
+
+    stim.Circuit(mt)
+
+
+def setup_pyqrack(num_qubits: int):
+    from bloqade.pyqrack import StackMemorySimulator
+    from bloqade.cirq_utils import load_circuit
+
+    mt = load_circuit(clifford_t_circuit(num_qubits, depth=20))
+    return StackMemorySimulator(min_qubits=num_qubits).task(mt)
+
+
+def run_pyqrack(task):
+    task.batch_run(shots=100)
+
+
+def setup_pyqrack_fused(num_qubits: int):
+    from bloqade.pyqrack import StackMemorySimulator
+    from bloqade.cirq_utils import load_circuit
+
+    mt = load_circuit(native_circuit(num_qubits, depth=40))
+    return StackMemorySimulator(min_qubits=num_qubits).task(mt)
+
+
+def run_pyqrack_fused(task):
+    task.batch_run(shots=100, tape=True, fuse_gates=True)
+
+
+def setup_squin_inlined(num_qubits: int, depth: int = 10):
+    from bloqade import squin
+    from bloqade.pyqrack import StackMemorySimulator
+
+    @squin.kernel(inline_stdlib=True)
+    def main():
+        q = squin.qalloc(num_qubits)
+        for _ in range(depth):
+            for i in range(num_qubits):
+                squin.h(q[i])
+                squin.rz(0.3, q[i])
+            for i in range(num_qubits - 1):
+                squin.cx(q[i], q[i + 1])
+        return squin.broadcast.measure(q)
+
+    return StackMemorySimulator(min_qubits=num_qubits).task(main)
+
+
+def run_squin_inlined(task):
+    task.batch_run(shots=20)
+
+
+def run_qasm2(program: str):
+    from bloqade import qasm2
+
+    qasm2.emit.QASM2().emit_str(qasm2.loads(program))
+
+
+def setup_parallelize(num_qubits: int):
+    return clifford_t_circuit(num_qubits, depth=num_qubits)
+
+
+def run_parallelize(circuit: cirq.Circuit):
+    from bloqade.cirq_utils import parallelize
+
+    parallelize(circuit)
+
+
+def run_load_circuit(circuit: cirq.Circuit):
+    from bloqade.cirq_utils import load_circuit
+
+    load_circuit(circuit)
+
+
+def run_one_zone_noise(circuit: cirq.Circuit):
+    from bloqade.cirq_utils.noise import GeminiOneZoneNoiseModel, transform_circuit
+
+    transform_circuit(circuit, to_native_gateset=False, model=GeminiOneZoneNoiseModel())
+
+
+def setup_conflict_graph(side: int):
+    # NOTE: a CZ between neighbours on every row of a side x side array
+    return cirq.Moment(
+        cirq.CZ(cirq.GridQubit(row, 2 * col), cirq.GridQubit(row, 2 * col + 1))
+        for row in range(side)
+        for col in range(side // 2)
+    )
+
+
+def run_conflict_graph(moment: cirq.Moment):
+    from bloqade.cirq_utils.noise import OneZoneConflictGraph
+
+    OneZoneConflictGraph(moment).get_move_schedule()
+
+
+def setup_two_zone_noise(num_pairs: int, depth: int = 4, seed: int = 0):
+    rng = random.Random(seed)
+    qubits = cirq.LineQubit.range(2 * num_pairs)
+    circuit = cirq.Circuit()
+    for _ in range(depth):
+        order = rng.sample(qubits, len(qubits))
+        circuit.append(
+            cirq.Moment(cirq.CZ(a, b) for a, b in zip(order[::2], order[1::2]))
+        )
+    return circuit
+
+
+def run_two_zone_noise(circuit: cirq.Circuit):
+    from bloqade.cirq_utils.noise import GeminiTwoZoneNoiseModel
+
+    GeminiTwoZoneNoiseModel().noisy_moments(circuit.moments, circuit.all_qubits())
+
+
+WORKLOADS = (
+    Workload(
+        "stim-surface-code",
+        "SquinToStimPass on a surface code memory experiment, by distance",
+        (3, 5, 7, 9),
+        setup_stim,
+        run_stim,
+    ),
+    Workload(
+        "stim-circuit",
+        "bloqade.stim.Circuit of a noisy surface code memory experiment, by distance",
+        (3, 5, 7, 9),
+        setup_stim_circuit,
+        run_stim_circuit,
+    ),
+    Workload(
+        "pyqrack-clifford-t",
+        "StackMemorySimulator batch_run of 100 shots of Clifford+T, by qubits",
+        (4, 8, 12, 16),
+        setup_pyqrack,
+        run_pyqrack,
+    ),
+    Workload(
+        "pyqrack-fused-tape",
+        "batch_run of 100 shots of PhasedXZ+CZ, taped with fused gates, by qubits",
+        (4, 8, 12, 16),
+        setup_pyqrack_fused,
+        run_pyqrack_fused,
+    ),
+    Workload(
+        "pyqrack-squin-inlined",
+        "batch_run of 20 shots of a squin kernel with inlined stdlib calls, by qubits",
+        (4, 8, 12),
+        setup_squin_inlined,
+        run_squin_inlined,
+    ),
+    Workload(
+        "qasm2-roundtrip",
+        "qasm2.loads then QASM2.emit_str, by instructions",
+        (100, 1_000, 10_000),
+        qasm2_program,
+        run_qasm2,
+    ),
+    Workload(
+        "cirq-parallelize",
+        "cirq_utils.parallelize of a random circuit of depth n, by qubits n",
+        (4, 8, 16),
+        setup_parallelize,
+        run_parallelize,
+    ),
+    Workload(
+        "cirq-load-circuit",
+        "cirq_utils.load_circuit of a surface code memory experiment, by distance",
+        (3, 5, 7, 9),
+        lambda distance: surface_code_circuit(distance, rounds=distance),
+        run_load_circuit,
+    ),
+    Workload(
+        "cirq-one-zone-noise",
+        "transform_circuit with GeminiOneZoneNoiseModel on 20 qubits, by moments",
+        (1_000, 4_000, 16_000),
+        lambda depth: native_circuit(20, depth),
+        run_one_zone_noise,
+    ),
+    Workload(
+        "cirq-conflict-graph",
+        "OneZoneConflictGraph move schedule of a full side x side array, by side",
+        (10, 20, 40, 80),
+        setup_conflict_graph,
+        run_conflict_graph,
+    ),
+    Workload(
+        "cirq-two-zone-noise",
+        "GeminiTwoZoneNoiseModel on layers of CZ between random pairs, by pairs",
+        (10, 50, 100, 500),
+        setup_two_zone_noise,
+        run_two_zone_noise,
+    ),
+)
+
+
+# --- runner ---
+
+
+def measure(workload: Workload, size: int, repeat: int) -> Measurement:
+    best = float("inf")
+    for _ in range(repeat):
+        data = workload.setup(size)
+        start = time.perf_counter()
+        workload.run(data)
+        best = min(best, time.perf_counter() - start)
+
+    data = workload.setup(size)
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        workload.run(data)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(workload.name, size, best, peak)
+
+
+def load_baseline(path: str) -> dict[tuple[str, int], Measurement]:
+    with open(path) as file:
+        entries = json.load(file)
+    return {
+        (entry["workload"], entry["size"]): Measurement(**entry) for entry in entries
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--only", nargs="+", default=[], help="run the workloads matching a prefix"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="only run the two smallest sizes"
+    )
+    parser.add_argument(
+        "--list", action="store_true", help="list the workloads and exit"
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", help="save the measurements to this file")
+    parser.add_argument("--compare", help="compare to measurements saved with --json")
+    parser.add_argument("--threshold", type=float, default=1.5)
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.compare) if args.compare else {}
+    workloads = [
+        workload
+        for workload in WORKLOADS
+        if not args.only or any(workload.name.startswith(p) for p in args.only)
+    ]
+
+    if args.list:
+        for workload in workloads:
+            print(f"{workload.name:<20} {workload.description}")
+        return
+
+    header = f"{'workload':<20} {'size':>7} {'time [s]':>10} {'peak [MiB]':>11}"
+    if baseline:
+        header += f" {'time ratio':>10} {'peak ratio':>10}"
+    print(header)
+
+    measurements: list[Measurement] = []
+    regressions: list[Measurement] = []
+    for workload in workloads:
+        for size in workload.sizes[:2] if args.quick else workload.sizes:
+            result = measure(workload, size, args.repeat)
+            measurements.append(result)
+
+            line = (
+                f"{result.workload:<20} {result.size:>7} {result.time:>10.4f} "
+                f"{result.peak / 2**20:>11.2f}"
+            )
+            if (before := baseline.get((result.workload, result.size))) is not None:
+                time_ratio = result.time / before.time
+                peak_ratio = result.peak / max(before.peak, 1)
+                line += f" {time_ratio:>10.2f} {peak_ratio:>10.2f}"
+                if max(time_ratio, peak_ratio) > args.threshold:
+                    regressions.append(result)
+                    line += "  REGRESSION"
+            print(line, flush=True)
+
+    if args.json:
+        with open(args.json, "w") as file:
+            json.dump([vars(result) for result in measurements], file, indent=2)
+
+    if regressions:
+        print(f"{len(regressions)} measurement(s) over {args.threshold}x the baseline")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Report the cost of the two-zone noise model on wide CZ layers.
+
+Builds circuits of a few layers of CZ gates between random pairs of qubits, so
+that consecutive layers regroup the qubits in the gate zone, and reports the
+time of `GeminiTwoZoneNoiseModel.noisy_moments` and of the swap search it
+runs between two layers, along with the number of swaps found.
+
+Run with:
+
+    python benchmarks/two_zone_swaps.py --pairs 10 50 100 500
+"""
+
+import time
+import random
+import argparse
+
+import cirq
+
+from bloqade.cirq_utils.noise import GeminiTwoZoneNoiseModel, _two_zone_utils
+
+
+def cz_layers(num_pairs: int, depth: int, seed: int = 0) -> list[cirq.Moment]:
+    rng = random.Random(seed)
+    qubits = cirq.LineQubit.range(2 * num_pairs)
+    moments = []
+    for _ in range(depth):
+        order = rng.sample(qubits, len(qubits))
+        moments.append(
+            cirq.Moment(cirq.CZ(a, b) for a, b in zip(order[::2], order[1::2]))
+        )
+    return moments
+
+
+def swaps_between(prev: cirq.Moment, curr: cirq.Moment, nqubs: int):
+    prev_qidxs = _two_zone_utils.qargs_to_qidxs(
+        _two_zone_utils.get_qargs_from_moment(prev)
+    )
+    curr_qidxs = _two_zone_utils.qargs_to_qidxs(
+        _two_zone_utils.get_qargs_from_moment(curr)
+    )
+    source = _two_zone_utils.intersect_by_structure(prev_qidxs, curr_qidxs)
+    target = _two_zone_utils.intersect_by_structure(curr_qidxs, prev_qidxs)
+    return _two_zone_utils.get_equivalent_swaps(
+        _two_zone_utils.pad_with_empty_tups(source, nqubs),
+        _two_zone_utils.pad_with_empty_tups(target, nqubs),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pairs", type=int, nargs="+", default=[10, 50, 100, 500])
+    parser.add_argument("--depth", type=int, default=4)
+    args = parser.parse_args()
+
+    model = GeminiTwoZoneNoiseModel()
+    print(f"{'pairs':>6} {'swaps':>6} {'search [s]':>10} {'noisy_moments [s]':>17}")
+    for num_pairs in args.pairs:
+        moments = cz_layers(num_pairs, args.depth)
+        nqubs = 2 * num_pairs
+
+        start = time.perf_counter()
+        swaps = swaps_between(moments[0], moments[1], nqubs)
+        search = time.perf_counter() - start
+
+        start = time.perf_counter()
+        model.noisy_moments(moments, cirq.LineQubit.range(nqubs))
+        noisy = time.perf_counter() - start
+
+        print(f"{num_pairs:>6} {len(swaps):>6} {search:>10.4f} {noisy:>17.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -120,13 +120,37 @@ class AddressQubit(QubitLike):
         return False
 
 
+def _compact(data: Sequence[int]) -> Sequence[int]:
+    if isinstance(data, range):
+        return data
+
+    data = tuple(data)
+    if len(data) == 0:
+        return range(0)
+    if len(data) == 1:
+        return range(data[0], data[0] + 1)
+
+    step = data[1] - data[0]
+    if step == 0 or any(b - a != step for a, b in zip(data[1:], data[2:])):
+        return data
+    return range(data[0], data[-1] + step, step)
+
+
 @final
 @dataclass
 class AddressReg(RegisterLike):
-    """A lattice element representing a container of qubits with known indices."""
+    """A lattice element representing a container of qubits with known indices.
+
+    Indices forming an arithmetic progression, e.g. a whole register or a slice
+    of it, are stored as a `range`, so that large registers take constant memory
+    and compare in constant time. Other indices are stored as a tuple.
+    """
 
     data: Sequence[int]
 
+    def __post_init__(self):
+        self.data = _compact(self.data)
+
     def is_subseteq(self, other: Address) -> bool:
         return isinstance(other, AddressReg) and self.data == other.data
 
@@ -0,0 +1,111 @@
+import hashlib
+from typing import Iterator
+
+from kirin import ir
+
+
+def method_fingerprint(mt: ir.Method) -> tuple[ir.Statement | int, ...]:
+    """Compute a fingerprint of the current version of a method's IR.
+
+    The fingerprint changes whenever a statement is inserted, removed or replaced, or
+    has its arguments replaced, either in the method itself or in any method it
+    (transitively) references. It is based on object identity, so it is only meaningful
+    within the current process and is meant to invalidate cached analysis results
+    after a method has been rewritten in place. The fingerprint holds references to
+    the statements of the method, so that their identities cannot be reused by a
+    later version of the IR while it is alive.
+
+    Args:
+        mt (ir.Method): The method to fingerprint.
+
+    Returns:
+        tuple[ir.Statement | int, ...]: The fingerprint of the method, to be compared
+            with `==` against a previously computed fingerprint.
+
+    """
+    items: list[ir.Statement | int] = []
+    visited: set[int] = set()
+    worklist = [mt]
+    while worklist:
+        method = worklist.pop()
+        if id(method) in visited:
+            continue
+
+        visited.add(id(method))
+        items.append(method.code)
+        for stmt in method.callable_region.walk():
+            items.append(stmt)
+            items.extend(map(id, stmt.args))
+            worklist.extend(_referenced_methods(stmt))
+
+    return tuple(items)
+
+
+def structural_hash(mt: ir.Method) -> str:
+    """Compute a hash of the structure of a method's IR.
+
+    Unlike `method_fingerprint`, the hash only depends on the structure of the IR:
+    the statement types and their attributes, how SSA values and blocks are wired
+    together, and the dialects of the method. It also covers all methods the
+    method (transitively) references, either by invoking them or as constants,
+    e.g. the function applied by `ilist.for_each` or `ilist.map`. Two methods
+    with the same hash are compiled to the same program, so the hash is stable
+    across processes and can be used as the key of a persistent cache.
+
+    Args:
+        mt (ir.Method): The method to hash.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest of the method's structure.
+
+    """
+    digest = hashlib.sha256()
+    methods: dict[int, int] = {}
+    worklist = [mt]
+    while worklist:
+        method = worklist.pop(0)
+        if id(method) in methods:
+            continue
+
+        methods[id(method)] = len(methods)
+        names: dict[int, int] = {}
+
+        def name(node) -> int:
+            return names.setdefault(id(node), len(names))
+
+        digest.update(
+            repr(
+                (method.sym_name, sorted(d.name for d in method.dialects.data))
+            ).encode()
+        )
+        for stmt in method.callable_region.walk():
+            callees = []
+            for callee in _referenced_methods(stmt):
+                worklist.append(callee)
+                callees.append(callee.sym_name)
+
+            item = (
+                type(stmt).__module__,
+                type(stmt).__qualname__,
+                tuple(name(arg) for arg in stmt.args),
+                tuple(name(result) for result in stmt.results),
+                tuple(name(block) for block in stmt.successors),
+                tuple(
+                    (name(block), tuple(name(arg) for arg in block.args))
+                    for region in stmt.regions
+                    for block in region.blocks
+                ),
+                sorted((key, repr(attr)) for key, attr in stmt.attributes.items()),
+                callees,
+            )
+            digest.update(repr(item).encode())
+
+    return digest.hexdigest()
+
+
+def _referenced_methods(stmt: ir.Statement) -> Iterator[ir.Method]:
+    """The methods held by the attributes of a statement, e.g. the callee of a
+    `func.Invoke` or the value of a constant passed to `ilist.map`."""
+    for attr in stmt.attributes.values():
+        if isinstance(attr, ir.PyAttr) and isinstance(attr.data, ir.Method):
+            yield attr.data
@@ -0,0 +1,133 @@
+"""Cache of analysis results shared between the passes of a pipeline.
+
+Several passes of a pipeline (e.g. `GlobalToParallel` and `ParallelToUOp` when
+emitting QASM2) run the same analysis on the same method. Passing them a common
+`AnalysisManager` runs the analysis once: its results are cached per method and
+analysis class, and are invalidated when a pass reports that it rewrote the
+method (see `AnalysisManager.update`). As a safety net for rewrites that do not
+report to the manager, cached results are also discarded when the statements of
+the method change (see `bloqade.analysis.fingerprint.method_fingerprint`).
+"""
+
+import time
+from typing import Any, NamedTuple
+from collections import OrderedDict
+from dataclasses import field, dataclass
+
+from kirin import ir
+from kirin.analysis import Forward
+from kirin.rewrite.abc import RewriteResult
+from kirin.analysis.forward import ForwardFrame
+
+from bloqade.analysis.fingerprint import method_fingerprint
+
+
+class AnalysisResult(NamedTuple):
+    """The result of running an analysis on a method."""
+
+    analysis: Forward
+    """The analysis that was run, e.g. to query `AddressAnalysis.qubit_count`."""
+    frame: ForwardFrame
+    """The frame of the analysis, mapping SSA values to lattice elements."""
+    ret: Any
+    """The lattice element of the return value of the method."""
+
+
+class _Entry(NamedTuple):
+    fingerprint: tuple
+    result: AnalysisResult
+    elapsed: float
+
+
+@dataclass
+class AnalysisManager:
+    """LRU cache of the analysis results of methods."""
+
+    maxsize: int = 128
+    """The maximum number of analysis results kept."""
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    time_saved: float = field(init=False, default=0.0)
+    """The total time, in seconds, the reused analysis results took to compute."""
+    _entries: OrderedDict[tuple, _Entry] = field(
+        init=False, repr=False, default_factory=OrderedDict
+    )
+
+    def __post_init__(self):
+        if self.maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+
+    def run(
+        self,
+        analysis_type: type[Forward],
+        mt: ir.Method,
+        dialects: ir.DialectGroup | None = None,
+    ) -> AnalysisResult:
+        """Run an analysis on a method, or reuse its cached result.
+
+        Args:
+            analysis_type (type[Forward]): The analysis class to run.
+            mt (ir.Method): The method to analyze.
+            dialects (ir.DialectGroup | None): The dialects to run the analysis
+                with. Defaults to None, i.e. the dialects of the method.
+
+        Returns:
+            AnalysisResult: The analysis, its frame and the lattice element of the
+                return value of the method.
+
+        """
+        dialects = mt.dialects if dialects is None else dialects
+        key = (mt, analysis_type, dialects.data)
+        fingerprint = method_fingerprint(mt)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry.fingerprint == fingerprint:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.time_saved += entry.elapsed
+            return entry.result
+
+        self.misses += 1
+        start = time.perf_counter()
+        analysis = analysis_type(dialects)
+        frame, ret = analysis.run(mt)
+        result = AnalysisResult(analysis, frame, ret)
+        elapsed = time.perf_counter() - start
+
+        if self.maxsize > 0:
+            self._entries[key] = _Entry(fingerprint, result, elapsed)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+        return result
+
+    def update(self, mt: ir.Method, result: RewriteResult) -> RewriteResult:
+        """Invalidate the analysis results of a method if a rewrite changed it.
+
+        Args:
+            mt (ir.Method): The rewritten method.
+            result (RewriteResult): The result of the rewrite.
+
+        Returns:
+            RewriteResult: The result of the rewrite, unchanged.
+
+        """
+        if result.has_done_something:
+            self.invalidate(mt)
+        return result
+
+    def invalidate(self, mt: ir.Method | None = None) -> None:
+        """Discard cached analysis results.
+
+        Args:
+            mt (ir.Method | None): The method whose results are discarded.
+                Defaults to None, i.e. the results of all methods.
+
+        """
+        if mt is None:
+            self._entries.clear()
+            return
+
+        for key in [key for key in self._entries if key[0] is mt]:
+            del self._entries[key]
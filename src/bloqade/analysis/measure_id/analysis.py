@@ -1,18 +1,48 @@
 from dataclasses import field, dataclass
 
+import numpy as np
 from kirin import ir
 from kirin.interp import StatementResult
 from kirin.analysis import ForwardExtra
 from typing_extensions import Self
 from kirin.analysis.forward import ForwardFrame
 
-from .lattice import MeasureId, NotMeasureId
+from .lattice import MeasureId, NotMeasureId, MeasureIdTuple
 
 
 @dataclass
 class MeasureIDFrame(ForwardFrame[MeasureId]):
     num_measures_at_stmt: dict[ir.Statement, int] = field(default_factory=dict)
 
+    def record_offsets(
+        self, measurements: ir.SSAValue, stmt: ir.Statement
+    ) -> np.ndarray | None:
+        """Get the measurement record offsets of a list of measurements, as seen
+        from a statement.
+
+        The offsets are the negative `rec[-k]` targets of STIM, computed for the
+        whole list at once.
+
+        Args:
+            measurements (ir.SSAValue): The list of measurements.
+            stmt (ir.Statement): The statement referring to the measurements,
+                e.g. a detector.
+
+        Returns:
+            np.ndarray | None: The offsets, or None if the measurements or the
+                number of measurements done before `stmt` are not known.
+
+        """
+        measure_ids = self.entries.get(measurements)
+        num_measures = self.num_measures_at_stmt.get(stmt)
+        if not isinstance(measure_ids, MeasureIdTuple) or num_measures is None:
+            return None
+
+        indices = measure_ids.indices()
+        if indices is None:
+            return None
+        return indices - (num_measures + 1)
+
 
 class MeasurementIDAnalysis(ForwardExtra[MeasureIDFrame, MeasureId]):
 
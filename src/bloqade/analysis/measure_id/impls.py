@@ -19,6 +19,7 @@ from .lattice import (
     ObservableId,
     RawMeasureId,
     MeasureIdBool,
+    MeasureIdRange,
     MeasureIdTuple,
     ConstantCarrier,
     InvalidMeasureId,
@@ -47,12 +48,11 @@ class SquinQubit(interp.MethodTable):
         if not isinstance(num_qubits, kirin_types.Literal):
             return (AnyMeasureId(),)
 
-        measure_id_bools = []
-        for _ in range(num_qubits.data):
-            interp.measure_count += 1
-            measure_id_bools.append(RawMeasureId(interp.measure_count))
+        start = interp.measure_count + 1
+        interp.measure_count += num_qubits.data
+        measure_ids = MeasureIdRange(range(start, interp.measure_count + 1))
 
-        return (MeasureIdTuple(data=tuple(measure_id_bools), obj_type=ilist.IList),)
+        return (MeasureIdTuple(data=measure_ids, obj_type=ilist.IList),)
 
     @interp.impl(qubit.stmts.IsLost)
     @interp.impl(qubit.stmts.IsOne)
@@ -68,7 +68,11 @@ class SquinQubit(interp.MethodTable):
         if not isinstance(original_measure_id_tuple, MeasureIdTuple):
             return (InvalidMeasureId(),)
 
-        if not all(
+        original_data = original_measure_id_tuple.data
+        if (
+            not isinstance(original_data, MeasureIdRange)
+            or original_data.predicate is not None
+        ) and not all(
             isinstance(measure_id, RawMeasureId)
             for measure_id in original_measure_id_tuple.data
         ):
@@ -83,6 +87,14 @@ class SquinQubit(interp.MethodTable):
         else:
             return (InvalidMeasureId(),)
 
+        if isinstance(original_data, MeasureIdRange):
+            return (
+                MeasureIdTuple(
+                    data=MeasureIdRange(original_data.ids, predicate),
+                    obj_type=ilist.IList,
+                ),
+            )
+
         predicate_measure_ids = [
             MeasureIdBool(measure_id.idx, predicate)
             for measure_id in original_measure_id_tuple.data
@@ -164,6 +176,15 @@ class PyIndexing(interp.MethodTable):
         slice_ = interp.maybe_const(stmt.index, slice)
         idx_or_slice = idx if idx is not None else slice_
 
+        # e.g. an index computed from the loop variable of a preserved scf.For
+        index = frame.get(stmt.index)
+        if (
+            idx_or_slice is None
+            and isinstance(index, ConstantCarrier)
+            and isinstance(index.data, (int, slice))
+        ):
+            idx_or_slice = index.data
+
         if idx_or_slice is None:
             return (InvalidMeasureId(),)
 
@@ -210,11 +231,51 @@ class PyAssign(interp.MethodTable):
 
 @py.binop.dialect.register(key="measure_id")
 class PyBinOp(interp.MethodTable):
+    @interp.impl(py.Sub)
+    @interp.impl(py.Mult)
+    @interp.impl(py.FloorDiv)
+    @interp.impl(py.Mod)
+    def arith(
+        self,
+        interp: MeasurementIDAnalysis,
+        frame: MeasureIDFrame,
+        stmt: py.Sub | py.Mult | py.FloorDiv | py.Mod,
+    ):
+        lhs = frame.get(stmt.lhs)
+        rhs = frame.get(stmt.rhs)
+        if not (
+            isinstance(lhs, ConstantCarrier)
+            and isinstance(rhs, ConstantCarrier)
+            and isinstance(lhs.data, int)
+            and isinstance(rhs.data, int)
+        ):
+            return (NotMeasureId(),)
+
+        match stmt:
+            case py.Sub():
+                return (ConstantCarrier(data=lhs.data - rhs.data),)
+            case py.Mult():
+                return (ConstantCarrier(data=lhs.data * rhs.data),)
+            case _ if rhs.data == 0:
+                return (NotMeasureId(),)
+            case py.FloorDiv():
+                return (ConstantCarrier(data=lhs.data // rhs.data),)
+            case _:
+                return (ConstantCarrier(data=lhs.data % rhs.data),)
+
     @interp.impl(py.Add)
     def add(self, interp: MeasurementIDAnalysis, frame: MeasureIDFrame, stmt: py.Add):
         lhs = frame.get(stmt.lhs)
         rhs = frame.get(stmt.rhs)
 
+        if (
+            isinstance(lhs, ConstantCarrier)
+            and isinstance(rhs, ConstantCarrier)
+            and isinstance(lhs.data, int)
+            and isinstance(rhs.data, int)
+        ):
+            return (ConstantCarrier(data=lhs.data + rhs.data),)
+
         # Unwrap constant carriers holding empty ILists into empty MeasureIdTuples
         if (
             isinstance(lhs, ConstantCarrier)
@@ -315,7 +376,7 @@ class Scf(scf.absint.Methods):
         for value in iterable:
             with interp_.new_frame(stmt, has_parent_access=True) as body_frame:
                 loop_vars = interp_.frame_call_region(
-                    body_frame, stmt, stmt.body, NotMeasureId(), *loop_vars
+                    body_frame, stmt, stmt.body, ConstantCarrier(value), *loop_vars
                 )
 
             for ssa, val in body_frame.entries.items():
@@ -1,7 +1,8 @@
 from enum import Enum
-from typing import Any, Type, final
+from typing import Any, Type, Sequence, final, overload
 from dataclasses import dataclass
 
+import numpy as np
 from kirin.lattice import (
     SingletonMeta,
     BoundedLattice,
@@ -144,18 +145,130 @@ class ObservableId(MeasureId):
         )
 
 
+class MeasureIdRange(Sequence[MeasureId]):
+    """Compact sequence of the IDs of consecutive measurements.
+
+    Stores the indices of the measurements as a `range` instead of one lattice
+    element per measurement. Elements are created on access, as `RawMeasureId`,
+    or as `MeasureIdBool` if a predicate is set, so the sequence can be used in
+    place of a tuple of them. In particular, it compares equal to such a tuple.
+    """
+
+    __slots__ = ("ids", "predicate")
+
+    def __init__(self, ids: range, predicate: Predicate | None = None):
+        self.ids = ids
+        self.predicate = predicate
+
+    def _element(self, idx: int) -> "RawMeasureId | MeasureIdBool":
+        if self.predicate is None:
+            return RawMeasureId(idx)
+        return MeasureIdBool(idx, self.predicate)
+
+    def differs_everywhere(self, other: "MeasureIdRange") -> bool:
+        """Check if the elements of two sequences of the same length all differ.
+
+        Args:
+            other (MeasureIdRange): The sequence to compare with.
+
+        Returns:
+            bool: True if no element of `self` is equal to the element of `other`
+                at the same position.
+
+        """
+        if self.predicate is not other.predicate:
+            return True
+        # with the same stride, the indices differ by the same offset everywhere
+        return self.ids.step == other.ids.step and self.ids.start != other.ids.start
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @overload
+    def __getitem__(self, index: int) -> MeasureId: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "MeasureIdRange": ...
+
+    def __getitem__(self, index: int | slice):
+        if isinstance(index, slice):
+            return MeasureIdRange(self.ids[index], self.predicate)
+        return self._element(self.ids[index])
+
+    def __iter__(self):
+        return map(self._element, self.ids)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MeasureIdRange):
+            if len(self.ids) == 0 or len(other.ids) == 0:
+                return len(self.ids) == len(other.ids)
+            return self.predicate is other.predicate and self.ids == other.ids
+        if isinstance(other, tuple):
+            return len(self) == len(other) and tuple(self) == other
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __add__(self, other: Sequence[MeasureId]) -> Sequence[MeasureId]:
+        if (
+            isinstance(other, MeasureIdRange)
+            and other.predicate is self.predicate
+            and self.ids.step == other.ids.step == 1
+            and self.ids.stop == other.ids.start
+        ):
+            return MeasureIdRange(range(self.ids.start, other.ids.stop), self.predicate)
+        return tuple(self) + tuple(other)
+
+    def __radd__(self, other: Sequence[MeasureId]) -> Sequence[MeasureId]:
+        return tuple(other) + tuple(self)
+
+    def __repr__(self) -> str:
+        return f"MeasureIdRange({self.ids!r}, {self.predicate!r})"
+
+
 @final
 @dataclass
 class MeasureIdTuple(MeasureId):
-    data: tuple[MeasureId, ...]
+    data: Sequence[MeasureId]
+    """The elements of the tuple, either a tuple or a compact `MeasureIdRange`."""
     obj_type: Type[tuple] | Type[IList]
 
+    def indices(self) -> np.ndarray | None:
+        """Get the global indices of the measurements of the tuple as an array.
+
+        Returns:
+            np.ndarray | None: The 1-based indices of the measurements, in the
+                order of the tuple, or None if an element is not the ID of a
+                known measurement (`RawMeasureId` or `MeasureIdBool`).
+
+        """
+        if isinstance(self.data, MeasureIdRange):
+            ids = self.data.ids
+            return np.arange(ids.start, ids.stop, ids.step, dtype=np.int64)
+
+        if not all(
+            isinstance(elem, (RawMeasureId, MeasureIdBool)) for elem in self.data
+        ):
+            return None
+        return np.fromiter(
+            (elem.idx for elem in self.data),  # type: ignore[attr-defined]
+            dtype=np.int64,
+            count=len(self.data),
+        )
+
     def is_subseteq(self, other: MeasureId) -> bool:
         if not (
             isinstance(other, MeasureIdTuple) and len(other.data) == len(self.data)
         ):
             return False
 
+        if isinstance(self.data, MeasureIdRange) and isinstance(
+            other.data, MeasureIdRange
+        ):
+            # elements are concrete, so they are subseteq only if they are equal
+            return self.data == other.data
+
         return all(
             self_elem.is_subseteq(other_elem)
             for self_elem, other_elem in zip(self.data, other.data)
@@ -169,6 +282,16 @@ class MeasureIdTuple(MeasureId):
         ):
             return super().join(other)
 
+        if isinstance(self.data, MeasureIdRange) and isinstance(
+            other.data, MeasureIdRange
+        ):
+            if self.data == other.data:
+                return self
+            if self.data.differs_everywhere(other.data):
+                return MeasureIdTuple(
+                    data=(AnyMeasureId(),) * len(self.data), obj_type=self.obj_type
+                )
+
         return MeasureIdTuple(
             data=tuple(
                 self_elem.join(other_elem)
@@ -185,6 +308,17 @@ class MeasureIdTuple(MeasureId):
         ):
             return super().meet(other)
 
+        if isinstance(self.data, MeasureIdRange) and isinstance(
+            other.data, MeasureIdRange
+        ):
+            if self.data == other.data:
+                return self
+            if self.data.differs_everywhere(other.data):
+                return MeasureIdTuple(
+                    data=(InvalidMeasureId(),) * len(self.data),
+                    obj_type=self.obj_type,
+                )
+
         return MeasureIdTuple(
             data=tuple(
                 self_elem.meet(other_elem)
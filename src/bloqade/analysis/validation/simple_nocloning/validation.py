@@ -1,3 +1,4 @@
+from typing import Any
 from dataclasses import field, dataclass
 
 from kirin import ir
@@ -55,6 +56,7 @@ class FlatKernelNoCloningValidation(ValidationPass):
     """This Validation pass check for no-cloning violations in a fully flattened kernel."""
 
     _analysis: _FlatKernelNoCloningAnalysis = field(init=False)
+    _address_frame: ForwardFrame[Address] | None = field(init=False, default=None)
 
     def name(self) -> str:
         """The name of the validation"""
@@ -64,6 +66,10 @@ class FlatKernelNoCloningValidation(ValidationPass):
         """The analysis passes required by the validation"""
         return [AddressAnalysis]
 
+    def set_analysis_cache(self, cache: dict[type, Any]) -> None:
+        """Reuse the address analysis run by the validation suite"""
+        self._address_frame = cache.get(AddressAnalysis)
+
     def run(
         self, method: ir.Method
     ) -> tuple[ForwardFrame[EmptyLattice], list[ir.ValidationError]]:
@@ -77,6 +83,7 @@ class FlatKernelNoCloningValidation(ValidationPass):
                 A tuple containing analysis frame and the validation errors
         """
         analysis = _FlatKernelNoCloningAnalysis(method.dialects)
+        analysis._address_frame = self._address_frame
         frame, _ = analysis.run(method)
 
         self._analysis = analysis
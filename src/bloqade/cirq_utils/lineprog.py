@@ -1,7 +1,6 @@
 # ruff: noqa: D101,D102,D105
 import dataclasses
 from typing import Union
-from collections import Counter
 
 import numpy as np
 import scipy.sparse
@@ -11,14 +10,9 @@ class Variable:
     def __add__(
         self, other: Union["Variable", "Expression", float, int]
     ) -> "Expression":
-        if isinstance(other, Variable):
-            return Expression({self: 1}) + Expression({other: 1})
-        elif isinstance(other, Expression):
-            return Expression({self: 1}) + other
-        elif isinstance(other, (float, int)):
-            return Expression({self: 1}) + Expression({None: other})
-        else:
+        if not isinstance(other, (Variable, Expression, float, int)):
             raise TypeError(f"Cannot add {type(other)} to Variable")
+        return Expression({self: 1})._combine(other, 1)
 
     def __radd__(self, left: float | int) -> "Expression":
         return self.__add__(left)
@@ -26,14 +20,9 @@ class Variable:
     def __sub__(
         self, other: Union["Variable", "Expression", float, int]
     ) -> "Expression":
-        if isinstance(other, Variable):
-            return Expression({self: 1}) - Expression({other: 1})
-        elif isinstance(other, Expression):
-            return Expression({self: 1}) - other
-        elif isinstance(other, (float, int)):
-            return Expression({self: 1}) - Expression({None: other})
-        else:
+        if not isinstance(other, (Variable, Expression, float, int)):
             raise TypeError(f"Cannot subtract {type(other)} from Variable")
+        return Expression({self: 1})._combine(other, -1)
 
     def __rsub__(self, left: float | int) -> "Expression":
         return self.__sub__(left)
@@ -68,22 +57,26 @@ class Expression:
     def __getitem__(self, key: Variable | None) -> float:
         return self.get(key)
 
-    def __add__(
-        self, other: Union["Expression", "Variable", float, int]
+    def _combine(
+        self, other: Union["Expression", "Variable", float, int], sign: int
     ) -> "Expression":
+        # NOTE: copy once and only visit the terms of `other`
+        coeff = dict(self.coeffs)
         if isinstance(other, Variable):
-            coeff = {key: val for key, val in self.coeffs.items()}
-            coeff[other] = coeff.get(other, 0) + 1
-            return Expression(coeffs=coeff)
+            coeff[other] = coeff.get(other, 0) + sign
         elif isinstance(other, Expression):
-            coeff = {}
-            for key in set(self.coeffs.keys()).union(other.coeffs.keys()):
-                coeff[key] = self.coeffs.get(key, 0) + other.coeffs.get(key, 0)
-            return Expression(coeffs=coeff)
+            for key, val in other.coeffs.items():
+                coeff[key] = coeff.get(key, 0) + sign * val
         elif isinstance(other, (float, int)):
-            coeff = {key: val for key, val in self.coeffs.items()}
-            coeff[None] = coeff.get(None, 0) + other
-            return Expression(coeffs=coeff)
+            coeff[None] = coeff.get(None, 0) + sign * other
+        else:
+            return NotImplemented
+        return Expression(coeffs=coeff)
+
+    def __add__(
+        self, other: Union["Expression", "Variable", float, int]
+    ) -> "Expression":
+        return self._combine(other, 1)
 
     def __radd__(self, left: float | int) -> "Expression":
         return self.__add__(left)
@@ -91,19 +84,7 @@ class Expression:
     def __sub__(
         self, other: Union["Expression", "Variable", float, int]
     ) -> "Expression":
-        if isinstance(other, Variable):
-            coeff = {key: val for key, val in self.coeffs.items()}
-            coeff[other] = coeff.get(other, 0) - 1
-            return Expression(coeffs=coeff)
-        elif isinstance(other, Expression):
-            coeff = {}
-            for key in set(self.coeffs.keys()).union(other.coeffs.keys()):
-                coeff[key] = self.coeffs.get(key, 0) - other.coeffs.get(key, 0)
-            return Expression(coeffs=coeff)
-        elif isinstance(other, (float, int)):
-            coeff = {key: val for key, val in self.coeffs.items()}
-            coeff[None] = coeff.get(None, 0) - other
-            return Expression(coeffs=coeff)
+        return self._combine(other, -1)
 
     def __rsub__(self, left: float | int) -> "Expression":
         return self.__sub__(left)
@@ -145,6 +126,10 @@ class LPProblem:
         default_factory=lambda: Expression({})
     )
     quadratic_objective: list[Expression] = dataclasses.field(default_factory=list)
+    _linear_terms: dict[Variable | None, float] = dataclasses.field(
+        default_factory=dict, init=False, repr=False
+    )
+    """The terms added by `add_linear`, on top of `linear_objective`."""
 
     def add_gez(self, expr: Expression):
         if isinstance(expr, (Expression, Variable)):
@@ -166,7 +151,12 @@ class LPProblem:
 
     def add_linear(self, expr: Expression):
         if isinstance(expr, (Expression, Variable)):
-            self.linear_objective += expr
+            # NOTE: accumulate in place, the objective may have many terms
+            coeffs = self._linear_terms
+            if isinstance(expr, Variable):
+                expr = Expression({expr: 1})
+            for key, val in expr.coeffs.items():
+                coeffs[key] = coeffs.get(key, 0) + val
         else:
             print("LP Program Warning: no variables in linear objective term")
 
@@ -196,17 +186,17 @@ class LPProblem:
 
     @property
     def basis(self) -> list[Variable]:
-        all_vars = Counter()
+        all_vars: dict[Variable | None, None] = {}
         for expr in self.constraints_eqz:
-            all_vars.update(expr.coeffs.keys())
+            all_vars.update(dict.fromkeys(expr.coeffs))
         for expr in self.constraints_gez:
-            all_vars.update(expr.coeffs.keys())
+            all_vars.update(dict.fromkeys(expr.coeffs))
         for expr in self.quadratic_objective:
-            all_vars.update(expr.coeffs.keys())
-        all_vars.update(self.linear_objective.coeffs.keys())
+            all_vars.update(dict.fromkeys(expr.coeffs))
+        all_vars.update(dict.fromkeys(self.linear_objective.coeffs))
+        all_vars.update(dict.fromkeys(self._linear_terms))
         all_vars.pop(None, None)  # The constant term is not a variable
-        all_vars = list(all_vars.keys())
-        return all_vars
+        return list(all_vars)  # type: ignore
 
     def __add__(self, other: "LPProblem") -> "LPProblem":
         if not isinstance(other, LPProblem):
@@ -214,82 +204,115 @@ class LPProblem:
         return LPProblem(
             constraints_eqz=self.constraints_eqz + other.constraints_eqz,
             constraints_gez=self.constraints_gez + other.constraints_gez,
-            linear_objective=self.linear_objective + other.linear_objective,
+            linear_objective=self._full_linear_objective()
+            + other._full_linear_objective(),
             quadratic_objective=self.quadratic_objective + other.quadratic_objective,
         )
 
-    def solve(self) -> Solution:
+    def _full_linear_objective(self) -> Expression:
+        return self.linear_objective + Expression(dict(self._linear_terms))
+
+    @staticmethod
+    def _assemble_constraints(
+        constraints: list[Expression], index: dict[Variable, int]
+    ) -> tuple[scipy.sparse.csc_matrix, np.ndarray]:
+        # NOTE: build the COO arrays in bulk, one entry per (constraint, variable)
+        nnz = sum(len(expr.coeffs) for expr in constraints)
+        data = np.empty(nnz, dtype=float)
+        rows = np.empty(nnz, dtype=np.int64)
+        cols = np.empty(nnz, dtype=np.int64)
+        offsets = np.empty(len(constraints), dtype=float)
+
+        n = 0
+        for k, expr in enumerate(constraints):
+            offsets[k] = expr.coeffs.get(None, 0)
+            for key, val in expr.coeffs.items():
+                if key is not None:
+                    data[n] = val
+                    rows[n] = k
+                    cols[n] = index[key]
+                    n += 1
 
-        basis = self.basis
-        if len(basis) == 0:
-            return Solution()
+        matrix = scipy.sparse.coo_matrix(
+            (data[:n], (rows[:n], cols[:n])), shape=(len(constraints), len(index))
+        ).tocsc()
+        return matrix, offsets
+
+    def _assemble(self, basis: list[Variable] | None = None) -> tuple[
+        list[Variable],
+        scipy.sparse.csc_matrix,
+        np.ndarray,
+        scipy.sparse.csc_matrix,
+        np.ndarray,
+        scipy.sparse.csc_matrix,
+        np.ndarray,
+    ]:
+        """Assemble the sparse matrices of the problem.
+
+        Args:
+            basis (list[Variable] | None): The basis of the problem, computed if not
+                given.
+
+        Returns:
+            tuple: The basis, the inequality constraints `A_gez @ x + B_gez >= 0`,
+                the equality constraints `A_eqz @ x + B_eqz == 0`, and the quadratic
+                and linear objective `Q` and `C`, in this order.
 
-        # Generate the sparse matrix for each value...
-        # Inequality constraints
-        A_gez_dat = []
-        A_gez_i = []
-        A_gez_j = []
-        B_gez_dat = []
-        for k in range(len(self.constraints_gez)):
-            for key, val in self.constraints_gez[k].coeffs.items():
-                if key is not None:
-                    A_gez_dat.append(val)
-                    A_gez_i.append(k)
-                    A_gez_j.append(basis.index(key))
-            B_gez_dat.append(self.constraints_gez[k].coeffs.get(None, 0))
-
-        # Equality constraints
-        A_eqz_dat = []
-        A_eqz_i = []
-        A_eqz_j = []
-        B_eqz_dat = []
-        for k in range(len(self.constraints_eqz)):
-            for key, val in self.constraints_eqz[k].coeffs.items():
-                if key is not None:
-                    A_eqz_dat.append(val)
-                    A_eqz_i.append(k)
-                    A_eqz_j.append(basis.index(key))
-            B_eqz_dat.append(self.constraints_eqz[k].get(None))
+        """
+        if basis is None:
+            basis = self.basis
+        index = {var: i for i, var in enumerate(basis)}
+
+        # Inequality and equality constraints
+        A_gez_mat, B_gez_vec = self._assemble_constraints(self.constraints_gez, index)
+        A_eqz_mat, B_eqz_vec = self._assemble_constraints(self.constraints_eqz, index)
 
         # Linear objective
-        C_dat = [self.linear_objective.coeffs.get(key, 0) for key in basis]
+        C_vec = np.zeros(len(basis))
+        for coeffs in (self.linear_objective.coeffs, self._linear_terms):
+            for key, val in coeffs.items():
+                if key is not None:
+                    C_vec[index[key]] += val
 
-        # Quadratic objective
+        # Quadratic objective: each (a @ x + c)^2 term contributes the outer product
+        # a a^T to Q and c a to C, the constant term c^2 is ignored
         Q_dat = []
         Q_i = []
         Q_j = []
-        for k in range(len(self.quadratic_objective)):
-            for key1, val1 in self.quadratic_objective[k].coeffs.items():
-                for key2, val2 in self.quadratic_objective[k].coeffs.items():
-                    if key1 is not None and key2 is not None:
-                        Q_dat.append(val1 * val2)
-                        Q_i.append(basis.index(key1))
-                        Q_j.append(basis.index(key2))
-                    elif key1 is None and key2 is not None:
-                        C_dat[basis.index(key2)] += 0.5 * val1 * val2
-                    elif key1 is not None and key2 is None:
-                        C_dat[basis.index(key1)] += 0.5 * val1 * val2
-                    elif key1 is None and key2 is None:
-                        # This is the constant term and can be ignored
-                        pass
-                    else:
-                        raise RuntimeError("I should never get here")
-
-        A_gez_mat = scipy.sparse.coo_matrix(
-            (A_gez_dat, (A_gez_i, A_gez_j)), shape=(len(B_gez_dat), len(basis))
-        ).tocsc()
-        B_gez_vec = np.array(B_gez_dat)
+        for expr in self.quadratic_objective:
+            idx = np.fromiter(
+                (index[key] for key in expr.coeffs if key is not None), dtype=np.int64
+            )
+            vals = np.fromiter(
+                (val for key, val in expr.coeffs.items() if key is not None),
+                dtype=float,
+            )
+            Q_dat.append(np.outer(vals, vals).ravel())
+            Q_i.append(np.repeat(idx, len(idx)))
+            Q_j.append(np.tile(idx, len(idx)))
+            C_vec[idx] += expr.coeffs.get(None, 0) * vals
 
-        A_eqz_mat = scipy.sparse.coo_matrix(
-            (A_eqz_dat, (A_eqz_i, A_eqz_j)), shape=(len(B_eqz_dat), len(basis))
+        Q_mat = scipy.sparse.coo_matrix(
+            (
+                np.concatenate(Q_dat) if Q_dat else np.empty(0),
+                (
+                    np.concatenate(Q_i) if Q_i else np.empty(0, dtype=np.int64),
+                    np.concatenate(Q_j) if Q_j else np.empty(0, dtype=np.int64),
+                ),
+            ),
+            shape=(len(basis), len(basis)),
         ).tocsc()
-        B_eqz_vec = np.array(B_eqz_dat)
 
-        C_vec = np.array(C_dat)
+        return basis, A_gez_mat, B_gez_vec, A_eqz_mat, B_eqz_vec, Q_mat, C_vec
 
-        Q_mat = scipy.sparse.coo_matrix(
-            (Q_dat, (Q_i, Q_j)), shape=(len(basis), len(basis))
-        ).tocsc()
+    def solve(self) -> Solution:
+        basis = self.basis
+        if len(basis) == 0:
+            return Solution()
+
+        _, A_gez_mat, B_gez_vec, A_eqz_mat, B_eqz_vec, Q_mat, C_vec = self._assemble(
+            basis
+        )
 
         # The quadratic problem uses slightly different variable symbols than
         # scipy, which is why the letters are all off...
@@ -1,5 +1,4 @@
-import copy
-from typing import List, Tuple, Optional, Sequence, cast
+from typing import Dict, List, Tuple, Optional, Sequence, cast
 from collections import deque
 
 import cirq
@@ -122,42 +121,120 @@ def apply_swap(data: List[List[Optional[int]]], swap: Swap):
     data[i1][j1], data[i2][j2] = data[i2][j2], data[i1][j1]
 
 
-def get_equivalent_swaps(
-    source: List[Tuple[int, ...]], target: List[Tuple[int, ...]]
-) -> List[Swap]:
-    src = expand(source)
-    tgt = expand(target)
+def _match_rows_to_groups(
+    rows: List[List[Optional[int]]], groups: List[Tuple[int, ...]]
+) -> Dict[int, int]:
+    """Match rows to groups of qubits so that most qubits stay in their row.
+
+    A row and a group are adjacent if they share a qubit. Since both hold at
+    most two qubits, every row and group has at most two neighbours, so the
+    adjacency graph is a union of paths and cycles, and pairing consecutive
+    nodes along each of them, starting from an end of the paths, gives a
+    maximum matching. A row and a group sharing two qubits are only adjacent to
+    each other, so the matching keeps as many qubits in place as possible.
+
+    Returns:
+        A mapping from the index of a row to the index of its group.
+    """
+    row_of = {q: i for i, row in enumerate(rows) for q in row if q is not None}
+    group_of = {q: i for i, group in enumerate(groups) for q in group}
 
-    target_form = canonical_form(regroup(tgt))
+    neighbours: Dict[Tuple[bool, int], List[Tuple[bool, int]]] = {}
+    for i, row in enumerate(rows):
+        adjacent = dict.fromkeys(group_of[q] for q in row if q is not None)
+        neighbours[(True, i)] = [(False, g) for g in adjacent]
+    for i, group in enumerate(groups):
+        adjacent = dict.fromkeys(row_of[q] for q in group)
+        neighbours[(False, i)] = [(True, r) for r in adjacent]
 
-    def config_key(state):
-        return canonical_form(regroup(state))
+    matching: Dict[int, int] = {}
+    visited = set()
+    for start in sorted(neighbours, key=lambda node: len(neighbours[node])):
+        if start in visited:
+            continue
 
-    initial_key = config_key(src)
-    visited = {initial_key}
-    queue = deque([(copy.deepcopy(src), [])])  # (current state, list of swaps made)
+        path = [start]
+        visited.add(start)
+        while unvisited := [n for n in neighbours[path[-1]] if n not in visited]:
+            path.append(unvisited[0])
+            visited.add(unvisited[0])
 
-    while queue:
-        state, swaps = queue.popleft()
+        for (is_row, i), (_, j) in zip(path[::2], path[1::2]):
+            row, group = (i, j) if is_row else (j, i)
+            matching[row] = group
 
-        if config_key(state) == target_form:
-            return swaps
+    return matching
 
-        flat = flatten_with_slots(state)
 
-        for i in range(len(flat)):
-            for j in range(i + 1, len(flat)):
-                (_, slot_i), (_, slot_j) = flat[i], flat[j]
-                apply_swap(state, (slot_i, slot_j))
-                key = config_key(state)
+def get_equivalent_swaps(
+    source: List[Tuple[int, ...]], target: List[Tuple[int, ...]]
+) -> List[Swap]:
+    """Find a minimal sequence of slot swaps regrouping qubits as in a target.
 
-                if key not in visited:
-                    visited.add(key)
-                    queue.append((copy.deepcopy(state), swaps + [(slot_i, slot_j)]))
+    Each row has two slots, and only which qubits are grouped together in a row
+    matters, not which row a group ends up in. The groups of `target` are first
+    assigned to rows, keeping as many qubits in place as possible (see
+    `_match_rows_to_groups`). The remaining groups go to the rows left, those
+    holding qubits first. Then each slot is given its qubit by one swap, which
+    also settles the swapped-out qubit when it closes a permutation cycle. The
+    number of swaps is the number of moved qubits minus the number of cycles
+    among them, computed in linear time.
 
-                apply_swap(state, (slot_i, slot_j))  # Undo swap
+    Args:
+        source: The qubits of each row before the swaps.
+        target: The qubits of each row after the swaps, padded with empty
+            tuples to the number of rows of `source`.
 
-    return []  # Should not happen if input is valid
+    Returns:
+        The swaps of slots (row index, position in the row) to apply in order
+        to `source`.
+    """
+    state = expand(source)
+    groups = [group for group in target if len(group) > 0]
+    matching = _match_rows_to_groups(state, groups)
+
+    # NOTE: putting incoming qubits in the place of outgoing ones rather than
+    # of empty slots lets swaps close cycles, which saves one swap per cycle
+    layout: List[List[Optional[int]]] = [[None, None] for _ in state]
+    for row, g in matching.items():
+        group = groups[g]
+        staying = [q for q in group if q in state[row]]
+        for q in staying:
+            layout[row][state[row].index(q)] = q
+        free = [j for j in range(2) if layout[row][j] is None]
+        free.sort(key=lambda j: state[row][j] is None)
+        for q, j in zip([q for q in group if q not in staying], free):
+            layout[row][j] = q
+
+    free_rows = [i for i in range(len(state)) if i not in matching]
+    free_rows.sort(key=lambda i: state[i].count(None))
+    matched = set(matching.values())
+    unmatched = [g for g in range(len(groups)) if g not in matched]
+    for row, group in zip(free_rows, unmatched):
+        slots = sorted(range(2), key=lambda j: state[row][j] is None)
+        for q, j in zip(groups[group], slots):
+            layout[row][j] = q
+
+    position: Dict[int, Slot] = {
+        q: (i, j)
+        for i, row in enumerate(state)
+        for j, q in enumerate(row)
+        if q is not None
+    }
+    swaps: List[Swap] = []
+    for i, row in enumerate(layout):
+        for j, q in enumerate(row):
+            if q is None or state[i][j] == q:
+                continue
+
+            slot = position[q]
+            swaps.append(((i, j), slot))
+            apply_swap(state, ((i, j), slot))
+            if (other := state[slot[0]][slot[1]]) is not None:
+                position[other] = slot
+            position[q] = (i, j)
+
+    return swaps
 
 
 def greedy_unique_packing(data: List[int]) -> List[List[int]]:
@@ -242,15 +319,12 @@ def add_noise_to_swaps(
     batches_move_qidxs = get_swap_move_qidxs(swaps, init_qidxs)
 
     for batch in batches_move_qidxs:
-        built_moment = cirq.Moment()
         non_mov_qidxs = numpy_complement(np.array(batch), nqubs_idxs)
 
-        for i in range(len(batch)):
-            built_moment += move_noise(cirq.LineQubit(batch[i]))
-        for j in range(len(non_mov_qidxs)):
-            built_moment += sitter_noise(cirq.LineQubit(non_mov_qidxs[j]))
+        ops = [move_noise(cirq.LineQubit(qidx)) for qidx in batch]
+        ops.extend(sitter_noise(cirq.LineQubit(qidx)) for qidx in non_mov_qidxs)
 
-        built_circuit.append(built_moment)
+        built_circuit.append(cirq.Moment(ops))
 
     # built_circuit.append(built_moment)
 
@@ -283,7 +357,9 @@ def get_gate_error_channel(
     # Check for the moment (layer) layout: global single qubit gates, or mixture of single qubit gates and two qubit gates
 
     gates_in_layer = extract_u3_and_cz_qargs(moment)
-    new_moments = cirq.Circuit()
+    # NOTE: collect the noise operations and build the circuit at once, which
+    # places them the same way as appending them one by one
+    noise_ops = []
 
     if gates_in_layer["cz"] == []:
 
@@ -303,7 +379,7 @@ def get_gate_error_channel(
             for qub in gates_in_layer["u3"]:
 
                 # new_moment = new_moment +pauli_channel(qub[0])
-                new_moments.append(pauli_channel(qub[0]))
+                noise_ops.append(pauli_channel(qub[0]))
         else:
             pauli_channel = cirq.AsymmetricDepolarizingChannel(
                 p_x=sq_loc_rates[0], p_y=sq_loc_rates[1], p_z=sq_loc_rates[2]
@@ -311,7 +387,7 @@ def get_gate_error_channel(
             for qub in gates_in_layer["u3"]:
 
                 # new_moment = new_moment + pauli_channel(qub[0])
-                new_moments.append(pauli_channel(qub[0]))
+                noise_ops.append(pauli_channel(qub[0]))
 
     else:
         # there is at least one CZ gate...
@@ -324,15 +400,15 @@ def get_gate_error_channel(
 
         # apply correlated noise to paired qubits
         for qub in gates_in_layer["cz"]:
-            new_moments.append(two_qubit_pauli.on(qub[0], qub[1]))
+            noise_ops.append(two_qubit_pauli.on(qub[0], qub[1]))
 
         for qub in gates_in_layer["u3"]:
-            new_moments.append(
+            noise_ops.append(
                 unp_cz_pauli_channel(qub[0])
             )  ###qubits in the gate zone get unpaired_cz error
-            new_moments.append(loc_rot_pauli_channel(qub[0]))
+            noise_ops.append(loc_rot_pauli_channel(qub[0]))
 
-    return new_moments
+    return cirq.Circuit(noise_ops)
 
 
 def add_move_and_sitter_channels(
@@ -358,35 +434,23 @@ def add_move_and_sitter_channels(
     """
 
     # Faltten ref_qargs and ref_qargs for purposes of identifying how to apply noise:
-    flat_tar_qargs = flatten_qargs(tar_qargs)
-
     if ref_qargs is None:  # we are adding noise to the beginning of circuit...
-
-        flat_ref_qargs = flatten_qargs(tar_qargs)
-
-        bool_list = [k not in flat_tar_qargs for k in flat_ref_qargs]
-
+        # all the qubits of the first layer are brought to the gate zone
+        rem_qubs = flatten_qargs(tar_qargs)
     else:
-        flat_ref_qargs = flatten_qargs(ref_qargs)
-
-        bool_list = [k in flat_tar_qargs for k in flat_ref_qargs]
+        flat_tar_qargs = set(flatten_qargs(tar_qargs))
+        rem_qubs = [k for k in flatten_qargs(ref_qargs) if k not in flat_tar_qargs]
 
-    rem_qubs = []
-
-    for i in range(len(flat_ref_qargs)):
-        if not bool_list[i]:
-            rem_qubs.append(flat_ref_qargs[i])
-            built_moment += move_pauli_channel(flat_ref_qargs[i])
-
-    if len(rem_qubs) >= 1:
+    if len(rem_qubs) == 0:
+        return built_moment, False
 
-        for k in range(len(qub_reg)):
-            if qub_reg[k] not in rem_qubs:
-                built_moment += sitter_pauli_channel(qub_reg[k])
+    moved_qubs = set(rem_qubs)
+    noise_ops = [move_pauli_channel(qub) for qub in rem_qubs]
+    noise_ops.extend(
+        sitter_pauli_channel(qub) for qub in qub_reg if qub not in moved_qubs
+    )
 
-        return built_moment, True
-    else:
-        return built_moment, False
+    return built_moment.with_operations(*noise_ops), True
 
 
 def get_move_error_channel_two_zoned(
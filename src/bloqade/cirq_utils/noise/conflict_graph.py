@@ -1,3 +1,6 @@
+from bisect import insort, bisect_right
+from collections import defaultdict
+
 import cirq
 import numpy as np
 
@@ -22,73 +25,87 @@ class OneZoneConflictGraph:
     def _get_nodes(self):
         """Each qubit participating in a two-qubit gate is a node.
 
-        Sets the self.nodes attribute.
+        Sets the self.nodes attribute, and the self.partners attribute mapping each node to the other qubit of its gate.
         """
         nodes = set()
+        partners = {}
         for gate in self.gates_in_moment:
-            nodes.add(gate.qubits[0])
-            nodes.add(gate.qubits[1])
+            q0, q1 = gate.qubits
+            nodes.add(q0)
+            nodes.add(q1)
+            partners[q0] = q1
+            partners[q1] = q0
         self.nodes = nodes
+        self.partners = partners
 
     def _get_edges(self):
         """
         Generate the edges of the conflict graph for a given moment.
 
-        Defines self.edges as a set of tuples, where each tuple represents an edge between two qubits.
+        Defines self.edges as a set of tuples, where each tuple represents an edge between two qubits, and
+        self.adjacency as a dictionary mapping each node to the set of its neighbours.
+
+        Two gates conflict if moving their qubits together would split or merge AOD tones (one-to-many), or
+        would not preserve the ordering of the tones. Rather than comparing every pair of gates, the conflicting
+        pairs are found by grouping the gates by coordinates (one-to-many) and by sweeping over the gates sorted
+        by coordinates (ordering), so that the cost is proportional to the number of edges.
         """
 
-        edges = set()
-        for idx1, gate1 in enumerate(self.gates_in_moment):
-            edges.add(gate1.qubits)
-            for gate2 in self.gates_in_moment[idx1 + 1 :]:
-                # X one-to-many, ie. we can't split/merge AOD tones
-                if (gate1.qubits[0].row == gate2.qubits[0].row) ^ (
-                    gate1.qubits[1].row == gate2.qubits[1].row
-                ):
-                    edges.add((gate1.qubits[0], gate2.qubits[0]))
-                    edges.add((gate1.qubits[0], gate2.qubits[1]))
-                    edges.add((gate1.qubits[1], gate2.qubits[0]))
-                    edges.add((gate1.qubits[1], gate2.qubits[1]))
-                # Y one-to-many
-                if (gate1.qubits[0].col == gate2.qubits[0].col) ^ (
-                    gate1.qubits[1].col == gate2.qubits[1].col
-                ):
-                    edges.add((gate1.qubits[0], gate2.qubits[0]))
-                    edges.add((gate1.qubits[0], gate2.qubits[1]))
-                    edges.add((gate1.qubits[1], gate2.qubits[0]))
-                    edges.add((gate1.qubits[1], gate2.qubits[1]))
-                # X ordering, ie. the ordering of AOD tones must be preserved.
-                if (gate1.qubits[0].row < gate2.qubits[0].row) ^ (
-                    gate1.qubits[1].row < gate2.qubits[1].row
-                ):
-                    edges.add((gate1.qubits[0], gate2.qubits[0]))
-                    edges.add((gate1.qubits[1], gate2.qubits[1]))
-                if (gate1.qubits[1].row < gate2.qubits[0].row) ^ (
-                    gate1.qubits[0].row < gate2.qubits[1].row
-                ):
-                    edges.add((gate1.qubits[0], gate2.qubits[1]))
-                    edges.add((gate1.qubits[1], gate2.qubits[0]))
-                # Y ordering
-                if (gate1.qubits[0].col < gate2.qubits[0].col) ^ (
-                    gate1.qubits[1].col < gate2.qubits[1].col
-                ):
-                    edges.add((gate1.qubits[0], gate2.qubits[0]))
-                    edges.add((gate1.qubits[1], gate2.qubits[1]))
-                if (gate1.qubits[1].col < gate2.qubits[0].col) ^ (
-                    gate1.qubits[0].col < gate2.qubits[1].col
-                ):
-                    edges.add((gate1.qubits[0], gate2.qubits[1]))
-                    edges.add((gate1.qubits[1], gate2.qubits[0]))
+        qubits = [gate.qubits for gate in self.gates_in_moment]
+        rows = np.array([[q0.row, q1.row] for q0, q1 in qubits], dtype=int).reshape(
+            -1, 2
+        )
+        cols = np.array([[q0.col, q1.col] for q0, q1 in qubits], dtype=int).reshape(
+            -1, 2
+        )
+
+        edges = set(qubits)
+
+        def add_edges(pairs, cross: bool, straight: bool):
+            for idx1, idx2 in pairs:
+                gate1, gate2 = qubits[idx1], qubits[idx2]
+                if straight:
+                    edges.add((gate1[0], gate2[0]))
+                    edges.add((gate1[1], gate2[1]))
+                if cross:
+                    edges.add((gate1[0], gate2[1]))
+                    edges.add((gate1[1], gate2[0]))
+
+        for coords in (rows, cols):
+            # X/Y one-to-many, ie. we can't split/merge AOD tones
+            add_edges(
+                _one_to_many_pairs(coords[:, 0], coords[:, 1]),
+                cross=True,
+                straight=True,
+            )
+            # X/Y ordering, ie. the ordering of AOD tones must be preserved.
+            add_edges(
+                _discordant_pairs(
+                    coords[:, 0], coords[:, 1], coords[:, 0], coords[:, 1]
+                ),
+                cross=False,
+                straight=True,
+            )
+            add_edges(
+                _discordant_pairs(
+                    coords[:, 1], coords[:, 0], coords[:, 0], coords[:, 1]
+                ),
+                cross=True,
+                straight=False,
+            )
+
+        adjacency = {node: set() for node in self.nodes}
+        for node1, node2 in edges:
+            adjacency[node1].add(node2)
+            adjacency[node2].add(node1)
 
         self.edges = edges
+        self.adjacency = adjacency
 
     def _get_node_degrees(self):
         """Sets the self.degrees attribute."""
 
-        deg_dict = {}
-        for node in self.nodes:
-            deg_dict[node] = np.sum([node in edge for edge in self.edges])
-        self.degrees = deg_dict
+        self.degrees = {node: len(self.adjacency[node]) for node in self.nodes}
 
     def get_move_schedule(self, mover_limit: int = 10000):
         """Generates a move schedule by coloring the conflict graph greedily, first coloring nodes of highest degree.
@@ -112,55 +129,111 @@ class OneZoneConflictGraph:
 
         move_schedule = {}
         colored_nodes = set()
-        partner_node = None
         for node in self.ordered_nodes:
-            colored = False
-            for gate in self.gates_in_moment:
-                if node in gate.qubits:
-                    partners = set(gate.qubits)
-                    partners.remove(node)
-                    partner_node = list(partners)[0]
             if node in colored_nodes:
                 # NOTE: if a node is colored, both it and its partner are added to colored_nodes
                 continue
+
+            connected_nodes = self.adjacency[node]
+            for color, movers in move_schedule.items():
+                # NOTE: make sure none of the connected nodes are already assigned to color.
+                has_colored_neighbor = not movers.isdisjoint(connected_nodes)
+                mover_limit_reached = len(movers) >= mover_limit
+                if not (has_colored_neighbor or mover_limit_reached):
+                    # NOTE: node needs color
+                    movers.add(node)
+                    break
             else:
-                connected_nodes = set()
-                for edge in self.edges:
-                    if node in edge:
-                        connected_nodes.add(edge[0])
-                        connected_nodes.add(edge[1])
-                connected_nodes.remove(node)
-                for color in move_schedule.keys():
-                    has_colored_neighbor = False
-                    for connected_node in connected_nodes:
-                        # NOTE: loop through to make sure none of the connected nodes are already assigned to color.
-                        if connected_node in move_schedule[color]:
-                            has_colored_neighbor = True
-                            break
-                        else:
-                            continue
-                    mover_limit_reached = len(move_schedule[color]) >= mover_limit
-                    if not (has_colored_neighbor or mover_limit_reached):
-                        # NOTE: node needs color
-                        move_schedule[color].add(node)
-                        colored = True
-
-                        # NOTE: add this node and it's partner to the solved nodes.
-                        colored_nodes.add(node)
-
-                        if partner_node is not None:
-                            colored_nodes.add(partner_node)
-                        break
-                if not colored:
-                    move_schedule[len(move_schedule)] = {node}
-                    colored = True
-                    colored_nodes.add(node)
-
-                    if partner_node is not None:
-                        colored_nodes.add(partner_node)
+                move_schedule[len(move_schedule)] = {node}
+
+            # NOTE: add this node and it's partner to the solved nodes.
+            colored_nodes.add(node)
+            colored_nodes.add(self.partners[node])
 
         assert set(colored_nodes) == set(self.ordered_nodes)
 
         self.move_schedule = move_schedule
 
         return self.move_schedule
+
+
+def _one_to_many_pairs(first: np.ndarray, second: np.ndarray) -> list[tuple[int, int]]:
+    """Find the pairs of gates sharing exactly one of their two coordinates.
+
+    :param first: The coordinate of the first qubit of each gate.
+    :param second: The coordinate of the second qubit of each gate.
+    :returns: The pairs (idx1, idx2) of gate indices with idx1 < idx2 and either `first` or `second` equal.
+    """
+    pairs = []
+    for shared, other in ((first, second), (second, first)):
+        # NOTE: group the gates by the shared coordinate, then by the other one, so that
+        # the pairs sharing both coordinates are never looked at
+        groups = defaultdict(lambda: defaultdict(list))
+        for idx, (value, other_value) in enumerate(
+            zip(shared.tolist(), other.tolist())
+        ):
+            groups[value][other_value].append(idx)
+
+        for subgroups in groups.values():
+            subgroups = list(subgroups.values())
+            for k, group1 in enumerate(subgroups):
+                for group2 in subgroups[k + 1 :]:
+                    pairs.extend(
+                        (min(idx1, idx2), max(idx1, idx2))
+                        for idx1 in group1
+                        for idx2 in group2
+                    )
+    return pairs
+
+
+def _discordant_pairs(
+    first_x: np.ndarray,
+    first_y: np.ndarray,
+    second_x: np.ndarray,
+    second_y: np.ndarray,
+) -> list[tuple[int, int]]:
+    """Find the pairs of gates whose coordinates are not ordered the same way.
+
+    These are the pairs (idx1, idx2) with idx1 < idx2 such that
+    `(first_x[idx1] < second_x[idx2]) ^ (first_y[idx1] < second_y[idx2])`.
+
+    Ties are broken by the reversed gate index, i.e. the point (v, idx1) is smaller than (v, idx2) iff idx1 > idx2,
+    which for idx1 < idx2 makes the comparisons above strict as they are. As all points of different gates are then
+    distinct, a pair is discordant whichever gate comes first, and the discordant pairs are the inversions between the
+    x and y orders of the points, found by a sweep over the points sorted by x.
+
+    :returns: The discordant pairs (idx1, idx2) of gate indices, with idx1 < idx2.
+    """
+    num_gates = len(first_x)
+    index = np.tile(np.arange(num_gates), 2)
+    xs = np.concatenate([first_x, second_x])
+    ys = np.concatenate([first_y, second_y])
+
+    # NOTE: points 0..n-1 are the first points of the gates, points n..2n-1 the second ones
+    order_x = np.lexsort((-index, xs))
+    rank_y = np.empty(2 * num_gates, dtype=int)
+    rank_y[np.lexsort((-index, ys))] = np.arange(2 * num_gates)
+
+    point_of_rank = np.empty(2 * num_gates, dtype=int)
+    point_of_rank[rank_y] = np.arange(2 * num_gates)
+    point_of_rank = point_of_rank.tolist()
+    rank_y = rank_y.tolist()
+
+    pairs = []
+    seen_first: list[int] = []
+    seen_second: list[int] = []
+    for point in order_x.tolist():
+        y = rank_y[point]
+        is_first = point < num_gates
+        gate = point % num_gates
+        # NOTE: the points seen before are smaller in x, so they are discordant with
+        # this one if they are larger in y
+        others = seen_second if is_first else seen_first
+        for other_y in others[bisect_right(others, y) :]:
+            other = point_of_rank[other_y] % num_gates
+            idx1, idx2 = (gate, other) if is_first else (other, gate)
+            if idx1 < idx2:
+                pairs.append((idx1, idx2))
+        insort(seen_first if is_first else seen_second, y)
+
+    return pairs
@@ -114,14 +114,26 @@ class GeminiNoiseModelABC(cirq.NoiseModel, MoveNoiseModelABC):
             additional_gates=[reset_family]
         ).gates
 
+        # NOTE: checking a gate against the families is expensive, so only check
+        # each gate once, and each type of gate once if a family accepts the
+        # whole type (e.g. all PhasedXZGates)
+        allowed_types: set[type] = set()
+        allowed_gates: set[cirq.Gate | None] = set()
         for moment in moments:
             for operation in moment:
                 if not isinstance(operation, cirq.Operation):
                     continue
 
                 gate = operation.gate
+                if type(gate) in allowed_types or gate in allowed_gates:
+                    continue
+
                 for allowed_family in allowed_target_gates:
                     if gate in allowed_family:
+                        if isinstance(allowed_family.gate, type):
+                            allowed_types.add(type(gate))
+                        else:
+                            allowed_gates.add(gate)
                         break
                 else:
                     raise ValueError(
@@ -243,31 +255,23 @@ class GeminiOneZoneNoiseModel(GeminiNoiseModelABC):
         # Check if the moment only contains single qubit gates
         assert np.all([len(op.qubits) == 1 for op in moment.operations])
         # Check if single qubit gate is global or local
-        gate_params = [
-            [op.gate.axis_phase_exponent, op.gate.x_exponent, op.gate.z_exponent]
-            for op in moment.operations
-        ]
-        gate_params = np.array(gate_params)
-
-        test_params = [
+        gate_params = np.array(
             [
-                moment.operations[0].gate.axis_phase_exponent,
-                moment.operations[0].gate.x_exponent,
-                moment.operations[0].gate.z_exponent,
+                [op.gate.axis_phase_exponent, op.gate.x_exponent, op.gate.z_exponent]
+                for op in moment.operations
             ]
-            for _ in moment.operations
-        ]
-        test_params = np.array(test_params)
+        )
 
+        is_identity = np.isclose(gate_params[:, 1], 0) & np.isclose(
+            gate_params[:, 2], 0
+        )
         gated_qubits = [
             op.qubits[0]
-            for op in moment.operations
-            if not (
-                np.isclose(op.gate.x_exponent, 0) and np.isclose(op.gate.z_exponent, 0)
-            )
+            for op, identity in zip(moment.operations, is_identity)
+            if not identity
         ]
 
-        is_global = np.all(np.isclose(gate_params, test_params)) and set(
+        is_global = np.all(np.isclose(gate_params, gate_params[0])) and set(
             gated_qubits
         ) == set(system_qubits)
 
@@ -369,56 +373,37 @@ class GeminiOneZoneNoiseModel(GeminiNoiseModelABC):
         if self.check_input_circuit:
             self.validate_moments(moments)
 
-        # Split into moments with only 1Q and 2Q gates
-        moments_1q = [
-            cirq.Moment(
-                [
-                    op
-                    for op in moment.operations
-                    if (len(op.qubits) == 1)
-                    and (not cirq.is_measurement(op))
-                    and (not isinstance(op.gate, cirq.ResetChannel))
-                ]
-            )
-            for moment in moments
-        ]
-        moments_2q = [
-            cirq.Moment(
-                [
-                    op
-                    for op in moment.operations
-                    if (len(op.qubits) == 2) and (not cirq.is_measurement(op))
-                ]
-            )
-            for moment in moments
-        ]
-
-        moments_measurement = [
-            cirq.Moment(
-                [
-                    op
-                    for op in moment.operations
-                    if (cirq.is_measurement(op))
-                    or (isinstance(op.gate, cirq.ResetChannel))
-                ]
-            )
-            for moment in moments
-        ]
-
-        assert len(moments_1q) == len(moments_2q) == len(moments_measurement)
-
-        interleaved_moments = []
-
-        def count_remaining_cz_moments(moments_2q):
-            remaining_cz_counts = []
-            count = 0
-            for m in moments_2q[::-1]:
-                if any(isinstance(op.gate, cirq.CZPowGate) for op in m.operations):
-                    count += 1
-                remaining_cz_counts = [count] + remaining_cz_counts
-            return remaining_cz_counts
-
-        remaining_cz_moments = count_remaining_cz_moments(moments_2q)
+        # Split into moments with only 1Q gates, 2Q gates, and measurements or resets
+        moments_1q = []
+        moments_2q = []
+        moments_measurement = []
+        measured_qubits = []
+        for moment in moments:
+            ops_1q, ops_2q, ops_measurement, qubits = [], [], [], []
+            for op in moment.operations:
+                if cirq.is_measurement(op):
+                    ops_measurement.append(op)
+                    qubits.extend(op.qubits)
+                elif isinstance(op.gate, cirq.ResetChannel):
+                    ops_measurement.append(op)
+                elif len(op.qubits) == 1:
+                    ops_1q.append(op)
+                elif len(op.qubits) == 2:
+                    ops_2q.append(op)
+            moments_1q.append(cirq.Moment(ops_1q))
+            moments_2q.append(cirq.Moment(ops_2q))
+            moments_measurement.append(cirq.Moment(ops_measurement))
+            measured_qubits.append(qubits)
+
+        # Number of moments with a CZ gate from each moment to the end of the circuit
+        has_cz = np.array(
+            [
+                any(isinstance(op.gate, cirq.CZPowGate) for op in moment.operations)
+                for moment in moments_2q
+            ],
+            dtype=int,
+        )
+        remaining_cz_moments = np.cumsum(has_cz[::-1])[::-1]
 
         pm = 2 * self.sitter_pauli_rates[0]
         ps = 2 * self.cz_unpaired_pauli_rates[0]
@@ -428,24 +413,23 @@ class GeminiOneZoneNoiseModel(GeminiNoiseModelABC):
             2 * pm * (1 - ps) * (1 - pm) + (1 - pm) ** 2 * ps + pm**2 * ps
         )
 
+        # Measurements on Gemini will be at the end, so for circuits with mid-circuit measurements we will insert a
+        # bitflip error proportional to the number of moments left in the circuit to account for the decoherence
+        # that will happen before the final terminal measurement.
+        # probability of a bitflip error should be Binomial(moments_left,heuristic_1step_bitflip_error)
+        delayed_measurement_errors = (
+            (1 - (1 - 2 * heuristic_1step_bitflip_error) ** remaining_cz_moments) / 2
+        ).tolist()
+
+        interleaved_moments = []
         for idx, moment in enumerate(moments_1q):
             interleaved_moments.append(moment)
             interleaved_moments.append(moments_2q[idx])
-            # Measurements on Gemini will be at the end, so for circuits with mid-circuit measurements we will insert a
-            # bitflip error proportional to the number of moments left in the circuit to account for the decoherence
-            # that will happen before the final terminal measurement.
-            measured_qubits = []
-            for op in moments_measurement[idx].operations:
-                if cirq.is_measurement(op):
-                    measured_qubits += list(op.qubits)
-            # probability of a bitflip error should be Binomial(moments_left,heuristic_1step_bitflip_error)
-            delayed_measurement_error = (
-                1
-                - (1 - 2 * heuristic_1step_bitflip_error) ** (remaining_cz_moments[idx])
-            ) / 2
             interleaved_moments.append(
                 cirq.Moment(
-                    cirq.bit_flip(delayed_measurement_error).on_each(measured_qubits)
+                    cirq.bit_flip(delayed_measurement_errors[idx]).on_each(
+                        measured_qubits[idx]
+                    )
                 )
             )
             interleaved_moments.append(moments_measurement[idx])
@@ -591,6 +575,13 @@ class GeminiTwoZoneNoiseModel(GeminiNoiseModelABC):
 
         prev_moment: cirq.Moment | None = None
 
+        mover_rates = np.array(self.mover_pauli_rates)
+        sitter_rates = np.array(self.sitter_pauli_rates)
+        local_rates = np.array(self.local_pauli_rates)
+        global_rates = np.array(self.global_pauli_rates)
+        cz_unpaired_rates = np.array(self.cz_unpaired_pauli_rates)
+        two_qubit_pauli = self.two_qubit_pauli
+
         # TODO: clean up error getters so they return a list moments rather than circuits
         for i in range(len(moments)):
             noisy_moment_list.extend(
@@ -599,8 +590,8 @@ class GeminiTwoZoneNoiseModel(GeminiNoiseModelABC):
                     for moment in _two_zone_utils.get_move_error_channel_two_zoned(
                         moments[i],
                         prev_moment,
-                        np.array(self.mover_pauli_rates),
-                        np.array(self.sitter_pauli_rates),
+                        mover_rates,
+                        sitter_rates,
                         nqubs,
                     ).moments
                     if len(moment) > 0
@@ -614,10 +605,10 @@ class GeminiTwoZoneNoiseModel(GeminiNoiseModelABC):
                     moment
                     for moment in _two_zone_utils.get_gate_error_channel(
                         moments[i],
-                        np.array(self.local_pauli_rates),
-                        np.array(self.global_pauli_rates),
-                        self.two_qubit_pauli,
-                        np.array(self.cz_unpaired_pauli_rates),
+                        local_rates,
+                        global_rates,
+                        two_qubit_pauli,
+                        cz_unpaired_rates,
                         nqubs,
                     ).moments
                     if len(moment) > 0
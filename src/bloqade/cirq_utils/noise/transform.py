@@ -49,9 +49,16 @@ def transform_circuit(
         native_circuit = circuit
 
     # Add noise
-    noisy_circuit = cirq.Circuit()
+    noisy_moments = []
     for op_tree in model.noisy_moments(native_circuit, system_qubits):
         # Keep moments aligned
-        noisy_circuit += cirq.Circuit(op_tree)
+        if isinstance(op_tree, cirq.Moment):
+            noisy_moments.append(op_tree)
+        elif isinstance(op_tree, (list, tuple)) and all(
+            isinstance(moment, cirq.Moment) for moment in op_tree
+        ):
+            noisy_moments.extend(op_tree)
+        else:
+            noisy_moments.extend(cirq.Circuit(op_tree).moments)
 
-    return noisy_circuit
+    return cirq.Circuit.from_moments(*noisy_moments)
@@ -1,12 +1,14 @@
 from typing import TypeVar, Hashable, Iterable
 from itertools import combinations
+from concurrent.futures import ThreadPoolExecutor
 
 import cirq
+import numpy as np
 import networkx as nx
 from cirq.ops.gate_operation import GateOperation
 from cirq.contrib.circuitdag.circuit_dag import Unique, CircuitDag
 
-from .lineprog import Variable, LPProblem
+from .lineprog import Variable, LPProblem, Expression
 
 
 def can_be_parallel(
@@ -100,6 +102,25 @@ def block_similarity(
     return cirq.Circuit(new_moments), weights
 
 
+def _similarity_key(op: cirq.Operation, decimals: int = 8) -> Hashable | None:
+    """
+    Canonical key of the gate of an operation, such that operations that can be
+    parallel (see `can_be_parallel`) have the same key. Returns None for gates that
+    are never considered parallel.
+    """
+    if op.gate == cirq.CZ:
+        return "CZ"
+
+    if not isinstance(op.gate, cirq.PhasedXZGate):
+        return None
+
+    # Remove the global phase using the first entry of significant magnitude
+    unitary = cirq.unitary(op.gate).ravel()
+    pivot = unitary[np.argmax(np.abs(unitary) > 0.6)]
+    unitary = unitary * (abs(pivot) / pivot)
+    return tuple(np.round(unitary, decimals) + 0.0)
+
+
 def auto_similarity(
     circuit: cirq.Circuit, weight_1q: float, weight_2q: float
 ) -> tuple[cirq.Circuit, dict[Hashable, float]]:
@@ -118,17 +139,34 @@ def auto_similarity(
     """
     flattened_circuit: list[GateOperation] = list(cirq.flatten_op_tree(circuit))
     weights = {}
-    for i in range(len(flattened_circuit)):
-        if not cirq.has_unitary(flattened_circuit[i]):
+
+    # NOTE: only gates in the same bucket can be parallel, see `can_be_parallel`
+    buckets: dict[Hashable, list[int]] = {}
+    unitaries = {}
+    for i, op in enumerate(flattened_circuit):
+        if not cirq.has_unitary(op):
+            continue
+        key = _similarity_key(op)
+        if key is None:
             continue
-        for j in range(i + 1, len(flattened_circuit)):
-            if not cirq.has_unitary(flattened_circuit[j]):
-                continue
-            op1 = flattened_circuit[i]
-            op2 = flattened_circuit[j]
-            if can_be_parallel(op1, op2):
+        buckets.setdefault(key, []).append(i)
+        if key != "CZ":
+            unitaries[i] = cirq.unitary(op.gate)
+
+    for key, indices in buckets.items():
+        for n, i in enumerate(indices):
+            tag = f"AUTO:{i}"
+            for j in indices[n + 1 :]:
+                op1 = flattened_circuit[i]
+                op2 = flattened_circuit[j]
+                if not set(op1.qubits).isdisjoint(op2.qubits):
+                    continue
+                if key != "CZ" and not cirq.equal_up_to_global_phase(
+                    unitaries[i], unitaries[j], atol=1e-14
+                ):
+                    continue
+
                 # Add tags to both operations
-                tag = f"AUTO:{i}"
                 flattened_circuit[i] = op1.with_tags(tag)
                 flattened_circuit[j] = op2.with_tags(tag)
                 if len(op1.qubits) == 1:
@@ -237,22 +275,34 @@ def solve_epochs(
     for edge in directed.edges:
         lp.add_gez(basis[edge[1]] - basis[edge[0]] - 1.0)
 
-    all_variables = list(basis.values())
     # Add linear objective: minimize the total time
-    objective = hyperparameters["linear"] * sum(all_variables[1:], all_variables[0])
+    objective = hyperparameters["linear"] * Expression(dict.fromkeys(basis.values(), 1))
 
     default_weight = hyperparameters["tags"]
     lp.add_linear(objective)
     # Add ABS objective: similarity wants to go together.
-    for node1, node2 in combinations(directed.nodes, 2):
-        # Topological (user) similarity:
-        inter = set(node1.val.tags).intersection(set(node2.val.tags))
-        if len(inter) > 0:
-            weight = sum([group_weights.get(key, default_weight) for key in inter])
-            if weight > 0:
-                lp.add_abs((basis[node1] - basis[node2]) * weight)
-            elif weight < 0:
-                raise RuntimeError("Weights must be positive")
+    # NOTE: only visit the pairs of nodes sharing a tag, via an inverted index
+    nodes = list(directed.nodes)
+    tag_nodes: dict[Hashable, list[int]] = {}
+    for index, node in enumerate(nodes):
+        for tag in set(node.val.tags):
+            tag_nodes.setdefault(tag, []).append(index)
+
+    pair_weights: dict[tuple[int, int], float] = {}
+    for tag, indices in tag_nodes.items():
+        weight = group_weights.get(tag, default_weight)
+        if weight == 0:
+            continue
+        for index1, index2 in combinations(indices, 2):
+            pair = (index1, index2)
+            pair_weights[pair] = pair_weights.get(pair, 0) + weight
+
+    # Topological (user) similarity:
+    for (index1, index2), weight in sorted(pair_weights.items()):
+        if weight > 0:
+            lp.add_abs((basis[nodes[index1]] - basis[nodes[index2]]) * weight)
+        elif weight < 0:
+            raise RuntimeError("Weights must be positive")
 
     solution = lp.solve()
     return {node: solution[basis[node]] for node in directed.nodes}
@@ -359,10 +409,51 @@ def colorize(
         yield from twoq_gates2
 
 
+_LOOKAHEAD_TAG = "WINDOW:LOOKAHEAD"
+
+
+def _solve_window(
+    circuit: cirq.Circuit,
+    hyperparameters: dict[str, float],
+    auto_tag: bool,
+) -> list[list[Unique[cirq.GateOperation]]]:
+    """
+    Internal function to solve the epochs of a (window of a) transpiled circuit.
+    Gates tagged with `_LOOKAHEAD_TAG` take part in the optimization but are
+    dropped from the returned epochs.
+    """
+    if auto_tag:
+        # Annotate the circuit with topological information
+        # to improve parallelization
+        circuit, group_weights = auto_similarity(
+            circuit,
+            weight_1q=hyperparameters.get("1q", 1.0),
+            weight_2q=hyperparameters.get("2q", 1.0),
+        )
+    else:
+        group_weights = {}
+    group_weights[_LOOKAHEAD_TAG] = 0.0
+
+    epochs = generate_epochs(
+        solve_epochs(
+            directed=to_dag_circuit(circuit),
+            group_weights=group_weights,
+            hyperparameters=hyperparameters,
+        )
+    )
+    epochs = (
+        [op for op in epoch if _LOOKAHEAD_TAG not in op.val.tags] for epoch in epochs
+    )
+    return [epoch for epoch in epochs if len(epoch) > 0]
+
+
 def parallelize(
     circuit: cirq.Circuit,
     hyperparameters: dict[str, float] | None = None,
     auto_tag: bool = True,
+    window_depth: int | None = None,
+    window_overlap: int = 0,
+    max_workers: int = 1,
 ) -> cirq.Circuit:
     """
     Use linear programming to reorder a circuit so that it may be optimally be
@@ -381,33 +472,49 @@ def parallelize(
             - "1q": float (1.0)  - the quadratic cost of 1q gates
             - "2q": float (2.0)  - the quadratic cost of 2q gates
             - "tags": float (0.5) - the default weight of the topological basis.
+        auto_tag: bool - whether to tag similar gates automatically, see `auto_similarity`.
+        window_depth: int | None - if set, the transpiled circuit is split into windows
+            of this many moments which are optimized independently and stitched back
+            together. This bounds the size of each optimization problem for deep
+            circuits, at the cost of optimality across window boundaries.
+        window_overlap: int (0) - the number of moments of the next window that are
+            included in the optimization of each window, without being scheduled by
+            it, so that gates at the end of the window can align with the next one.
+        max_workers: int (1) - the number of threads used to optimize the windows.
     Returns:
         cirq.Circuit - the optimized circuit, where each moment is as parallel as possible.
           it is also broken into native CZ gate set of {CZ, PhXZ}
     """
+    if window_depth is not None and window_depth < 1:
+        raise ValueError("window_depth must be positive")
+    if window_overlap < 0:
+        raise ValueError("window_overlap must be non-negative")
+
     hyperparameters = _get_hyperparameters(hyperparameters)
 
     # Transpile the circuit to a native CZ gate set.
     transpiled_circuit = transpile(circuit)
-    if auto_tag:
-        # Annotate the circuit with topological information
-        # to improve parallelization
-        transpiled_circuit, group_weights = auto_similarity(
-            transpiled_circuit,
-            weight_1q=hyperparameters.get("1q", 1.0),
-            weight_2q=hyperparameters.get("2q", 1.0),
+    transpiled_moments = transpiled_circuit.moments
+    if window_depth is None:
+        window_depth = max(len(transpiled_moments), 1)
+
+    def solve(start: int) -> list[list[Unique[cirq.GateOperation]]]:
+        stop = start + window_depth
+        lookahead = (
+            cirq.Moment(op.with_tags(_LOOKAHEAD_TAG) for op in moment)
+            for moment in transpiled_moments[stop : stop + window_overlap]
         )
+        window = cirq.Circuit(*transpiled_moments[start:stop], *lookahead)
+        return _solve_window(window, hyperparameters, auto_tag)
+
+    starts = range(0, len(transpiled_moments), window_depth)
+    if max_workers > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            windows = list(executor.map(solve, starts))
     else:
-        group_weights = {}
-    epochs = colorize(
-        generate_epochs(
-            solve_epochs(
-                directed=to_dag_circuit(transpiled_circuit),
-                group_weights=group_weights,
-                hyperparameters=hyperparameters,
-            )
-        )
-    )
+        windows = list(map(solve, starts))
+
+    epochs = colorize(epoch for window in windows for epoch in window)
     # Convert the epochs to a cirq circuit.
     moments = map(cirq.Moment, epochs)
     circuit = cirq.Circuit(moments)
@@ -10,6 +10,7 @@ from .base import (
     DynamicMemory as DynamicMemory,
     PyQrackInterpreter as PyQrackInterpreter,
 )
+from .tape import Tape as Tape
 from .task import PyQrackSimulatorTask as PyQrackSimulatorTask
 
 # NOTE: The following import is for registering the method tables
@@ -0,0 +1,191 @@
+"""Bulk sampling of kernels whose measurements are all terminal.
+
+A kernel is sampled in bulk by running it once with a tracing interpreter that
+defers every measurement: instead of collapsing the state, measurements return
+`DeferredMeasurement` placeholders. The tracing run is aborted as soon as the
+kernel does anything that makes the deferred measurements incorrect, i.e.
+
+* a simulator call happens after the first measurement (e.g. a gate acting after
+  a mid-circuit measurement),
+* the state is collapsed outside of a measurement (e.g. a reset),
+* the kernel draws random numbers (e.g. noise channels or atom loss),
+* a placeholder is used for classical computation or control flow.
+
+If the tracing run succeeds, all shots are drawn from the final state with a
+single `QrackSimulator.measure_shots` call and substituted into the returned value.
+
+The placeholders and the `DeferredMeasurementTracer` base class are shared with the
+straight-line tape compiler in `bloqade.pyqrack.tape`.
+"""
+
+from typing import Any, Generic, TypeVar
+from collections import Counter
+from dataclasses import field, dataclass
+
+from kirin import ir, interp
+from kirin.dialects.ilist import IList
+
+from bloqade.pyqrack.reg import PyQrackQubit, MeasurementResultValue
+from bloqade.pyqrack.base import MemoryABC, PyQrackInterpreter
+from bloqade.qasm2.dialects import core
+
+MemoryType = TypeVar("MemoryType", bound=MemoryABC)
+
+
+class TracingError(Exception):
+    """Raised when a kernel cannot be traced ahead of the simulation."""
+
+
+class DeferredMeasurement:
+    """Placeholder for the outcome of a measurement that has not been sampled yet."""
+
+    __slots__ = ("index", "measurement_id")
+
+    def __init__(self, index: int):
+        self.index = index
+        """The position of the result among the traced measurement outcomes."""
+        self.measurement_id = -1
+
+    def _classical_use(self, *args, **kwargs):
+        raise TracingError("measurement result is used for classical computation")
+
+    __bool__ = __int__ = __index__ = __float__ = __hash__ = _classical_use
+    __eq__ = __ne__ = __lt__ = __le__ = __gt__ = __ge__ = _classical_use  # type: ignore
+    __add__ = __radd__ = __sub__ = __rsub__ = __mul__ = __rmul__ = _classical_use
+    __and__ = __rand__ = __or__ = __ror__ = __xor__ = __rxor__ = _classical_use
+    __invert__ = __neg__ = _classical_use
+
+    def __repr__(self) -> str:
+        return f"DeferredMeasurement({self.index})"
+
+
+class _GuardedRNG:
+    """Reject any use of the random number generator."""
+
+    def __getattr__(self, name: str):
+        raise TracingError("kernel samples random numbers")
+
+
+@dataclass
+class DeferredMeasurementTracer(PyQrackInterpreter[MemoryType], Generic[MemoryType]):
+    """Base interpreter for tracing a kernel whose measurement results are deferred.
+
+    Subclasses wrap the simulator register in `initialize` and return
+    `DeferredMeasurement` placeholders from `measure_qubit`.
+    """
+
+    rng_state: Any = field(default_factory=_GuardedRNG, kw_only=True)
+
+    def frame_eval(self, frame: interp.Frame, node: ir.Statement):
+        # NOTE: CRegEq compares by identity, so placeholders would not raise
+        if isinstance(node, core.CRegEq):
+            raise TracingError("classical register is used in a condition")
+
+        return super().frame_eval(frame, node)
+
+
+class _GuardedSimulator:
+    """Forward simulator calls until the first deferred measurement."""
+
+    COLLAPSING_METHODS = frozenset(
+        ("m", "m_all", "force_m", "measure_pauli", "measure_shots")
+    )
+
+    def __init__(self, sim_reg, tracer: "TerminalMeasurementTracer"):
+        self._sim_reg = sim_reg
+        self._tracer = tracer
+
+    def __getattr__(self, name: str):
+        if name in self.COLLAPSING_METHODS:
+            raise TracingError(f"kernel collapses the state via `{name}`")
+
+        if self._tracer.addrs:
+            raise TracingError(
+                f"simulator method `{name}` is called after a measurement"
+            )
+
+        return getattr(self._sim_reg, name)
+
+
+@dataclass
+class TerminalMeasurementTracer(DeferredMeasurementTracer[MemoryType]):
+    """Interpreter that defers all measurements to the end of the kernel."""
+
+    addrs: dict[int, int] = field(init=False, default_factory=dict)
+    """Map from the address of each measured qubit to its position in the sample."""
+
+    def initialize(self):
+        super().initialize()
+        self.addrs = {}
+        self.memory.sim_reg = _GuardedSimulator(self.memory.sim_reg, self)  # type: ignore
+        return self
+
+    def measure_qubit(self, qbit: PyQrackQubit):  # type: ignore
+        if not qbit.is_active():
+            return super().measure_qubit(qbit)
+
+        index = self.addrs.setdefault(qbit.addr, len(self.addrs))
+        return DeferredMeasurement(index)
+
+
+def _substitute(data, bits: tuple[MeasurementResultValue, ...]):
+    if isinstance(data, DeferredMeasurement):
+        return bits[data.index]
+    elif isinstance(data, (list, tuple, IList)):
+        return tuple(_substitute(item, bits) for item in data)
+
+    return data
+
+
+def sample_terminal(
+    kernel: ir.Method,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    pyqrack_interp: PyQrackInterpreter[MemoryType],
+    shots: int,
+) -> Counter | None:
+    """Sample a kernel from its final state if all its measurements are terminal.
+
+    Args:
+        kernel (ir.Method): The kernel to sample.
+        args (tuple[Any, ...]): Positional arguments passed to the kernel.
+        kwargs (dict[str, Any]): Keyword arguments passed to the kernel.
+        pyqrack_interp (PyQrackInterpreter): The interpreter of the task, used for
+            its memory and options.
+        shots (int): The number of shots to draw.
+
+    Returns:
+        Counter | None: The number of occurrences of each (hashable) outcome, with
+            lists converted to tuples, or None if the kernel has measurements that
+            are not terminal and has to be interpreted shot by shot.
+
+    """
+    memory = pyqrack_interp.memory
+    tracer = TerminalMeasurementTracer(
+        kernel.dialects,
+        memory=memory,
+        loss_m_result=pyqrack_interp.loss_m_result,
+    )
+
+    try:
+        _, ret = tracer.run(kernel, *args, **kwargs)
+        sim_reg = memory.sim_reg._sim_reg  # type: ignore
+
+        if not tracer.addrs:
+            return Counter({_substitute(ret, ()): shots})
+
+        samples = Counter(sim_reg.measure_shots(list(tracer.addrs), shots))
+        counts: Counter = Counter()
+        for sample, count in samples.items():
+            bits = tuple(
+                MeasurementResultValue((sample >> i) & 1)
+                for i in range(len(tracer.addrs))
+            )
+            counts[_substitute(ret, bits)] += count
+
+        return counts
+    except TracingError:
+        return None
+    finally:
+        if isinstance(memory.sim_reg, _GuardedSimulator):
+            memory.sim_reg = memory.sim_reg._sim_reg
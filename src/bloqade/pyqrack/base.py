@@ -8,7 +8,7 @@ from kirin.interp import Interpreter
 from typing_extensions import Self
 from kirin.interp.exceptions import InterpreterError
 
-from bloqade.pyqrack.reg import MeasurementResultValue
+from bloqade.pyqrack.reg import PyQrackQubit, MeasurementResultValue
 
 if typing.TYPE_CHECKING:
     from pyqrack import QrackSimulator
@@ -159,3 +159,19 @@ class PyQrackInterpreter(Interpreter, typing.Generic[MemoryType]):
     def set_global_measurement_id(self, m: MeasurementResultValue):
         m.measurement_id = self.global_measurement_id
         self.global_measurement_id += 1
+
+    def measure_qubit(self, qbit: PyQrackQubit) -> MeasurementResultValue:
+        """Measure a single qubit in the computational basis.
+
+        Args:
+            qbit (PyQrackQubit): The qubit to measure.
+
+        Returns:
+            MeasurementResultValue: The measurement outcome, or `loss_m_result`
+                if the qubit has been lost.
+
+        """
+        if qbit.is_active():
+            return MeasurementResultValue(bool(qbit.sim_reg.m(qbit.addr)))
+
+        return MeasurementResultValue(self.loss_m_result)
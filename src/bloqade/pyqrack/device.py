@@ -1,3 +1,4 @@
+import weakref
 from typing import Any, TypeVar, ParamSpec, NamedTuple
 from dataclasses import field, dataclass
 
@@ -18,6 +19,7 @@ from bloqade.pyqrack.base import (
 )
 from bloqade.pyqrack.task import PyQrackSimulatorTask
 from pyqrack.qrack_simulator import QrackSimulator
+from bloqade.analysis.fingerprint import method_fingerprint
 from bloqade.analysis.address.lattice import UnknownReg, UnknownQubit
 from bloqade.analysis.address.analysis import AddressAnalysis
 
@@ -25,6 +27,12 @@ RetType = TypeVar("RetType")
 Params = ParamSpec("Params")
 
 
+class _AnalysisCacheEntry(NamedTuple):
+    fingerprint: tuple
+    qubit_count: int
+    all_resolved: bool
+
+
 class QuantumState(NamedTuple):
     """
     A representation of a quantum state as a density matrix, where the density matrix is
@@ -331,6 +339,46 @@ class StackMemorySimulator(PyQrackSimulatorBase):
 
     min_qubits: int = field(default=0, kw_only=True)
 
+    analysis_cache_hits: int = field(default=0, init=False, repr=False)
+    """Number of `task` calls that reused a cached address analysis."""
+    analysis_cache_misses: int = field(default=0, init=False, repr=False)
+    """Number of `task` calls that had to run the address analysis."""
+    _analysis_cache: weakref.WeakKeyDictionary[ir.Method, _AnalysisCacheEntry] = field(
+        default_factory=weakref.WeakKeyDictionary,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def _address_analysis(self, kernel: ir.Method) -> _AnalysisCacheEntry:
+        # NOTE: only the results needed by `task` are cached, the frame itself
+        # refers to the kernel and would keep the weak key alive
+        fingerprint = method_fingerprint(kernel)
+        entry = self._analysis_cache.get(kernel)
+        if entry is not None and entry.fingerprint == fingerprint:
+            self.analysis_cache_hits += 1
+            return entry
+
+        self.analysis_cache_misses += 1
+        address_analysis = AddressAnalysis(dialects=kernel.dialects)
+        frame, _ = address_analysis.run(kernel)
+        entry = _AnalysisCacheEntry(
+            fingerprint=fingerprint,
+            qubit_count=address_analysis.qubit_count,
+            all_resolved=not any(
+                isinstance(a, (UnknownQubit, UnknownReg))
+                for a in frame.entries.values()
+            ),
+        )
+        self._analysis_cache[kernel] = entry
+        return entry
+
+    def clear_analysis_cache(self):
+        """Clear the cached address analysis results and reset the counters."""
+        self._analysis_cache.clear()
+        self.analysis_cache_hits = 0
+        self.analysis_cache_misses = 0
+
     def task(
         self,
         kernel: ir.Method[Params, RetType],
@@ -354,16 +402,13 @@ class StackMemorySimulator(PyQrackSimulatorBase):
         if kwargs is None:
             kwargs = {}
 
-        address_analysis = AddressAnalysis(dialects=kernel.dialects)
-        frame, _ = address_analysis.run(kernel)
-        if self.min_qubits == 0 and any(
-            isinstance(a, (UnknownQubit, UnknownReg)) for a in frame.entries.values()
-        ):
+        analysis = self._address_analysis(kernel)
+        if self.min_qubits == 0 and not analysis.all_resolved:
             raise ValueError(
                 "All addresses must be resolved. Or set min_qubits to a positive integer."
             )
 
-        num_qubits = max(address_analysis.qubit_count, self.min_qubits)
+        num_qubits = max(analysis.qubit_count, self.min_qubits)
         options = self.options.copy()
         options["qubitCount"] = num_qubits
         memory = StackMemory(
@@ -0,0 +1,166 @@
+"""Fusion of single-qubit gates on a PyQrack tape.
+
+Most gates are applied by one or several calls to the simulator per qubit, e.g.
+a `PhasedXZ` gate is three rotations, so a run of single-qubit gates on a qubit
+crosses the Python/C boundary once per gate and per rotation. Since a tape (see
+`bloqade.pyqrack.tape`) holds the simulator calls of a kernel with their
+concrete arguments, consecutive single-qubit calls on the same qubit can be
+multiplied into a 2x2 matrix ahead of time and applied with a single `mtrx`
+call instead.
+
+A gate that is diagonal on a qubit, e.g. the controls of a controlled gate or
+both qubits of a CZ, commutes with a pending diagonal matrix on that qubit, so
+diagonal gates on both sides of it (`S`, `T`, `Rz`, ...) are merged too.
+
+Matrices are fused up to a global phase, which PyQrack does not track anyway.
+"""
+
+import math
+import cmath
+from typing import Any, Callable, Iterable
+
+import numpy as np
+
+from pyqrack import Pauli, QrackSimulator
+from bloqade.pyqrack.tape import Tape, Instruction
+
+Matrix = np.ndarray
+
+_PAULI_MATRICES: dict[int, Matrix] = {
+    Pauli.PauliI: np.eye(2, dtype=complex),
+    Pauli.PauliX: np.array([[0, 1], [1, 0]], dtype=complex),
+    Pauli.PauliY: np.array([[0, -1j], [1j, 0]], dtype=complex),
+    Pauli.PauliZ: np.array([[1, 0], [0, -1]], dtype=complex),
+}
+
+_FIXED_GATES: dict[str, Matrix] = {
+    "h": np.array([[1, 1], [1, -1]], dtype=complex) / math.sqrt(2),
+    "x": _PAULI_MATRICES[Pauli.PauliX],
+    "y": _PAULI_MATRICES[Pauli.PauliY],
+    "z": _PAULI_MATRICES[Pauli.PauliZ],
+    "s": np.diag([1, 1j]),
+    "adjs": np.diag([1, -1j]),
+    "t": np.diag([1, cmath.exp(1j * math.pi / 4)]),
+    "adjt": np.diag([1, cmath.exp(-1j * math.pi / 4)]),
+}
+
+
+def _rotation(axis: int, angle: float) -> Matrix:
+    return math.cos(angle / 2) * np.eye(2) - 1j * math.sin(angle / 2) * (
+        _PAULI_MATRICES[axis]
+    )
+
+
+def _u3(theta: float, phi: float, lam: float) -> Matrix:
+    cos, sin = math.cos(theta / 2), math.sin(theta / 2)
+    return np.array(
+        [
+            [cos, -cmath.exp(1j * lam) * sin],
+            [cmath.exp(1j * phi) * sin, cmath.exp(1j * (phi + lam)) * cos],
+        ]
+    )
+
+
+def _single_qubit_gate(
+    name: str | None, args: tuple[Any, ...]
+) -> tuple[int, Matrix] | None:
+    """The qubit and the matrix of a single-qubit gate, or None for other calls."""
+    if name in _FIXED_GATES:
+        (qubit,) = args
+        return qubit, _FIXED_GATES[name]
+    elif name == "r":
+        axis, angle, qubit = args
+        return qubit, _rotation(axis, angle)
+    elif name == "u":
+        qubit, theta, phi, lam = args
+        return qubit, _u3(theta, phi, lam)
+    elif name == "mtrx":
+        matrix, qubit = args
+        return qubit, np.reshape(np.asarray(matrix, dtype=complex), (2, 2))
+
+    return None
+
+
+_MULTI_QUBIT_GATES: dict[
+    str, Callable[[tuple[Any, ...]], tuple[Iterable[int], Iterable[int]]]
+] = {
+    # NOTE: the qubits on which the gate is diagonal, and the other ones
+    "mcx": lambda args: (args[0], (args[1],)),
+    "mcy": lambda args: (args[0], (args[1],)),
+    "mcz": lambda args: ((*args[0], args[1]), ()),
+    "mcu": lambda args: (args[0], (args[1],)),
+    "mcmtrx": lambda args: (args[0], (args[2],)),
+    "mcr": lambda args: (
+        ((*args[2], args[3]), ())
+        if args[0] in (Pauli.PauliI, Pauli.PauliZ)
+        else (args[2], (args[3],))
+    ),
+    "swap": lambda args: ((), args),
+    "cswap": lambda args: (args[0], args[1:]),
+    "m": lambda args: ((), args),
+}
+
+
+def _is_diagonal(matrix: Matrix) -> bool:
+    return abs(matrix[0, 1]) < 1e-12 and abs(matrix[1, 0]) < 1e-12
+
+
+def fuse_gates(tape: Tape) -> Tape:
+    """Fuse the runs of single-qubit gates on each qubit of a tape.
+
+    Args:
+        tape (Tape): The tape to optimize.
+
+    Returns:
+        Tape: A tape with the same effect up to a global phase, in which each
+            run of single-qubit gates on a qubit is a single `mtrx` call. Runs
+            of a single gate are left as they are.
+
+    """
+    instructions: list[Instruction] = []
+    # NOTE: the product of the gates not applied yet on each qubit, with the gates
+    pending: dict[int, tuple[Matrix, list[Instruction]]] = {}
+
+    def flush(qubit: int):
+        if (run := pending.pop(qubit, None)) is None:
+            return
+
+        matrix, gates = run
+        if len(gates) == 1:
+            instructions.extend(gates)
+        elif not np.allclose(matrix, matrix[0, 0] * np.eye(2), rtol=0, atol=1e-12):
+            instructions.append(
+                (QrackSimulator.mtrx, (matrix.reshape(-1).tolist(), qubit), False)
+            )
+
+    for instruction in tape.instructions:
+        method, args, _ = instruction
+        name = getattr(method, "__name__", None)
+
+        if (gate := _single_qubit_gate(name, args)) is not None:
+            qubit, matrix = gate
+            if (run := pending.get(qubit)) is None:
+                pending[qubit] = (matrix, [instruction])
+            else:
+                run[1].append(instruction)
+                pending[qubit] = (matrix @ run[0], run[1])
+            continue
+
+        if (qubits := _MULTI_QUBIT_GATES.get(name)) is None:
+            # NOTE: unknown calls may touch any qubit
+            for qubit in list(pending):
+                flush(qubit)
+        else:
+            diagonal, other = qubits(args)
+            for qubit in diagonal:
+                if (run := pending.get(qubit)) is not None and not _is_diagonal(run[0]):
+                    flush(qubit)
+            for qubit in other:
+                flush(qubit)
+
+        instructions.append(instruction)
+
+    for qubit in list(pending):
+        flush(qubit)
+
+    return Tape(tuple(instructions), tape.result)
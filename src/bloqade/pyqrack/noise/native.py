@@ -1,5 +1,6 @@
 from typing import List
 
+import numpy as np
 from kirin import interp
 
 from bloqade.pyqrack import PyQrackInterpreter, reg
@@ -8,24 +9,28 @@ from bloqade.qasm2.dialects import noise
 
 @noise.dialect.register(key="pyqrack")
 class PyQrackMethods(interp.MethodTable):
-    def apply_pauli_error(
+    pauli_choices = ("i", "x", "y", "z")
+
+    def apply_pauli_errors(
         self,
         interp: PyQrackInterpreter,
-        qarg: reg.PyQrackQubit,
+        qargs: List[reg.PyQrackQubit],
         px: float,
         py: float,
         pz: float,
     ):
+        if len(qargs) == 0:
+            return
+
         p = [1 - (px + py + pz), px, py, pz]
 
         assert all(0 <= x <= 1 for x in p), "Invalid Pauli error probabilities"
 
-        which = interp.rng_state.choice(["i", "x", "y", "z"], p=p)
-
-        if which == "i":
-            return
-
-        getattr(qarg.sim_reg, which)(qarg.addr)
+        # NOTE: draw the errors of all qubits at once and skip the identities
+        which = interp.rng_state.choice(len(p), size=len(qargs), p=p)
+        for i in np.flatnonzero(which):
+            qarg = qargs[i]
+            getattr(qarg.sim_reg, self.pauli_choices[which[i]])(qarg.addr)
 
     @interp.impl(noise.PauliChannel)
     def single_qubit_error_channel(
@@ -36,10 +41,8 @@ class PyQrackMethods(interp.MethodTable):
     ):
         qargs: List[reg.PyQrackQubit] = frame.get(stmt.qargs)
 
-        active_qubits = (qarg for qarg in qargs if qarg.is_active())
-
-        for qarg in active_qubits:
-            self.apply_pauli_error(interp, qarg, stmt.px, stmt.py, stmt.pz)
+        active_qubits = [qarg for qarg in qargs if qarg.is_active()]
+        self.apply_pauli_errors(interp, active_qubits, stmt.px, stmt.py, stmt.pz)
 
         return ()
 
@@ -55,28 +58,27 @@ class PyQrackMethods(interp.MethodTable):
         ctrls: List[reg.PyQrackQubit] = frame.get(stmt.ctrls)
 
         if stmt.paired:
-            valid_pairs = (
+            valid_pairs = [
                 (ctrl, qarg)
                 for ctrl, qarg in zip(ctrls, qargs)
                 if ctrl.is_active() and qarg.is_active()
-            )
+            ]
         else:
-            valid_pairs = (
+            valid_pairs = [
                 (ctrl, qarg)
                 for ctrl, qarg in zip(ctrls, qargs)
                 if ctrl.is_active() ^ qarg.is_active()
-            )
+            ]
 
-        for ctrl, qarg in valid_pairs:
-            if ctrl.is_active():
-                self.apply_pauli_error(
-                    interp, ctrl, stmt.px_ctrl, stmt.py_ctrl, stmt.pz_ctrl
-                )
+        active_ctrls = [ctrl for ctrl, _ in valid_pairs if ctrl.is_active()]
+        active_qargs = [qarg for _, qarg in valid_pairs if qarg.is_active()]
 
-            if qarg.is_active():
-                self.apply_pauli_error(
-                    interp, qarg, stmt.px_qarg, stmt.py_qarg, stmt.pz_qarg
-                )
+        self.apply_pauli_errors(
+            interp, active_ctrls, stmt.px_ctrl, stmt.py_ctrl, stmt.pz_ctrl
+        )
+        self.apply_pauli_errors(
+            interp, active_qargs, stmt.px_qarg, stmt.py_qarg, stmt.pz_qarg
+        )
 
         return ()
 
@@ -89,11 +91,12 @@ class PyQrackMethods(interp.MethodTable):
     ):
         qargs: List[reg.PyQrackQubit] = frame.get(stmt.qargs)
 
-        active_qubits = (qarg for qarg in qargs if qarg.is_active())
+        active_qubits = [qarg for qarg in qargs if qarg.is_active()]
 
-        for qarg in active_qubits:
-            if interp.rng_state.uniform() <= stmt.prob:
-                qarg.sim_reg.m(qarg.addr)
-                qarg.drop()
+        lost = interp.rng_state.uniform(size=len(active_qubits)) <= stmt.prob
+        for i in np.flatnonzero(lost):
+            qarg = active_qubits[i]
+            qarg.sim_reg.m(qarg.addr)
+            qarg.drop()
 
         return ()
@@ -9,7 +9,6 @@ from bloqade.pyqrack.reg import (
     CRegister,
     QubitState,
     PyQrackQubit,
-    MeasurementResultValue,
 )
 from bloqade.pyqrack.base import PyQrackInterpreter
 from bloqade.qasm2.dialects import core
@@ -59,17 +58,10 @@ class PyQrackMethods(interp.MethodTable):
         carg: CBitRef | CRegister = frame.get(stmt.carg)
 
         if isinstance(qarg, PyQrackQubit) and isinstance(carg, CBitRef):
-            if qarg.is_active():
-                carg.set_value(MeasurementResultValue(qarg.sim_reg.m(qarg.addr)))
-            else:
-                carg.set_value(interp.loss_m_result)
+            carg.set_value(interp.measure_qubit(qarg))
         elif isinstance(qarg, ilist.IList) and isinstance(carg, CRegister):
             for i, qubit in enumerate(qarg):
-                cbit = CBitRef(carg, i)
-                if qubit.is_active():
-                    cbit.set_value(MeasurementResultValue(qubit.sim_reg.m(qubit.addr)))
-                else:
-                    cbit.set_value(interp.loss_m_result)
+                CBitRef(carg, i).set_value(interp.measure_qubit(qubit))
         else:
             raise InterpreterError(
                 f"Expected measure call on either a single qubit and classical bit, or two registers, but got the types {type(qarg)} and {type(carg)}"
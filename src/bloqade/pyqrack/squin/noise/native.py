@@ -1,3 +1,4 @@
+import numpy as np
 from kirin import interp
 
 from bloqade.pyqrack import PyQrackQubit, PyQrackInterpreter
@@ -85,9 +86,9 @@ class PyQrackMethods(interp.MethodTable):
     ):
         p = frame.get(stmt.p)
         qubits: list[PyQrackQubit] = frame.get(stmt.qubits)
-        for qbit in qubits:
-            if interp.rng_state.uniform(0.0, 1.0) <= p:
-                qbit.drop()
+        lost = interp.rng_state.uniform(0.0, 1.0, size=len(qubits)) <= p
+        for i in np.flatnonzero(lost):
+            qubits[i].drop()
 
     @interp.impl(CorrelatedQubitLoss)
     def correlated_qubit_loss(
@@ -95,10 +96,10 @@ class PyQrackMethods(interp.MethodTable):
     ):
         p = frame.get(stmt.p)
         qubits: list[list[PyQrackQubit]] = frame.get(stmt.qubits)
-        for qubit_group in qubits:
-            if interp.rng_state.uniform(0.0, 1.0) <= p:
-                for qbit in qubit_group:
-                    qbit.drop()
+        lost = interp.rng_state.uniform(0.0, 1.0, size=len(qubits)) <= p
+        for i in np.flatnonzero(lost):
+            for qbit in qubits[i]:
+                qbit.drop()
 
     def apply_single_qubit_pauli_error(
         self,
@@ -111,9 +112,10 @@ class PyQrackMethods(interp.MethodTable):
 
         assert all(0 <= x <= 1 for x in probs), "Invalid Pauli error probabilities"
 
-        for qbit in qubits:
-            which = interp.rng_state.choice(self.single_pauli_choices, p=probs)
-            self.apply_pauli_error(which, qbit)
+        # NOTE: draw the errors of all qubits at once and skip the identities
+        which = interp.rng_state.choice(len(probs), size=len(qubits), p=probs)
+        for i in np.flatnonzero(which):
+            self.apply_pauli_error(self.single_pauli_choices[which[i]], qubits[i])
 
     def apply_two_qubit_pauli_error(
         self,
@@ -126,10 +128,12 @@ class PyQrackMethods(interp.MethodTable):
         probs = [pii] + ps
         assert all(0 <= x <= 1 for x in probs), "Invalid Pauli error probabilities"
 
-        for control, target in zip(controls, targets):
-            which = interp.rng_state.choice(self.two_pauli_choices, p=probs)
-            self.apply_pauli_error(which[0], control)
-            self.apply_pauli_error(which[1], target)
+        # NOTE: draw the errors of all pairs at once and skip the identities
+        which = interp.rng_state.choice(len(probs), size=len(controls), p=probs)
+        for i in np.flatnonzero(which):
+            paulis = self.two_pauli_choices[which[i]]
+            self.apply_pauli_error(paulis[0], controls[i])
+            self.apply_pauli_error(paulis[1], targets[i])
 
     def apply_pauli_error(self, which: str, qbit: PyQrackQubit):
         if not qbit.is_active() or which == "i":
@@ -19,11 +19,7 @@ class PyQrackMethods(interp.MethodTable):
         return (qb,)
 
     def _measure_qubit(self, qbit: PyQrackQubit, interp: PyQrackInterpreter):
-        if qbit.is_active():
-            m = MeasurementResultValue(bool(qbit.sim_reg.m(qbit.addr)))
-        else:
-            m = MeasurementResultValue(interp.loss_m_result)
-
+        m = interp.measure_qubit(qbit)
         interp.set_global_measurement_id(m)
         return m
 
@@ -0,0 +1,197 @@
+"""Straight-line tape compilation for the PyQrack backend.
+
+A kernel whose sequence of simulator calls does not depend on measurement outcomes
+or random numbers can be compiled into a `Tape`: a flat list of unbound
+`QrackSimulator` methods together with their pre-computed arguments (qubit
+addresses, angles in radians, ...). Replaying the tape on a fresh simulator is
+equivalent to interpreting the kernel, without the overhead of the interpreter.
+
+The tape is recorded by running the kernel once with `TapeRecorder`, which forwards
+every simulator call to a real simulator while recording it. Measurements are
+recorded as tape instructions and return `DeferredMeasurement` placeholders, so
+mid-circuit measurements are supported as long as their results are not used for
+classical computation or control flow.
+"""
+
+import copy
+from typing import Any, Generic, TypeVar, Callable
+from dataclasses import field, dataclass
+
+from kirin import ir
+from kirin.dialects.ilist import IList
+
+from bloqade.pyqrack.reg import PyQrackQubit, MeasurementResultValue
+from bloqade.pyqrack.base import MemoryABC, PyQrackInterpreter
+from bloqade.pyqrack._sampling import (
+    TracingError,
+    DeferredMeasurement,
+    DeferredMeasurementTracer,
+)
+
+MemoryType = TypeVar("MemoryType", bound=MemoryABC)
+
+Instruction = tuple[Callable[..., Any], tuple[Any, ...], bool]
+"""A tape instruction: unbound simulator method, arguments, whether it measures."""
+
+
+class _RecordingSimulator:
+    """Forward simulator calls to a simulator register and record them on a tape."""
+
+    COLLAPSING_METHODS = frozenset(("m_all", "force_m", "measure_pauli"))
+    STATE_INDEPENDENT_QUERIES = frozenset(("num_qubits",))
+
+    def __init__(self, sim_reg, recorder: "TapeRecorder"):
+        self._sim_reg = sim_reg
+        self._recorder = recorder
+
+    def __getattr__(self, name: str):
+        # NOTE: measurements are recorded by `TapeRecorder.measure_qubit`
+        if name == "m" or name in self.COLLAPSING_METHODS:
+            raise TracingError(f"kernel collapses the state via `{name}`")
+
+        method = getattr(self._sim_reg, name)
+        unbound = getattr(type(self._sim_reg), name, None)
+        if not callable(unbound):
+            raise TracingError(f"cannot record simulator attribute `{name}`")
+
+        def record(*args):
+            ret = method(*args)
+            if ret is None:
+                self._recorder.instructions.append((unbound, args, False))
+            elif (
+                self._recorder.measurement_count
+                and name not in self.STATE_INDEPENDENT_QUERIES
+            ):
+                raise TracingError(
+                    f"simulator query `{name}` depends on a measurement outcome"
+                )
+            return ret
+
+        return record
+
+
+@dataclass
+class TapeRecorder(DeferredMeasurementTracer[MemoryType], Generic[MemoryType]):
+    """Interpreter that records the simulator calls of a kernel on a tape."""
+
+    instructions: list[Instruction] = field(init=False, default_factory=list)
+    measurement_count: int = field(init=False, default=0)
+
+    def initialize(self):
+        super().initialize()
+        self.instructions = []
+        self.measurement_count = 0
+        self.memory.sim_reg = _RecordingSimulator(self.memory.sim_reg, self)  # type: ignore
+        return self
+
+    def measure_qubit(self, qbit: PyQrackQubit):  # type: ignore
+        if not qbit.is_active():
+            return super().measure_qubit(qbit)
+
+        sim_reg: _RecordingSimulator = self.memory.sim_reg  # type: ignore
+        self.instructions.append((type(sim_reg._sim_reg).m, (qbit.addr,), True))
+        self.measurement_count += 1
+        return DeferredMeasurement(self.measurement_count - 1)
+
+
+_REPLAYABLE_TYPES = (
+    DeferredMeasurement,
+    MeasurementResultValue,
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    type(None),
+)
+
+
+def _check_result(data):
+    if isinstance(data, (list, tuple, IList)):
+        for item in data:
+            _check_result(item)
+    elif not isinstance(data, _REPLAYABLE_TYPES):
+        raise TracingError(f"cannot replay a kernel returning {type(data).__name__}")
+
+
+def _rebuild(data, outcomes: list[MeasurementResultValue]):
+    if isinstance(data, DeferredMeasurement):
+        return outcomes[data.index]
+    elif isinstance(data, IList):
+        return IList([_rebuild(item, outcomes) for item in data])
+    elif isinstance(data, list):
+        # NOTE: preserve subclasses such as CRegister
+        result = copy.copy(data)
+        result[:] = [_rebuild(item, outcomes) for item in data]
+        return result
+    elif isinstance(data, tuple):
+        return tuple(_rebuild(item, outcomes) for item in data)
+
+    return data
+
+
+@dataclass(frozen=True)
+class Tape:
+    """A straight-line recording of the simulator calls of a kernel."""
+
+    instructions: tuple[Instruction, ...]
+    """The recorded instructions, in order."""
+    result: Any
+    """The value returned by the kernel, with `DeferredMeasurement` placeholders."""
+
+    def replay(self, sim_reg) -> Any:
+        """Replay the tape on a simulator register.
+
+        Args:
+            sim_reg (QrackSimulator): A freshly initialized simulator register.
+
+        Returns:
+            Any: The value returned by the kernel for this shot.
+
+        """
+        outcomes: list[MeasurementResultValue] = []
+        for method, args, is_measurement in self.instructions:
+            ret = method(sim_reg, *args)
+            if is_measurement:
+                outcomes.append(MeasurementResultValue(bool(ret)))
+
+        return _rebuild(self.result, outcomes)
+
+
+def compile_tape(
+    kernel: ir.Method,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    pyqrack_interp: PyQrackInterpreter[MemoryType],
+) -> Tape | None:
+    """Compile a kernel into a straight-line tape of simulator calls.
+
+    Args:
+        kernel (ir.Method): The kernel to compile.
+        args (tuple[Any, ...]): Positional arguments passed to the kernel.
+        kwargs (dict[str, Any]): Keyword arguments passed to the kernel.
+        pyqrack_interp (PyQrackInterpreter): The interpreter of the task, used for
+            its memory and options.
+
+    Returns:
+        Tape | None: The compiled tape, or None if the simulator calls of the kernel
+            depend on measurement outcomes or random numbers, or if the kernel
+            returns values that cannot be rebuilt from the tape (e.g. qubits).
+
+    """
+    memory = pyqrack_interp.memory
+    recorder = TapeRecorder(
+        kernel.dialects,
+        memory=memory,
+        loss_m_result=pyqrack_interp.loss_m_result,
+    )
+
+    try:
+        _, ret = recorder.run(kernel, *args, **kwargs)
+        _check_result(ret)
+        return Tape(tuple(recorder.instructions), ret)
+    except TracingError:
+        return None
+    finally:
+        if isinstance(memory.sim_reg, _RecordingSimulator):
+            memory.sim_reg = memory.sim_reg._sim_reg
@@ -13,6 +13,7 @@ from bloqade.pyqrack.base import (
     _default_pyqrack_args,
 )
 from bloqade.analysis.address import UnknownQubit, AddressAnalysis
+from bloqade.analysis.manager import AnalysisManager
 
 Params = ParamSpec("Params")
 RetType = TypeVar("RetType")
@@ -31,6 +32,10 @@ class PyQrack:
 
     pyqrack_options: PyQrackOptions = field(default_factory=_default_pyqrack_args)
     """Options to pass to the QrackSimulator object, node `qubitCount` will be overwritten."""
+    analysis_manager: AnalysisManager = field(
+        default_factory=AnalysisManager, repr=False, compare=False
+    )
+    """Cache of the address analysis of the kernels run on the target."""
 
     def __post_init__(self):
         warn(
@@ -50,8 +55,7 @@ class PyQrack:
             options["qubitCount"] = -1
             return PyQrackInterpreter(mt.dialects, memory=DynamicMemory(options))
         else:
-            address_analysis = AddressAnalysis(mt.dialects)
-            frame, _ = address_analysis.run(mt)
+            address_analysis, frame, _ = self.analysis_manager.run(AddressAnalysis, mt)
             if self.min_qubits == 0 and any(
                 isinstance(a, UnknownQubit) for a in frame.entries.values()
             ):
@@ -59,7 +63,7 @@ class PyQrack:
                     "All addresses must be resolved. Or set min_qubits to a positive integer."
                 )
 
-            num_qubits = max(address_analysis.qubit_count, self.min_qubits)
+            num_qubits = max(address_analysis.qubit_count, self.min_qubits)  # type: ignore
             options = self.pyqrack_options.copy()
             options["qubitCount"] = num_qubits
             memory = StackMemory(
@@ -86,7 +90,7 @@ class PyQrack:
 
         """
         fold = Fold(mt.dialects)
-        fold(mt)
+        self.analysis_manager.update(mt, fold(mt))
         _, ret = self._get_interp(mt).run(mt, *args, **kwargs)
         return ret
 
@@ -110,7 +114,7 @@ class PyQrack:
 
         """
         fold = Fold(mt.dialects)
-        fold(mt)
+        self.analysis_manager.update(mt, fold(mt))
 
         interpreter = self._get_interp(mt)
         batched_results = []
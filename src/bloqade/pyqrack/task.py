@@ -1,6 +1,9 @@
+import warnings
+import multiprocessing
 from typing import TypeVar, ParamSpec, cast
 from collections import Counter
 from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 from kirin.dialects.ilist import IList
@@ -11,12 +14,44 @@ from bloqade.pyqrack.base import (
     MemoryABC,
     PyQrackInterpreter,
 )
+from bloqade.pyqrack.tape import Tape, compile_tape
+from bloqade.pyqrack.fusion import fuse_gates as fuse
+from bloqade.pyqrack._sampling import sample_terminal
 
 RetType = TypeVar("RetType")
 Param = ParamSpec("Param")
 MemoryType = TypeVar("MemoryType", bound=MemoryABC)
 
 
+def _can_fork() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _hashable(data):
+    # Convert IList to tuple so that it is hashable by Counter
+    if isinstance(data, (list, IList)):
+        return tuple(_hashable(item) for item in data)
+    return data
+
+
+_shot_worker_task: "PyQrackSimulatorTask | None" = None
+
+
+_shot_worker_tape: Tape | None = None
+
+
+def _init_shot_worker(task: "PyQrackSimulatorTask", tape: Tape | None):
+    global _shot_worker_task, _shot_worker_tape
+    _shot_worker_task = task
+    _shot_worker_tape = tape
+
+
+def _run_shot_worker(shots: int, seed: np.random.SeedSequence) -> Counter:
+    assert _shot_worker_task is not None, "shot worker is not initialized"
+    _shot_worker_task.pyqrack_interp.rng_state = np.random.default_rng(seed)
+    return _shot_worker_task._count_shots(shots, _shot_worker_tape)
+
+
 @dataclass
 class PyQrackSimulatorTask(AbstractSimulatorTask[Param, RetType, MemoryType]):
     """PyQrack simulator task for Bloqade."""
@@ -54,7 +89,15 @@ class PyQrackSimulatorTask(AbstractSimulatorTask[Param, RetType, MemoryType]):
             Warning("Task has not been run, there are no qubits!")
             return []
 
-    def batch_run(self, shots: int = 1) -> dict[RetType, float]:
+    def batch_run(
+        self,
+        shots: int = 1,
+        *,
+        terminal_sampling: bool = False,
+        workers: int = 1,
+        tape: bool = False,
+        fuse_gates: bool = False,
+    ) -> dict[RetType, float]:
         """
         Repeatedly run the task to collect statistics on the shot outcomes.
         The average is done over [shots] repetitions and thus is frequentist
@@ -63,27 +106,129 @@ class PyQrackSimulatorTask(AbstractSimulatorTask[Param, RetType, MemoryType]):
         Args:
             shots (int):
                 the number of repetitions of the task
+            terminal_sampling (bool):
+                if True and all measurements of the kernel are terminal (no gates,
+                resets, noise or classical control after a measurement), the kernel
+                is simulated only once and all shots are drawn from the final state.
+                Kernels that do not qualify fall back to running every shot.
+                Defaults to False.
+            workers (int):
+                the number of processes the shots are distributed over. Each worker
+                uses an independent random number generator seeded from the
+                `rng_state` of the task. Requires the `fork` start method, which
+                is not available on Windows, and the return values must be
+                picklable. Without `fork`, a warning is emitted and the shots are
+                run in the current process. Defaults to 1, i.e. the shots are run
+                in the current process.
+            tape (bool):
+                if True and the simulator calls of the kernel do not depend on
+                measurement outcomes or random numbers, the kernel is compiled once
+                into a straight-line tape of simulator calls which is replayed for
+                every shot. Kernels that do not qualify fall back to running every
+                shot. Defaults to False.
+            fuse_gates (bool):
+                if True, the runs of single-qubit gates on each qubit of the tape
+                are fused into a single matrix before the shots are run, see
+                `bloqade.pyqrack.fusion`. Only used with `tape=True`. Defaults to
+                False.
         Returns:
             dict[RetType, float]:
                 a dictionary mapping outcomes to their probabilities,
                 as estimated from counting the shot outcomes. RetType must be hashable.
         """
+        if workers < 1:
+            raise ValueError(f"workers must be a positive integer, got {workers}")
+
+        if shots <= 0:
+            return {}
+
+        counts = None
+        if terminal_sampling:
+            counts = sample_terminal(
+                self.kernel, self.args, self.kwargs, self.pyqrack_interp, shots
+            )
 
-        results: list[RetType] = [self.run() for _ in range(shots)]
+        compiled = (
+            self.compile_tape(fuse_gates=fuse_gates)
+            if tape and counts is None
+            else None
+        )
 
-        # Convert IList to tuple so that it is hashable by Counter
-        def convert(data):
-            if isinstance(data, (list, IList)):
-                return tuple(convert(item) for item in data)
-            return data
+        if workers > 1 and not _can_fork():
+            warnings.warn(
+                f"batch_run(workers={workers}) requires the 'fork' start method, "
+                "which is not available on this platform; running the shots in "
+                "the current process instead",
+                RuntimeWarning,
+                stacklevel=2,
+            )
+            workers = 1
 
-        results = convert(results)
+        if counts is None and workers > 1:
+            counts = self._count_shots_parallel(shots, workers, compiled)
+        elif counts is None:
+            counts = self._count_shots(shots, compiled)
 
         data = {
-            key: value / len(results) for key, value in Counter(results).items()
+            key: value / shots for key, value in counts.items()
         }  # Normalize to probabilities
         return data
 
+    def compile_tape(self, fuse_gates: bool = False) -> Tape | None:
+        """Compile the task into a straight-line tape of simulator calls.
+
+        Args:
+            fuse_gates (bool):
+                if True, fuse the runs of single-qubit gates on each qubit of the
+                tape, see `bloqade.pyqrack.fusion`. Defaults to False.
+
+        Returns:
+            Tape | None:
+                the compiled tape, or None if the simulator calls of the kernel
+                depend on measurement outcomes or random numbers.
+        """
+        tape = compile_tape(self.kernel, self.args, self.kwargs, self.pyqrack_interp)
+        if tape is not None and fuse_gates:
+            tape = fuse(tape)
+        return tape
+
+    def run_tape(self, tape: Tape) -> RetType:
+        """Run a shot by replaying a tape compiled from this task."""
+        self.state.reset()
+        return cast(RetType, tape.replay(self.state.sim_reg))
+
+    def _count_shots(self, shots: int, tape: Tape | None = None) -> Counter:
+        if tape is not None:
+            return Counter(_hashable(self.run_tape(tape)) for _ in range(shots))
+
+        return Counter(_hashable(self.run()) for _ in range(shots))
+
+    def _count_shots_parallel(
+        self, shots: int, workers: int, tape: Tape | None = None
+    ) -> Counter:
+        # NOTE: kernels cannot be pickled, so the task is inherited by forking
+        mp_context = multiprocessing.get_context("fork")
+        seed = self.pyqrack_interp.rng_state.integers(np.iinfo(np.int64).max)
+        seeds = np.random.SeedSequence(seed).spawn(workers)
+        shards = [shots // workers + (i < shots % workers) for i in range(workers)]
+
+        counts: Counter = Counter()
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=_init_shot_worker,
+            initargs=(self, tape),
+        ) as executor:
+            futures = [
+                executor.submit(_run_shot_worker, shard, seed)
+                for shard, seed in zip(shards, seeds)
+                if shard > 0
+            ]
+            for future in futures:
+                counts.update(future.result())
+
+        return counts
+
     def batch_state(
         self, shots: int = 1, qubit_map: None = None
     ) -> "QuantumState":  # noqa: F821
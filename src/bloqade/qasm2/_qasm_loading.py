@@ -12,6 +12,41 @@ from .groups import main
 from .parse.lowering import QASM2
 
 
+def _build_method(
+    frame: lowering.Frame,
+    dialects: ir.DialectGroup,
+    kernel_name: str,
+    returns: str | None,
+) -> ir.Method[[], None]:
+    if returns is not None:
+        return_value = frame.get(returns)
+        if return_value is None:
+            raise lowering.BuildError(f"Cannot find return value {returns}")
+    else:
+        return_value = func.ConstantNone()
+        frame.push(return_value)
+
+    return_node = frame.push(func.Return(value_or_stmt=return_value))
+
+    body = frame.curr_region
+    code = func.Function(
+        sym_name=kernel_name,
+        signature=func.Signature((), return_node.value.type),
+        body=body,
+    )
+
+    body.blocks[0].args.append_from(MethodType, kernel_name + "_self")
+
+    mt = ir.Method(
+        sym_name=kernel_name,
+        dialects=dialects,
+        code=code,
+    )
+
+    mt.verify()
+    return mt
+
+
 def loads(
     qasm: str,
     *,
@@ -66,33 +101,7 @@ def loads(
         compactify=compactify,
     )
 
-    if returns is not None:
-        return_value = frame.get(returns)
-        if return_value is None:
-            raise lowering.BuildError(f"Cannot find return value {returns}")
-    else:
-        return_value = func.ConstantNone()
-        frame.push(return_value)
-
-    return_node = frame.push(func.Return(value_or_stmt=return_value))
-
-    body = frame.curr_region
-    code = func.Function(
-        sym_name=kernel_name,
-        signature=func.Signature((), return_node.value.type),
-        body=body,
-    )
-
-    body.blocks[0].args.append_from(MethodType, kernel_name + "_self")
-
-    mt = ir.Method(
-        sym_name=kernel_name,
-        dialects=qasm2_lowering.dialects,
-        code=code,
-    )
-
-    mt.verify()
-    return mt
+    return _build_method(frame, qasm2_lowering.dialects, kernel_name, returns)
 
 
 def loadfile(
@@ -106,6 +115,7 @@ def loadfile(
     lineno_offset: int = 0,
     col_offset: int = 0,
     compactify: bool = True,
+    streaming: bool = False,
 ) -> ir.Method[[], None]:
     """Loads a QASM2 file and returns the corresponding kernel object. See also `loads`.
 
@@ -121,6 +131,11 @@ def loadfile(
         lineno_offset (int): The line number offset for error reporting. Defaults to 0.
         col_offset (int): The column number offset for error reporting. Defaults to 0.
         compactify (bool): Whether to compactify the output. Defaults to True.
+        streaming (bool): Whether to parse and lower the file incrementally, in
+            batches of statements, instead of reading the whole file and building
+            its full AST first. This bounds the memory used by very large files.
+            Note that line numbers in parse errors are then relative to the batch.
+            Defaults to False.
     """
     if isinstance(qasm_file, pathlib.Path):
         qasm_file_: pathlib.Path = qasm_file  # type: ignore
@@ -140,6 +155,19 @@ def loadfile(
         qasm_file_.name.replace(".qasm", "") if kernel_name is None else kernel_name
     )
 
+    if streaming:
+        qasm2_lowering = QASM2(dialects or main)
+        with qasm_file_.open("r") as f:
+            frame = qasm2_lowering.get_frame_from_stream(
+                parse.iter_programs(f),
+                file=file,
+                globals=globals,
+                lineno_offset=lineno_offset,
+                col_offset=col_offset,
+                compactify=compactify,
+            )
+        return _build_method(frame, qasm2_lowering.dialects, kernel_name, returns)
+
     with qasm_file_.open("r") as f:
         source = f.read()
 
@@ -4,6 +4,7 @@ from dataclasses import field, dataclass
 
 from kirin import ir, interp, idtable
 from kirin.emit import EmitABC, EmitFrame
+from kirin.emit.abc import EmitTable
 from kirin.worklist import WorkList
 from typing_extensions import Self
 
@@ -34,6 +35,10 @@ class EmitQASM2Base(
 
     def initialize(self) -> Self:
         super().initialize()
+        # NOTE: `EmitABC` shares these between all instances of a class, which
+        # would leak callable names from one kernel into the next
+        self.callables = EmitTable(prefix="")
+        self.callable_to_emit = WorkList()
         self.output: EmitNode | None = None
         self.ssa_id = idtable.IdTable[ir.SSAValue](
             prefix=self.prefix, prefix_if_none=self.prefix_if_none
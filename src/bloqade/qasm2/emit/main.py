@@ -1,4 +1,5 @@
-from typing import List, cast
+import weakref
+from typing import List, NamedTuple, cast
 from dataclasses import dataclass
 
 from kirin import ir, interp
@@ -9,6 +10,7 @@ from typing_extensions import Self
 from bloqade.qasm2.parse import ast
 from bloqade.qasm2.dialects.uop import SingleQubitGate, TwoQubitCtrlGate
 from bloqade.qasm2.dialects.expr import GateFunction
+from bloqade.analysis.fingerprint import method_fingerprint
 
 from .base import EmitQASM2Base, EmitQASM2Frame
 from ..dialects.core.stmts import Reset, Measure
@@ -21,12 +23,62 @@ class EmitQASM2Main(EmitQASM2Base[ast.Statement, ast.MainProgram]):
 
     def initialize(self) -> Self:
         super().initialize()
+        self.gate_methods: dict[GateFunction, ir.Method] = {}
         return self
 
     def eval_fallback(self, frame: EmitQASM2Frame, node: ir.Statement):
         return tuple(None for _ in range(len(node.results)))
 
 
+class _GateCacheEntry(NamedTuple):
+    fingerprint: tuple
+    dialects: frozenset[ir.Dialect]
+    gate: ast.Gate
+
+
+_gate_cache: "weakref.WeakKeyDictionary[ir.Method, _GateCacheEntry]" = (
+    weakref.WeakKeyDictionary()
+)
+"""Gate definitions emitted for each gate method, along with the fingerprint of the
+method and the dialects they were emitted with."""
+
+
+def _emit_gate(gate_emitter, node: GateFunction) -> ast.Gate | None:
+    with gate_emitter.eval_context():
+        with gate_emitter.new_frame(node, has_parent_access=False) as gate_frame:
+            gate_result = gate_emitter.frame_eval(gate_frame, node)
+
+    if isinstance(gate_result, tuple) and len(gate_result) > 0:
+        maybe = gate_result[0]
+        if isinstance(maybe, ast.Gate):
+            return maybe
+    return None
+
+
+def _cached_emit_gate(
+    emit: EmitQASM2Main, gate_emitter, node: GateFunction
+) -> ast.Gate | None:
+    # NOTE: gate libraries are shared between kernels, so a gate is only emitted
+    # again if it was rewritten in place or the dialects differ
+    method = emit.gate_methods.get(node)
+    if method is None:
+        return _emit_gate(gate_emitter, node)
+
+    fingerprint = method_fingerprint(method)
+    entry = _gate_cache.get(method)
+    if (
+        entry is not None
+        and entry.dialects == emit.dialects.data
+        and entry.fingerprint == fingerprint
+    ):
+        return entry.gate
+
+    gate = _emit_gate(gate_emitter, node)
+    if gate is not None:
+        _gate_cache[method] = _GateCacheEntry(fingerprint, emit.dialects.data, gate)
+    return gate
+
+
 @func.dialect.register(key="emit.qasm2.main")
 class Func(interp.MethodTable):
     @interp.impl(func.Invoke)
@@ -37,6 +89,7 @@ class Func(interp.MethodTable):
             emit.callable_to_emit.append(node.callee.code)
 
         if isinstance(node.callee.code, GateFunction):
+            emit.gate_methods[node.callee.code] = node.callee
             c_params: list[ast.Expr] = []
             q_args: list[ast.Bit | ast.Name] = []
 
@@ -99,32 +152,20 @@ class Func(interp.MethodTable):
                 break
 
             if isinstance(callable_node, GateFunction):
-                with gate_emitter.eval_context():
-                    with gate_emitter.new_frame(
-                        callable_node, has_parent_access=False
-                    ) as gate_frame:
-                        gate_result = gate_emitter.frame_eval(gate_frame, callable_node)
-                        gate_obj = None
-                        if isinstance(gate_result, tuple) and len(gate_result) > 0:
-                            maybe = gate_result[0]
-                            if isinstance(maybe, ast.Gate):
-                                gate_obj = maybe
-
-                        if gate_obj is None:
-                            name = emit.callables.get(
-                                callable_node
-                            ) or emit.callables.add(callable_node)
-                            prefix = getattr(emit.callables, "prefix", "") or ""
-                            emit_name = (
-                                name[len(prefix) :]
-                                if prefix and name.startswith(prefix)
-                                else name
-                            )
-                            gate_obj = ast.Gate(
-                                name=emit_name, cparams=[], qparams=[], body=[]
-                            )
-
-                        gate_defs.append(gate_obj)
+                gate_obj = _cached_emit_gate(emit, gate_emitter, callable_node)
+                if gate_obj is None:
+                    name = emit.callables.get(callable_node) or emit.callables.add(
+                        callable_node
+                    )
+                    prefix = getattr(emit.callables, "prefix", "") or ""
+                    emit_name = (
+                        name[len(prefix) :]
+                        if prefix and name.startswith(prefix)
+                        else name
+                    )
+                    gate_obj = ast.Gate(name=emit_name, cparams=[], qparams=[], body=[])
+
+                gate_defs.append(gate_obj)
 
         if emit.dialects.data.intersection((parallel.dialect, glob.dialect)):
             header = ast.Kirin([dialect.name for dialect in emit.dialects])
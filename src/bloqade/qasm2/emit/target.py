@@ -1,12 +1,13 @@
-import io
+import os
+from typing import TextIO
 
 from kirin import ir
-from rich.console import Console
 from kirin.analysis import CallGraph
 from kirin.dialects import ilist
 from kirin.validation import ValidationSuite
 
-from bloqade.qasm2.parse import ast, pprint
+from bloqade.qasm2.parse import ast, dump, dumps
+from bloqade.analysis.manager import AnalysisManager
 from bloqade.qasm2.passes.fold import QASM2Fold
 from bloqade.qasm2.passes.glob import GlobalToParallel
 from bloqade.qasm2.passes.py2qasm import Py2QASM
@@ -108,13 +109,19 @@ class QASM2:
             unroll_ifs=self.unroll_ifs,
         ).fixpoint(entry)
 
+        # NOTE: share the address analysis between the passes below
+        analysis_manager = AnalysisManager()
         if not self.allow_global:
             # rewrite global to parallel
-            GlobalToParallel(dialects=entry.dialects)(entry)
+            GlobalToParallel(
+                dialects=entry.dialects, analysis_manager=analysis_manager
+            )(entry)
 
         if not self.allow_parallel:
             # rewrite parallel to uop
-            ParallelToUOp(dialects=entry.dialects)(entry)
+            ParallelToUOp(dialects=entry.dialects, analysis_manager=analysis_manager)(
+                entry
+            )
 
         ValidationSuite([QASM2Validation]).validate(entry).raise_if_invalid()
 
@@ -146,11 +153,15 @@ class QASM2:
 
                 if not self.allow_global:
                     # rewrite global to parallel
-                    GlobalToParallel(dialects=fn.dialects)(fn)
+                    GlobalToParallel(
+                        dialects=fn.dialects, analysis_manager=analysis_manager
+                    )(fn)
 
                 if not self.allow_parallel:
                     # rewrite parallel to uop
-                    ParallelToUOp(dialects=fn.dialects)(fn)
+                    ParallelToUOp(
+                        dialects=fn.dialects, analysis_manager=analysis_manager
+                    )(fn)
 
                 Py2QASM(fn.dialects)(fn)
 
@@ -173,12 +184,30 @@ class QASM2:
                 A string with the QASM2 representation of the kernel
 
         """
-        console = Console(
-            file=io.StringIO(),
-            force_terminal=False,
-            force_interactive=False,
-            force_jupyter=False,
-            record=True,
-        )
-        pprint(self.emit(entry), console=console)
-        return console.export_text()
+        return dumps(self.emit(entry))
+
+    def emit_to_stream(self, entry: ir.Method, stream: TextIO) -> None:
+        """Emit the QASM2 representation of the Bloqade kernel to a text stream.
+
+        Args:
+            entry (ir.Method):
+                The Bloqade kernel to convert to QASM2
+            stream (TextIO):
+                The stream to write the QASM2 program to
+
+        """
+        dump(self.emit(entry), stream)
+
+    def emit_to_file(self, entry: ir.Method, path: str | os.PathLike) -> None:
+        """Emit the QASM2 representation of the Bloqade kernel to a file.
+
+        Args:
+            entry (ir.Method):
+                The Bloqade kernel to convert to QASM2
+            path (str | os.PathLike):
+                The path of the file to write the QASM2 program to
+
+        """
+        program = self.emit(entry)
+        with open(path, "w") as f:
+            dump(program, f)
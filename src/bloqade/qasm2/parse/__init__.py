@@ -1,16 +1,20 @@
+import io
 import pathlib
+from typing import TextIO
 
 from rich.console import Console
 
 from . import ast as ast
+from .text import TextPrinter as TextPrinter
 from .build import Build
 from .print import Printer as Printer
-from .parser import qasm2_parser as lark_parser
+from .parser import get_parser as get_parser
+from .stream import iter_programs as iter_programs
 from .visitor import Visitor as Visitor
 
 
 def loads(txt: str):
-    raw = lark_parser.parse(txt)
+    raw = get_parser().parse(txt)
     return Build().build_mainprogram(raw)
 
 
@@ -38,3 +42,20 @@ def spprint(node: ast.Node, *, console: Console | None = None, no_color: bool =
     with printer.string_io() as stream:
         printer.visit(node)
         return stream.getvalue()
+
+
+def dump(node: ast.Node, stream: TextIO):
+    TextPrinter().dump(node, stream)
+
+
+def dumps(node: ast.Node) -> str:
+    stream = io.StringIO()
+    dump(node, stream)
+    return stream.getvalue()
+
+
+def __getattr__(name: str):
+    # NOTE: backwards compatibility, the parser is built lazily
+    if name == "lark_parser":
+        return get_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
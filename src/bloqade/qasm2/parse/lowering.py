@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Iterable
 from dataclasses import field, dataclass
 
 from kirin import ir, types, lowering
@@ -51,6 +51,30 @@ class QASM2(lowering.LoweringABC[ast.Node]):
         col_offset: int = 0,
         compactify: bool = True,
     ) -> lowering.Frame:
+        return self.get_frame_from_stream(
+            [stmt],
+            globals=globals,
+            file=file,
+            lineno_offset=lineno_offset,
+            col_offset=col_offset,
+            compactify=compactify,
+        )
+
+    def get_frame_from_stream(
+        self,
+        stmts: Iterable[ast.Node],
+        globals: dict[str, Any] | None = None,
+        file: str | None = None,
+        lineno_offset: int = 0,
+        col_offset: int = 0,
+        compactify: bool = True,
+    ) -> lowering.Frame:
+        """Lower a sequence of nodes into a single frame, one node at a time.
+
+        This allows lowering a program from an iterator of its parts (see
+        `bloqade.qasm2.parse.stream.iter_programs`), so that the AST of each part
+        can be discarded as soon as it is lowered.
+        """
         # TODO: add source info
         state = lowering.State(
             self,
@@ -59,11 +83,12 @@ class QASM2(lowering.LoweringABC[ast.Node]):
             col_offset=col_offset,
         )
         with state.frame(
-            [stmt],
+            [],
             globals=globals,
             finalize_next=False,
         ) as frame:
-            self.visit(state, stmt)
+            for stmt in stmts:
+                self.visit(state, stmt)
 
             if compactify:
                 from kirin.rewrite import Walk, CFGCompactify
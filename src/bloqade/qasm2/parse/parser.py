@@ -1,5 +1,48 @@
+"""Lazily constructed Lark parser for QASM2.
+
+Building the LALR tables of the grammar is comparatively slow, so the parser is
+only built on first use and the tables are persisted with Lark's cache mechanism
+in the user cache directory (`$XDG_CACHE_HOME/bloqade`, `~/.cache/bloqade` by
+default). The cache file is keyed on the grammar and the Lark version, and Lark
+itself rejects cache files that do not match the grammar and its options.
+"""
+
+import os
+import hashlib
+import pathlib
+import functools
+
+import lark
 from lark import Lark
 
-qasm2_parser = Lark.open(
-    "qasm2.lark", rel_to=__file__, parser="lalr", start="mainprogram"
-)
+GRAMMAR_PATH = pathlib.Path(__file__).parent / "qasm2.lark"
+
+
+def _cache_file() -> str | bool:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    cache_dir = pathlib.Path(cache_home) / "bloqade"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        # NOTE: fall back to Lark's default cache location in the temp directory
+        return True
+
+    grammar_hash = hashlib.sha256(GRAMMAR_PATH.read_bytes()).hexdigest()[:16]
+    return str(cache_dir / f"qasm2-{grammar_hash}-lark-{lark.__version__}.cache")
+
+
+@functools.cache
+def get_parser() -> Lark:
+    """Return the QASM2 parser, building it on first use."""
+    return Lark.open(
+        str(GRAMMAR_PATH), parser="lalr", start="mainprogram", cache=_cache_file()
+    )
+
+
+def __getattr__(name: str):
+    # NOTE: backwards compatibility, `qasm2_parser` used to be built at import
+    if name == "qasm2_parser":
+        return get_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
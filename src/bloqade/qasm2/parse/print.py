@@ -151,6 +151,7 @@ class Printer(print.Printer, Visitor[None]):
 
     def visit_Opaque(self, node: Opaque) -> None:
         self.plain_print("opaque ", style="keyword")
+        self.plain_print(node.name, style="symbol")
         if node.cparams:
             self.print_seq(
                 node.cparams, delim=", ", prefix="(", suffix=")", emit=self.visit
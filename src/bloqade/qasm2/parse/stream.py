@@ -0,0 +1,100 @@
+"""Incremental parsing of large QASM2 programs.
+
+The program text is read from a stream block by block and split into top-level
+statements, without tokenizing it: a statement ends at a `;` or a closing `}`
+that is not nested in braces, ignoring comments and strings. Consecutive
+statements are grouped into batches which are parsed with the regular grammar
+(prefixed with the header of the program), so only one batch of text, parse tree
+and AST is alive at a time.
+"""
+
+import re
+from typing import TextIO, Iterator
+
+from . import ast
+from .build import Build
+from .parser import get_parser
+
+_BOUNDARY = re.compile(r'//[^\n]*|"[^"\n]*"|[;{}]')
+
+
+def _split_statements(stream: TextIO, block_size: int) -> Iterator[tuple[str, bool]]:
+    """Yield the top-level statements of a program, starting with its header.
+
+    Yields:
+        tuple[str, bool]: The text of each statement, and whether it is the header.
+
+    """
+    buf = ""
+    scan = 0  # position up to which `buf` has been scanned
+    depth = 0
+    header = True
+    eof = False
+    while not eof:
+        block = stream.read(block_size)
+        eof = not block
+        buf += block
+
+        # NOTE: comments and strings do not span lines, only scan complete lines
+        limit = len(buf) if eof else max(buf.rfind("\n", scan) + 1, scan)
+        start = 0
+        for match in _BOUNDARY.finditer(buf, scan, limit):
+            token = match.group()
+            if token == "{":
+                depth += 1
+            elif token == "}":
+                depth -= 1
+                if depth == 0 and not header:
+                    yield buf[start : match.end()], False
+                    start = match.end()
+            elif token == ";" and depth == 0:
+                yield buf[start : match.end()], header
+                header = False
+                start = match.end()
+
+        buf = buf[start:]
+        scan = limit - start
+
+    if buf.strip():
+        yield buf, header
+
+
+def iter_programs(
+    stream: TextIO, *, batch_size: int = 1 << 16, block_size: int = 1 << 16
+) -> Iterator[ast.MainProgram]:
+    """Parse a QASM2 program incrementally.
+
+    Args:
+        stream (TextIO): The stream to read the program text from.
+        batch_size (int): The approximate number of characters parsed at once.
+            Defaults to 64 KiB.
+        block_size (int): The number of characters read from the stream at once.
+            Defaults to 64 KiB.
+
+    Yields:
+        ast.MainProgram: Consecutive parts of the program, each with the header of
+            the program and a batch of its statements. Note that line numbers in
+            parse errors are relative to the batch.
+
+    """
+    parser = get_parser()
+    builder = Build()
+    header = ""
+    batch: list[str] = []
+    size = 0
+    empty = True
+    for text, is_header in _split_statements(stream, block_size):
+        if is_header:
+            header = text
+            continue
+
+        batch.append(text)
+        size += len(text)
+        if size >= batch_size:
+            yield builder.build_mainprogram(parser.parse(header + "".join(batch)))
+            batch.clear()
+            size = 0
+            empty = False
+
+    if batch or empty:
+        yield builder.build_mainprogram(parser.parse(header + "".join(batch)))
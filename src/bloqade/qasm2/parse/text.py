@@ -0,0 +1,175 @@
+"""Plain-text serializer for the QASM2 AST.
+
+Produces the same text as the rich `Printer` without any styling, writing each
+top-level statement to a text stream as soon as it is serialized. Use `Printer`
+(via `pprint`) for interactive display and this module to emit programs.
+"""
+
+from typing import TextIO
+
+from . import ast
+from .visitor import Visitor
+
+
+class TextPrinter(Visitor[str]):
+    """Serialize QASM2 AST nodes into strings."""
+
+    def __init__(self, indent: int = 0):
+        self.indent = indent
+
+    def dump(self, node: ast.Node, stream: TextIO) -> None:
+        """Write a node to a text stream.
+
+        Args:
+            node (ast.Node): The node to write, usually an `ast.MainProgram`.
+            stream (TextIO): The stream to write to.
+
+        """
+        if isinstance(node, ast.MainProgram):
+            stream.write(self.visit(node.header))
+            stream.write("\n")
+            for stmt in node.statements:
+                stream.write(self.visit(stmt))
+                stream.write("\n")
+        else:
+            stream.write(self.visit(node))
+
+    def newline(self) -> str:
+        return "\n" + " " * self.indent
+
+    def block(self, body: list) -> str:
+        self.indent += 2
+        try:
+            inner = self.newline().join(self.visit(stmt) for stmt in body)
+            return self.newline() + inner
+        finally:
+            self.indent -= 2
+
+    def seq(self, nodes) -> str:
+        return ", ".join(self.visit(node) for node in nodes)
+
+    def visit_MainProgram(self, node: ast.MainProgram) -> str:
+        lines = [self.visit(node.header)]
+        lines.extend(self.visit(stmt) for stmt in node.statements)
+        return "\n".join(lines) + "\n"
+
+    def visit_OPENQASM(self, node: ast.OPENQASM) -> str:
+        return f"OPENQASM {node.version.major}.{node.version.minor};"
+
+    def visit_Kirin(self, node: ast.Kirin) -> str:
+        return "KIRIN {" + ",".join(sorted(node.dialects)) + "};"
+
+    def visit_Include(self, node: ast.Include) -> str:
+        return f'include "{node.filename}";'
+
+    def visit_Barrier(self, node: ast.Barrier) -> str:
+        # NOTE: matches `Printer`, which indents barriers once more
+        return " " * self.indent + f"barrier {self.seq(node.qargs)};"
+
+    def visit_Instruction(self, node: ast.Instruction) -> str:
+        params = f"({self.seq(node.params)}) " if node.params else ""
+        return f"{node.name.id} {params}{self.seq(node.qargs)};"
+
+    def visit_Comment(self, node: ast.Comment) -> str:
+        return f"// {node.text}"
+
+    def visit_CReg(self, node: ast.CReg) -> str:
+        return f"creg {node.name}[{node.size}];"
+
+    def visit_QReg(self, node: ast.QReg) -> str:
+        return f"qreg {node.name}[{node.size}];"
+
+    def visit_CXGate(self, node: ast.CXGate) -> str:
+        return f"CX {self.visit(node.ctrl)}, {self.visit(node.qarg)};"
+
+    def visit_UGate(self, node: ast.UGate) -> str:
+        return (
+            f"U({self.visit(node.theta)}, {self.visit(node.phi)}, "
+            f"{self.visit(node.lam)}) {self.visit(node.qarg)};"
+        )
+
+    def visit_Measure(self, node: ast.Measure) -> str:
+        return f"measure {self.visit(node.qarg)} -> {self.visit(node.carg)};"
+
+    def visit_Reset(self, node: ast.Reset) -> str:
+        return f"reset {self.visit(node.qarg)};"
+
+    def visit_Opaque(self, node: ast.Opaque) -> str:
+        cparams = f"({self.seq(node.cparams)})" if node.cparams else ""
+        qparams = f" {self.seq(node.qparams)}" if node.qparams else ""
+        return f"opaque {node.name}{cparams}{qparams};"
+
+    def visit_Gate(self, node: ast.Gate) -> str:
+        cparams = f"({', '.join(node.cparams)})" if node.cparams else ""
+        qparams = f" {', '.join(node.qparams)}" if node.qparams else ""
+        body = self.block(node.body)
+        return f"gate {node.name}{cparams}{qparams} {{{body}{self.newline()}}}"
+
+    def visit_IfStmt(self, node: ast.IfStmt) -> str:
+        cond = self.visit(node.cond)
+        if len(node.body) == 1:  # inline if
+            return f"if{cond}{self.visit(node.body[0])}"
+        return f"if{cond}{{{self.block(node.body)}{self.newline()}}}"
+
+    def visit_Cmp(self, node: ast.Cmp) -> str:
+        return f" ({self.visit(node.lhs)} == {self.visit(node.rhs)}) "
+
+    def visit_Call(self, node: ast.Call) -> str:
+        return f"{node.name}({self.seq(node.args)})"
+
+    def visit_BinOp(self, node: ast.BinOp) -> str:
+        return f"({self.visit(node.lhs)} {node.op} {self.visit(node.rhs)})"
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> str:
+        return f"{node.op}{self.visit(node.operand)}"
+
+    def visit_Bit(self, node: ast.Bit) -> str:
+        if node.addr is None:
+            return node.name.id
+        return f"{node.name.id}[{node.addr}]"
+
+    def visit_Number(self, node: ast.Number) -> str:
+        return str(node.value)
+
+    def visit_Pi(self, node: ast.Pi) -> str:
+        return "pi"
+
+    def visit_Name(self, node: ast.Name) -> str:
+        return node.id
+
+    def visit_ParallelQArgs(self, node: ast.ParallelQArgs) -> str:
+        self.indent += 2
+        try:
+            lines = "".join(
+                f"{self.newline()}{self.seq(qargs)};" for qargs in node.qargs
+            )
+        finally:
+            self.indent -= 2
+        return f"{{{lines}{self.newline()}}}"
+
+    def visit_ParaU3Gate(self, node: ast.ParaU3Gate) -> str:
+        return (
+            f"parallel.U({self.visit(node.theta)}, {self.visit(node.phi)}, "
+            f"{self.visit(node.lam)}) {self.visit_ParallelQArgs(node.qargs)}"
+        )
+
+    def visit_ParaCZGate(self, node: ast.ParaCZGate) -> str:
+        return f"parallel.CZ {self.visit_ParallelQArgs(node.qargs)}"
+
+    def visit_ParaRZGate(self, node: ast.ParaRZGate) -> str:
+        return (
+            f"parallel.RZ({self.visit(node.theta)}) "
+            f"{self.visit_ParallelQArgs(node.qargs)}"
+        )
+
+    def visit_GlobUGate(self, node: ast.GlobUGate) -> str:
+        return (
+            f"glob.U({self.visit(node.theta)}, {self.visit(node.phi)}, "
+            f"{self.visit(node.lam)}) {{{self.seq(node.registers)}}}"
+        )
+
+    def visit_NoisePAULI1(self, node: ast.NoisePAULI1) -> str:
+        return (
+            f"noise.PAULI1({self.visit(node.px)}, {self.visit(node.py)}, "
+            f"{self.visit(node.pz)}) {self.visit(node.qarg)};"
+        )
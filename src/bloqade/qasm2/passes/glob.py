@@ -3,6 +3,8 @@ Passes that deal with global gates. As of now, only one rewrite pass exists
 which converts global gates to single qubit gates.
 """
 
+from dataclasses import field, dataclass
+
 from kirin import ir
 from kirin.rewrite import abc, cse, dce, walk
 from kirin.passes.abc import Pass
@@ -11,8 +13,10 @@ from kirin.rewrite.fixpoint import Fixpoint
 
 from bloqade.analysis import address
 from bloqade.qasm2.rewrite import GlobalToUOpRule, GlobalToParallelRule
+from bloqade.analysis.manager import AnalysisManager
 
 
+@dataclass
 class GlobalToUOP(Pass):
     """Pass to convert Global gates into single gates.
 
@@ -50,8 +54,13 @@ class GlobalToUOP(Pass):
     ```
     """
 
+    analysis_manager: AnalysisManager = field(
+        default_factory=AnalysisManager, kw_only=True
+    )
+    """Cache of analysis results, shared with the other passes of a pipeline."""
+
     def generate_rule(self, mt: ir.Method) -> GlobalToUOpRule:
-        frame, _ = address.AddressAnalysis(mt.dialects).run(mt)
+        frame = self.analysis_manager.run(address.AddressAnalysis, mt).frame
         return GlobalToUOpRule(frame.entries)
 
     def unsafe_run(self, mt: ir.Method) -> abc.RewriteResult:
@@ -67,9 +76,10 @@ class GlobalToUOP(Pass):
 
         # do fold again to get proper hint for inserted const
         result = Fold(mt.dialects)(mt).join(result)
-        return result
+        return self.analysis_manager.update(mt, result)
 
 
+@dataclass
 class GlobalToParallel(Pass):
     """Pass to convert Global gates into parallel gates.
 
@@ -104,8 +114,13 @@ class GlobalToParallel(Pass):
     ```
     """
 
+    analysis_manager: AnalysisManager = field(
+        default_factory=AnalysisManager, kw_only=True
+    )
+    """Cache of analysis results, shared with the other passes of a pipeline."""
+
     def generate_rule(self, mt: ir.Method) -> GlobalToParallelRule:
-        frame, _ = address.AddressAnalysis(mt.dialects).run(mt)
+        frame = self.analysis_manager.run(address.AddressAnalysis, mt).frame
         return GlobalToParallelRule(frame.entries)
 
     def unsafe_run(self, mt: ir.Method) -> abc.RewriteResult:
@@ -120,4 +135,4 @@ class GlobalToParallel(Pass):
         )
         # do fold again to get proper hint
         result = Fold(mt.dialects)(mt).join(result)
-        return result
+        return self.analysis_manager.update(mt, result)
@@ -11,6 +11,7 @@ from kirin.rewrite import (
 from bloqade.qasm2 import noise
 from bloqade.analysis import address
 from bloqade.qasm2.rewrite import NoiseRewriteRule
+from bloqade.analysis.manager import AnalysisManager
 from bloqade.qasm2.passes.lift_qubits import LiftQubits
 
 
@@ -49,13 +50,15 @@ class NoisePass(Pass):
     """
 
     noise_model: noise.MoveNoiseModelABC = field(default_factory=noise.TwoRowZoneModel)
-    address_analysis: address.AddressAnalysis = field(init=False)
-
-    def __post_init__(self):
-        self.address_analysis = address.AddressAnalysis(self.dialects)
+    analysis_manager: AnalysisManager = field(
+        default_factory=AnalysisManager, kw_only=True
+    )
+    """Cache of analysis results, shared with the other passes of a pipeline."""
 
     def get_qubit_values(self, mt: ir.Method):
-        frame, _ = self.address_analysis.run(mt)
+        frame = self.analysis_manager.run(
+            address.AddressAnalysis, mt, self.dialects
+        ).frame
         qubit_ssa_values = {}
         # Traverse statements in block order to fine the first SSA value for each qubit
         for block in mt.callable_region.blocks:
@@ -74,6 +77,7 @@ class NoisePass(Pass):
 
     def unsafe_run(self, mt: ir.Method):
         result = LiftQubits(self.dialects).unsafe_run(mt)
+        self.analysis_manager.update(mt, result)
         qubit_ssa_value, address_analysis = self.get_qubit_values(mt)
         result = (
             Walk(
@@ -89,4 +93,4 @@ class NoisePass(Pass):
         )
 
         result = Fixpoint(Walk(DeadCodeElimination())).rewrite(mt.code).join(result)
-        return result
+        return self.analysis_manager.update(mt, result)
@@ -30,6 +30,7 @@ from bloqade.qasm2.rewrite import (
     SimpleOptimalMergePolicy,
 )
 from bloqade.squin.analysis import schedule
+from bloqade.analysis.manager import AnalysisManager
 
 
 @dataclass
@@ -62,8 +63,13 @@ class ParallelToUOp(Pass):
 
     """
 
+    analysis_manager: AnalysisManager = field(
+        default_factory=AnalysisManager, kw_only=True
+    )
+    """Cache of analysis results, shared with the other passes of a pipeline."""
+
     def generate_rule(self, mt: ir.Method) -> ParallelToUOpRule:
-        frame, _ = address.AddressAnalysis(mt.dialects).run(mt)
+        frame = self.analysis_manager.run(address.AddressAnalysis, mt).frame
 
         id_map = {}
 
@@ -92,7 +98,8 @@ class ParallelToUOp(Pass):
             DeadCodeElimination(),
             CommonSubexpressionElimination(),
         )
-        return Fixpoint(Walk(rule)).rewrite(mt.code).join(result)
+        result = Fixpoint(Walk(rule)).rewrite(mt.code).join(result)
+        return self.analysis_manager.update(mt, result)
 
 
 @dataclass
@@ -138,6 +145,10 @@ class UOpToParallel(Pass):
     merge_policy_type: Type[MergePolicyABC] = SimpleOptimalMergePolicy
     rewrite_to_native_first: bool = False
     constprop: const.Propagate = field(init=False)
+    analysis_manager: AnalysisManager = field(
+        default_factory=AnalysisManager, kw_only=True
+    )
+    """Cache of analysis results, shared with the other passes of a pipeline."""
 
     def __post_init__(self):
         self.constprop = const.Propagate(self.dialects)
@@ -162,7 +173,8 @@ class UOpToParallel(Pass):
         frame, _ = self.constprop.run(mt)
         result = Walk(WrapConst(frame)).rewrite(mt.code).join(result)
 
-        frame, _ = address.AddressAnalysis(mt.dialects).run(mt)
+        self.analysis_manager.update(mt, result)
+        frame = self.analysis_manager.run(address.AddressAnalysis, mt).frame
         dags = schedule.DagScheduleAnalysis(
             mt.dialects, address_analysis=frame.entries
         ).get_dags(mt)
@@ -185,15 +197,20 @@ class UOpToParallel(Pass):
             DeadCodeElimination(),
             CommonSubexpressionElimination(),
         )
-        return Fixpoint(Walk(rule)).rewrite(mt.code).join(result)
+        result = Fixpoint(Walk(rule)).rewrite(mt.code).join(result)
+        return self.analysis_manager.update(mt, result)
 
 
 @dataclass
 class ParallelToGlobal(Pass):
 
+    analysis_manager: AnalysisManager = field(
+        default_factory=AnalysisManager, kw_only=True
+    )
+    """Cache of analysis results, shared with the other passes of a pipeline."""
+
     def generate_rule(self, mt: ir.Method) -> ParallelToGlobalRule:
-        address_analysis = address.AddressAnalysis(mt.dialects)
-        frame, _ = address_analysis.run(mt)
+        frame = self.analysis_manager.run(address.AddressAnalysis, mt).frame
         return ParallelToGlobalRule(frame.entries)
 
     def unsafe_run(self, mt: ir.Method) -> abc.RewriteResult:
@@ -202,4 +219,4 @@ class ParallelToGlobal(Pass):
         result = Walk(rule).rewrite(mt.code)
         result = Walk(DeadCodeElimination()).rewrite(mt.code).join(result)
 
-        return result
+        return self.analysis_manager.update(mt, result)
@@ -1,4 +1,4 @@
-from kirin import ir, passes
+from kirin import ir, passes, rewrite
 from kirin.prelude import structural_no_opt
 from kirin.dialects import debug, ilist
 
@@ -6,6 +6,7 @@ from bloqade.decoders.dialects import annotate
 
 from . import gate, noise
 from .. import qubit
+from .rewrite.inline_stdlib import InlineStdlib
 
 
 @ir.dialect_group(structural_no_opt.union([qubit, noise, gate, debug, annotate]))
@@ -13,9 +14,17 @@ def kernel(self):
     fold_pass = passes.Fold(self)
     typeinfer_pass = passes.TypeInfer(self)
     ilist_desugar_pass = ilist.IListDesugar(self)
+    inline_stdlib_rule = rewrite.Fixpoint(rewrite.Walk(InlineStdlib()))
 
-    def run_pass(method: ir.Method, *, fold=True, typeinfer=True):
+    def run_pass(method: ir.Method, *, fold=True, typeinfer=True, inline_stdlib=False):
         method.verify()
+        if inline_stdlib:
+            # NOTE: inline the standard library wrappers, e.g. `squin.x(q)`, down
+            # to the statements they wrap so that interpreters skip their frames;
+            # the arguments are typed first to be checked against the wrappers
+            typeinfer_pass(method)
+            inline_stdlib_rule.rewrite(method.code)
+
         if fold:
             fold_pass.fixpoint(method)
 
@@ -1,2 +1,3 @@
+from .inline_stdlib import InlineStdlibPass as InlineStdlibPass
 from .qasm2_to_squin import QASM2ToSquin as QASM2ToSquin
 from .qasm3_to_squin import QASM3ToSquin as QASM3ToSquin
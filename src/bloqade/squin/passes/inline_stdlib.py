@@ -0,0 +1,39 @@
+from dataclasses import field, dataclass
+
+from kirin import ir
+from kirin.passes import Fold, Pass, TypeInfer
+from kirin.rewrite import Walk, Fixpoint
+from kirin.rewrite.abc import RewriteResult
+
+from ..rewrite.inline_stdlib import InlineStdlib
+
+
+@dataclass
+class InlineStdlibPass(Pass):
+    """
+    Inlines the standard library wrappers (`squin.x`, `squin.broadcast.x`, `squin.measure`, ...)
+    called by a kernel, and folds the constants they compute, e.g. the conversion of
+    rotation angles to turns.
+
+    Each call to `squin.x(q)` then becomes the construction of `IList([q])` followed by the
+    gate statement itself, so that an interpreter running the kernel does not push two frames
+    for every gate. Calls whose arguments do not fit the signature of the wrapper, e.g. lists of
+    qubits of unknown length passed to `squin.broadcast.cx`, and functions defined outside the
+    standard library are not inlined.
+    """
+
+    fold: Fold = field(init=False)
+    typeinfer: TypeInfer = field(init=False)
+
+    def __post_init__(self):
+        self.fold = Fold(self.dialects, no_raise=self.no_raise)
+        self.typeinfer = TypeInfer(self.dialects, no_raise=self.no_raise)
+
+    def unsafe_run(self, mt: ir.Method) -> RewriteResult:
+        # NOTE: the arguments of the calls need to be typed to be checked against the wrappers
+        self.typeinfer.unsafe_run(mt)
+        result = Fixpoint(Walk(InlineStdlib())).rewrite(mt.code)
+        if result.has_done_something:
+            result = self.fold.unsafe_run(mt).join(result)
+
+        return result
@@ -1,5 +1,6 @@
 """Rewrite helpers for Squin programs."""
 
+from .inline_stdlib import InlineStdlib as InlineStdlib
 from .wrap_analysis import (
     WrapAnalysis as WrapAnalysis,
     AddressAttribute as AddressAttribute,
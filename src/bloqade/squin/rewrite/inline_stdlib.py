@@ -0,0 +1,40 @@
+from kirin import ir
+from kirin.rewrite import Inline
+from kirin.dialects import func
+from kirin.rewrite.abc import RewriteRule, RewriteResult
+
+# NOTE: the modules of the thin kernels wrapping gate, noise and measurement
+# statements, e.g. `squin.h` -> `squin.broadcast.h` -> `squin.gate.H`
+STDLIB_MODULES = (
+    "bloqade.squin.stdlib.",
+    "bloqade.qubit.stdlib.simple",
+    "bloqade.qubit.stdlib.broadcast",
+)
+
+
+def is_stdlib_method(method: ir.Method) -> bool:
+    """Whether a method is one of the wrappers of the standard library."""
+    return method.mod is not None and method.mod.__name__.startswith(STDLIB_MODULES)
+
+
+class InlineStdlib(RewriteRule):
+    """Inline the invocations of the standard library wrappers.
+
+    An invocation is only inlined if the types of its arguments are subtypes of the
+    signature of the wrapper, so that the inlined statements type check as they do
+    in the wrapper: e.g. `squin.broadcast.cx(controls, targets)` is kept as is
+    when the lengths of the lists are not known. Types should be inferred first.
+    """
+
+    def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
+        if not isinstance(node, func.Invoke) or not is_stdlib_method(node.callee):
+            return RewriteResult()
+
+        arg_types = node.callee.arg_types
+        if len(node.args) != len(arg_types) or not all(
+            arg.type.is_subseteq(arg_type)
+            for arg, arg_type in zip(node.args, arg_types)
+        ):
+            return RewriteResult()
+
+        return Inline(heuristic=lambda _: True).rewrite_Statement(node)
@@ -1,6 +1,15 @@
 from . import emit as emit, parse as parse, passes as passes, dialects as dialects
+from .cache import (
+    CompileCache as CompileCache,
+    enable_compile_cache as enable_compile_cache,
+    disable_compile_cache as disable_compile_cache,
+)
 from .groups import main as main
-from .circuit import Circuit as Circuit
+from .circuit import (
+    Circuit as Circuit,
+    emit_to_file as emit_to_file,
+    emit_to_stream as emit_to_stream,
+)
 from ._wrappers import (
     h as h,
     s as s,
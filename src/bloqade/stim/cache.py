@@ -0,0 +1,156 @@
+"""Opt-in cache of the STIM programs compiled from squin kernels.
+
+Compiling a kernel with `SquinToStimPass` runs several analyses and rewrite
+passes, which can take seconds for large QEC experiments. When the cache is
+enabled with `enable_compile_cache`, the emitted program of each kernel is stored
+under a structural hash of the kernel IR (see
+`bloqade.analysis.fingerprint.structural_hash`), so compiling the same kernel again,
+e.g. in another notebook cell or CI job, returns the stored program instead.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+from collections import OrderedDict
+from dataclasses import field, dataclass
+from importlib.metadata import PackageNotFoundError, version
+
+from kirin import ir
+
+from bloqade.analysis.fingerprint import structural_hash
+
+try:
+    _VERSION = version("bloqade-circuit")
+except PackageNotFoundError:  # pragma: no cover
+    _VERSION = "unknown"
+
+
+@dataclass
+class CompileCache:
+    """LRU cache of compiled STIM programs, optionally backed by a directory."""
+
+    maxsize: int = 128
+    """The maximum number of programs kept in memory."""
+    directory: Path | None = None
+    """The directory the programs are persisted to, if any."""
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    _entries: OrderedDict[str, str] = field(
+        init=False, repr=False, default_factory=OrderedDict
+    )
+
+    def __post_init__(self):
+        if self.maxsize < 0:
+            raise ValueError("maxsize must be non-negative")
+
+        if self.directory is not None:
+            self.directory = Path(self.directory)
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(mt: ir.Method, insert_ticks: bool = False) -> str:
+        """Compute the cache key of a kernel.
+
+        Args:
+            mt (ir.Method): The kernel to compile.
+            insert_ticks (bool): Whether ticks are inserted during compilation.
+
+        Returns:
+            str: The cache key.
+
+        """
+        return f"{structural_hash(mt)}-{int(insert_ticks)}-{_VERSION}"
+
+    def get(self, key: str) -> str | None:
+        """Look up a compiled program, in memory first and then on disk.
+
+        Args:
+            key (str): The cache key, see `CompileCache.key`.
+
+        Returns:
+            str | None: The compiled program, or None if it is not cached.
+
+        """
+        program = self._entries.get(key)
+        if program is not None:
+            self._entries.move_to_end(key)
+        elif self.directory is not None:
+            path = self.directory / f"{key}.stim"
+            if path.is_file():
+                program = path.read_text()
+                self._store(key, program)
+
+        if program is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return program
+
+    def put(self, key: str, program: str) -> None:
+        """Store a compiled program.
+
+        Args:
+            key (str): The cache key, see `CompileCache.key`.
+            program (str): The compiled STIM program.
+
+        """
+        self._store(key, program)
+        if self.directory is not None:
+            # NOTE: write atomically, other processes may share the directory
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(program)
+            os.replace(tmp, self.directory / f"{key}.stim")
+
+    def clear(self) -> None:
+        """Remove all programs from memory, and from disk if persisted."""
+        self._entries.clear()
+        if self.directory is not None:
+            for path in self.directory.glob("*.stim"):
+                path.unlink()
+
+    def _store(self, key: str, program: str) -> None:
+        if self.maxsize == 0:
+            return
+
+        self._entries[key] = program
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+_compile_cache: CompileCache | None = None
+
+
+def enable_compile_cache(
+    maxsize: int = 128, directory: str | os.PathLike | None = None
+) -> CompileCache:
+    """Enable caching of the STIM programs compiled from kernels.
+
+    Args:
+        maxsize (int): The maximum number of programs kept in memory.
+            Defaults to 128.
+        directory (str | os.PathLike | None): A directory to persist the programs
+            to, so they can be reused across processes. Defaults to None, i.e.
+            the programs are only kept in memory.
+
+    Returns:
+        CompileCache: The enabled cache.
+
+    """
+    global _compile_cache
+    _compile_cache = CompileCache(
+        maxsize, Path(directory) if directory is not None else None
+    )
+    return _compile_cache
+
+
+def disable_compile_cache() -> None:
+    """Disable caching of the STIM programs compiled from kernels."""
+    global _compile_cache
+    _compile_cache = None
+
+
+def get_compile_cache() -> CompileCache | None:
+    """Return the enabled compile cache, or None if caching is disabled."""
+    return _compile_cache
@@ -1,9 +1,12 @@
 import io
+import os
+from typing import IO
 
 from kirin import ir
 
 from bloqade.stim import groups as bloqade_stim
 from bloqade.stim.emit import EmitStimMain
+from bloqade.stim.cache import get_compile_cache
 from bloqade.stim.passes import SquinToStimPass
 
 try:
@@ -22,11 +25,17 @@ except ImportError:
     _Circuit = _MissingStimCircuit
 
 
-def _codegen(mt: ir.Method, insert_ticks: bool = False) -> str:
-    """Compile a kernel to STIM program string.
+def emit_to_stream(
+    mt: ir.Method, stream: IO[str], *, insert_ticks: bool = False
+) -> None:
+    """Compile a kernel to a STIM program and write it to a text stream.
+
+    The program is written line by line as it is emitted, without building the
+    whole program string in memory.
 
     Args:
         mt: The kernel to compile.
+        stream: The text stream to write the program to.
         insert_ticks: If True, insert a ``TICK`` after every gate, reset,
             measurement, and noise operation so the emitted circuit preserves
             the authored execution-order layering when rendered as a diagram.
@@ -34,11 +43,105 @@ def _codegen(mt: ir.Method, insert_ticks: bool = False) -> str:
     """
     mt = mt.similar()
     SquinToStimPass(mt.dialects, insert_ticks=insert_ticks)(mt)
-    buf = io.StringIO()
-    emit = EmitStimMain(dialects=bloqade_stim.main, io=buf)
+    emit = EmitStimMain(dialects=bloqade_stim.main, io=stream)
     emit.initialize()
     emit.run(mt)
-    return buf.getvalue().strip()
+
+
+def emit_to_file(
+    mt: ir.Method, path: str | os.PathLike, *, insert_ticks: bool = False
+) -> None:
+    """Compile a kernel to a STIM program and write it to a file.
+
+    Args:
+        mt: The kernel to compile.
+        path: The path of the file to write the program to. The file is
+            overwritten if it exists.
+        insert_ticks: See `emit_to_stream`.
+    """
+    with open(path, "w") as stream:
+        emit_to_stream(mt, stream, insert_ticks=insert_ticks)
+
+
+def _codegen(mt: ir.Method, insert_ticks: bool = False) -> str:
+    """Compile a kernel to STIM program string.
+
+    The program is looked up in and stored to the compile cache, if enabled.
+
+    Args:
+        mt: The kernel to compile.
+        insert_ticks: See `emit_to_stream`.
+    """
+    cache = get_compile_cache()
+    if cache is not None:
+        key = cache.key(mt, insert_ticks)
+        if (program := cache.get(key)) is not None:
+            return program
+
+    buf = io.StringIO()
+    emit_to_stream(mt, buf, insert_ticks=insert_ticks)
+    program = buf.getvalue().strip()
+
+    if cache is not None:
+        cache.put(key, program)
+    return program
+
+
+class _CircuitWriter:
+    """Text stream that appends the STIM program written to it to a circuit.
+
+    Complete instructions are parsed in chunks of `chunk_size` lines, so that the
+    program text is never held in memory as a whole. `REPEAT` blocks are kept
+    in a single chunk since they cannot be parsed partially.
+    """
+
+    def __init__(self, circuit, chunk_size: int = 1024):
+        self.circuit = circuit
+        self.chunk_size = chunk_size
+        self.lines: list[str] = []
+        self.depth = 0
+
+    def write(self, text: str) -> int:
+        # NOTE: the emitter always writes whole lines
+        self.lines.append(text)
+        line = text.strip()
+        if line.endswith("{"):
+            self.depth += 1
+        elif line == "}":
+            self.depth -= 1
+
+        if self.depth == 0 and len(self.lines) >= self.chunk_size:
+            self.flush()
+        return len(text)
+
+    def seekable(self) -> bool:
+        return False
+
+    def flush(self) -> None:
+        if self.lines:
+            self.circuit.append_from_stim_program_text("".join(self.lines))
+            self.lines.clear()
+
+
+def _build_directly(circuit, mt: ir.Method, insert_ticks: bool) -> bool:
+    """Append a straight-line kernel to a circuit without lowering it to the
+    stim dialect.
+
+    Returns:
+        bool: False if the kernel is not supported by the direct builder, in
+            which case the circuit is left unchanged.
+    """
+    from bloqade.stim.emit.direct import build_circuit
+
+    # NOTE: an unsupported kernel is lowered by SquinToStimPass instead, which
+    # raises the errors of invalid kernels
+    try:
+        direct = build_circuit(mt, insert_ticks=insert_ticks)
+    except Exception:
+        return False
+
+    circuit += direct
+    return True
 
 
 class Circuit(_Circuit):
@@ -49,6 +152,13 @@ class Circuit(_Circuit):
     ):
         """Initialize stim.Circuit from a kernel or a STIM program string.
 
+        A straight-line kernel of Clifford gates, noise channels, measurements,
+        and annotations is built by a single walk over the kernel (see
+        `bloqade.stim.emit.direct`). Other kernels are lowered by
+        `SquinToStimPass` and emitted into the circuit, without building the
+        whole program string first. The compile cache, if enabled (see
+        `bloqade.stim.enable_compile_cache`), takes precedence over both.
+
         This class inherits from `stim.Circuit`. For the full API reference of
         the underlying circuit class, see:
         https://github.com/quantumlib/Stim/blob/main/doc/python_api_reference_vDev.md#stim.Circuit
@@ -64,6 +174,17 @@ class Circuit(_Circuit):
             **kwargs: Additional keyword arguments forwarded to `stim.Circuit`.
 
         """
-        if isinstance(kernel, ir.Method):
-            kernel = _codegen(kernel, insert_ticks=insert_ticks)
-        super().__init__(kernel, *args, **kwargs)
+        if isinstance(kernel, ir.Method) and get_compile_cache() is not None:
+            super().__init__(
+                _codegen(kernel, insert_ticks=insert_ticks), *args, **kwargs
+            )
+        elif isinstance(kernel, ir.Method):
+            super().__init__(*args, **kwargs)
+            if _build_directly(self, kernel, insert_ticks=insert_ticks):
+                return
+
+            writer = _CircuitWriter(self)
+            emit_to_stream(kernel, writer, insert_ticks=insert_ticks)  # type: ignore
+            writer.flush()
+        else:
+            super().__init__(kernel, *args, **kwargs)
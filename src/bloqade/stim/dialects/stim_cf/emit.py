@@ -14,6 +14,9 @@ class EmitStimCfMethods(MethodTable):
         frame.write_line(f"REPEAT {stmt.count} {{")
         frame._indent += 1
 
+        # NOTE: the body may contain nested REPEAT blocks, which are emitted
+        # recursively, so restore the position in the enclosing block after it
+        parent_block, parent_stmt = frame.current_block, frame.current_stmt
         for block in stmt.body.blocks:
             frame.current_block = block
             for body_stmt in block.stmts:
@@ -21,6 +24,7 @@ class EmitStimCfMethods(MethodTable):
                 res = emit.frame_eval(frame, body_stmt)
                 if isinstance(res, tuple):
                     frame.set_values(body_stmt.results, res)
+        frame.current_block, frame.current_stmt = parent_block, parent_stmt
 
         frame._indent -= 1
         frame.write_line("}")
@@ -0,0 +1,352 @@
+"""Build a `stim.Circuit` from a straight-line squin kernel in a single walk.
+
+`SquinToStimPass` lowers a kernel into the stim dialect through a chain of
+rewrites and analyses, which is needed for loops (`REPEAT` blocks) and
+measurement feed-forward. A kernel without them can instead be run by a
+concrete interpreter in which qubits are integer addresses and measurements
+are indices into the measurement record, appending each gate, noise channel,
+measurement, and annotation to the circuit as it is reached.
+
+The circuit is the same as the one parsed from the program emitted by the full
+pass. Kernels outside of this subset raise an error, in which case the caller
+falls back to `SquinToStimPass` (see `bloqade.stim.Circuit`).
+"""
+
+import itertools
+from typing import Any, Iterable, Sequence
+from dataclasses import field, dataclass
+
+from kirin import ir, interp
+from kirin.dialects import py, func, math, ilist, ssacfg
+
+import stim
+from bloqade import qubit
+from bloqade.squin import gate, noise
+from bloqade.decoders.dialects import annotate
+
+# NOTE: no control flow, so that loops are left to SquinToStimPass, which
+# preserves them as REPEAT blocks, and no comparisons, which are only useful to
+# branch on.
+dialects = ir.DialectGroup(
+    [
+        func,
+        ssacfg,
+        math,
+        py.assign,
+        py.binop,
+        py.builtin,
+        py.constant,
+        py.indexing,
+        py.len,
+        py.slice,
+        py.tuple,
+        py.unary,
+        ilist,
+        qubit,
+        gate,
+        noise,
+        annotate,
+    ]
+)
+
+
+@dataclass(frozen=True)
+class MeasurementRecord:
+    """The result of a measurement, as its index in the measurement record."""
+
+    index: int
+
+
+@dataclass
+class StimCircuitBuilder(interp.Interpreter):
+    """Interpreter appending the operations of a squin kernel to a circuit."""
+
+    keys = ("stim.direct", "main")
+
+    circuit: stim.Circuit = field(default_factory=stim.Circuit, kw_only=True)
+    """The circuit the operations are appended to."""
+    insert_ticks: bool = field(default=False, kw_only=True)
+    """Append a ``TICK`` after every gate, reset, measurement, and noise
+    operation, see `SquinToStimPass.insert_ticks`."""
+
+    qubit_count: int = field(init=False, default=0)
+    measurement_count: int = field(init=False, default=0)
+    observable_count: int = field(init=False, default=0)
+    correlated_error_count: int = field(init=False, default=0)
+
+    def initialize(self):
+        super().initialize()
+        self.qubit_count = 0
+        self.measurement_count = 0
+        self.observable_count = 0
+        self.correlated_error_count = 0
+        return self
+
+    def append(
+        self,
+        name: str,
+        targets: Iterable[int],
+        args: Sequence[float] = (),
+        tag: str = "",
+    ) -> None:
+        """Append an operation to the circuit.
+
+        Args:
+            name (str): The name of the stim instruction.
+            targets (Iterable[int]): The qubits the operation acts on.
+            args (Sequence[float]): The parenthesized arguments of the
+                instruction, e.g. probabilities. Defaults to no arguments.
+            tag (str): The tag of the instruction. Defaults to no tag.
+
+        """
+        self.circuit.append(name, list(targets), [_arg(arg) for arg in args], tag=tag)
+        if self.insert_ticks:
+            self.circuit.append("TICK")
+
+    def record_targets(self, measurements: Iterable[MeasurementRecord]) -> list:
+        """Get the `rec[-k]` targets of measurements at this point of the circuit."""
+        return [
+            stim.target_rec(measurement.index - self.measurement_count)
+            for measurement in measurements
+        ]
+
+
+def _arg(value: Any) -> float:
+    # NOTE: the emitter writes floats with 8 decimals, round the same way so that
+    # the circuit does not depend on the lowering.
+    return float(f"{value:.8f}")
+
+
+def build_circuit(mt: ir.Method, *, insert_ticks: bool = False) -> stim.Circuit:
+    """Build the circuit of a straight-line squin kernel.
+
+    Args:
+        mt (ir.Method): The kernel, which takes no arguments.
+        insert_ticks (bool): See `SquinToStimPass.insert_ticks`. Defaults to
+            False.
+
+    Returns:
+        stim.Circuit: The circuit of the kernel.
+
+    Raises:
+        interp.InterpreterError: If the kernel uses a statement out of the
+            supported subset, e.g. control flow.
+        NotImplementedError: If the kernel uses a gate or noise channel that is
+            not supported, e.g. a rotation.
+
+    """
+    builder = StimCircuitBuilder(dialects, insert_ticks=insert_ticks)
+    builder.run(mt)
+    return builder.circuit
+
+
+@qubit.dialect.register(key="stim.direct")
+class QubitMethods(interp.MethodTable):
+
+    @interp.impl(qubit.stmts.New)
+    def new(
+        self, interp_: StimCircuitBuilder, frame: interp.Frame, stmt: qubit.stmts.New
+    ):
+        address = interp_.qubit_count
+        interp_.qubit_count += 1
+        return (address,)
+
+    @interp.impl(qubit.stmts.Measure)
+    def measure(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: qubit.stmts.Measure,
+    ):
+        qubits: ilist.IList[int, Any] = frame.get(stmt.qubits)
+        interp_.append("MZ", qubits, (0.0,))
+        start = interp_.measurement_count
+        interp_.measurement_count += len(qubits)
+        return (
+            ilist.IList(
+                [
+                    MeasurementRecord(index)
+                    for index in range(start, start + len(qubits))
+                ]
+            ),
+        )
+
+    @interp.impl(qubit.stmts.Reset)
+    def reset(
+        self, interp_: StimCircuitBuilder, frame: interp.Frame, stmt: qubit.stmts.Reset
+    ):
+        interp_.append("RZ", frame.get(stmt.qubits))
+        return ()
+
+
+@gate.dialect.register(key="stim.direct")
+class GateMethods(interp.MethodTable):
+
+    gate_1q_map: dict[type[gate.stmts.SingleQubitGate], tuple[str, str]] = {
+        gate.stmts.X: ("X", "X"),
+        gate.stmts.Y: ("Y", "Y"),
+        gate.stmts.Z: ("Z", "Z"),
+        gate.stmts.H: ("H", "H"),
+        gate.stmts.S: ("S", "S_DAG"),
+        gate.stmts.SqrtX: ("SQRT_X", "SQRT_X_DAG"),
+        gate.stmts.SqrtY: ("SQRT_Y", "SQRT_Y_DAG"),
+    }
+
+    @interp.impl(gate.stmts.X)
+    @interp.impl(gate.stmts.Y)
+    @interp.impl(gate.stmts.Z)
+    @interp.impl(gate.stmts.H)
+    @interp.impl(gate.stmts.S)
+    @interp.impl(gate.stmts.SqrtX)
+    @interp.impl(gate.stmts.SqrtY)
+    def single_qubit_gate(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: gate.stmts.SingleQubitGate,
+    ):
+        adjoint = getattr(stmt, "adjoint", False)
+        name = self.gate_1q_map[type(stmt)][int(adjoint)]
+        interp_.append(name, frame.get(stmt.qubits))
+        return ()
+
+    @interp.impl(gate.stmts.T)
+    def t(self, interp_: StimCircuitBuilder, frame: interp.Frame, stmt: gate.stmts.T):
+        name = "S_DAG" if stmt.adjoint else "S"
+        interp_.append(name, frame.get(stmt.qubits), tag="T")
+        return ()
+
+    gate_ctrl_2q_map: dict[type[gate.stmts.ControlledGate], str] = {
+        gate.stmts.CX: "CX",
+        gate.stmts.CY: "CY",
+        gate.stmts.CZ: "CZ",
+    }
+
+    @interp.impl(gate.stmts.CX)
+    @interp.impl(gate.stmts.CY)
+    @interp.impl(gate.stmts.CZ)
+    def controlled_gate(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: gate.stmts.ControlledGate,
+    ):
+        targets = _interleave(frame.get(stmt.controls), frame.get(stmt.targets))
+        interp_.append(self.gate_ctrl_2q_map[type(stmt)], targets)
+        return ()
+
+    @interp.impl(gate.stmts.Swap)
+    def swap(
+        self, interp_: StimCircuitBuilder, frame: interp.Frame, stmt: gate.stmts.Swap
+    ):
+        targets = _interleave(frame.get(stmt.qubits1), frame.get(stmt.qubits2))
+        interp_.append("SWAP", targets)
+        return ()
+
+
+@noise.dialect.register(key="stim.direct")
+class NoiseMethods(interp.MethodTable):
+
+    @interp.impl(noise.stmts.SingleQubitPauliChannel)
+    def single_qubit_pauli_channel(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: noise.stmts.SingleQubitPauliChannel,
+    ):
+        args = frame.get_values((stmt.px, stmt.py, stmt.pz))
+        interp_.append("PAULI_CHANNEL_1", frame.get(stmt.qubits), args)
+        return ()
+
+    @interp.impl(noise.stmts.TwoQubitPauliChannel)
+    def two_qubit_pauli_channel(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: noise.stmts.TwoQubitPauliChannel,
+    ):
+        targets = _interleave(frame.get(stmt.controls), frame.get(stmt.targets))
+        args = frame.get(stmt.probabilities)[:15]
+        interp_.append("PAULI_CHANNEL_2", targets, args)
+        return ()
+
+    @interp.impl(noise.stmts.Depolarize)
+    def depolarize(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: noise.stmts.Depolarize,
+    ):
+        interp_.append("DEPOLARIZE1", frame.get(stmt.qubits), (frame.get(stmt.p),))
+        return ()
+
+    @interp.impl(noise.stmts.Depolarize2)
+    def depolarize2(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: noise.stmts.Depolarize2,
+    ):
+        targets = _interleave(frame.get(stmt.controls), frame.get(stmt.targets))
+        interp_.append("DEPOLARIZE2", targets, (frame.get(stmt.p),))
+        return ()
+
+    @interp.impl(noise.stmts.QubitLoss)
+    def qubit_loss(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: noise.stmts.QubitLoss,
+    ):
+        interp_.append(
+            "I_ERROR", frame.get(stmt.qubits), (frame.get(stmt.p),), tag="loss"
+        )
+        return ()
+
+    @interp.impl(noise.stmts.CorrelatedQubitLoss)
+    def correlated_qubit_loss(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: noise.stmts.CorrelatedQubitLoss,
+    ):
+        # NOTE: stim does not broadcast multi-qubit channels, so there is one
+        # correlated error per group of qubits
+        p = frame.get(stmt.p)
+        for qubits in frame.get(stmt.qubits):
+            tag = f"correlated_loss:{interp_.correlated_error_count}"
+            interp_.correlated_error_count += 1
+            interp_.append("I_ERROR", qubits, (p,), tag=tag)
+        return ()
+
+
+@annotate.dialect.register(key="stim.direct")
+class AnnotateMethods(interp.MethodTable):
+
+    @interp.impl(annotate.stmts.SetDetector)
+    def set_detector(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: annotate.stmts.SetDetector,
+    ):
+        targets = interp_.record_targets(frame.get(stmt.measurements))
+        coordinates = [_arg(value) for value in frame.get(stmt.coordinates)]
+        interp_.circuit.append("DETECTOR", targets, coordinates)
+        return (None,)
+
+    @interp.impl(annotate.stmts.SetObservable)
+    def set_observable(
+        self,
+        interp_: StimCircuitBuilder,
+        frame: interp.Frame,
+        stmt: annotate.stmts.SetObservable,
+    ):
+        targets = interp_.record_targets(frame.get(stmt.measurements))
+        interp_.circuit.append("OBSERVABLE_INCLUDE", targets, interp_.observable_count)
+        interp_.observable_count += 1
+        return (None,)
+
+
+def _interleave(controls: Iterable[int], targets: Iterable[int]) -> list[int]:
+    return list(itertools.chain.from_iterable(zip(controls, targets)))
@@ -1,6 +1,6 @@
 import sys
 from typing import IO, Generic, TypeVar, cast
-from dataclasses import dataclass
+from dataclasses import field, dataclass
 
 from kirin import ir, interp
 from kirin.dialects import func
@@ -26,6 +26,8 @@ class EmitStimMain(EmitABC[EmitStimFrame, str], Generic[IO_t]):
     keys = ("emit.stim",)
     void = ""
     correlation_identifier_offset: int = 0
+    _start: int | None = field(default=None, init=False, repr=False)
+    """The position of the stream before anything was emitted to it."""
 
     def initialize(self) -> "EmitStimMain":
         super().initialize()
@@ -49,8 +51,13 @@ class EmitStimMain(EmitABC[EmitStimFrame, str], Generic[IO_t]):
         return method(self, frame, node)
 
     def reset(self):
-        self.io.truncate(0)
-        self.io.seek(0)
+        # NOTE: streams such as pipes or sockets cannot be rewound, and only what
+        # was emitted is discarded from streams that already hold some content
+        if self.io.seekable():
+            if self._start is None:
+                self._start = self.io.tell()
+            self.io.truncate(self._start)
+            self.io.seek(self._start)
 
     def eval_fallback(self, frame: EmitStimFrame, node: ir.Statement) -> tuple:
         return tuple("" for _ in range(len(node.results)))
@@ -12,29 +12,48 @@ from kirin.rewrite import (
     InlineGetItem,
     InlineGetField,
 )
-from kirin.dialects import ilist
+from kirin.dialects import func, ilist
 from kirin.rewrite.abc import RewriteResult
 from kirin.passes.hint_const import HintConst
 from kirin.dialects.scf.stmts import For
 from kirin.dialects.scf.unroll import ForLoop, PickIfElse
 
 from bloqade.stim.passes.simplify_ifs import StimSimplifyIfs
+from bloqade.decoders.dialects.annotate.stmts import SetObservable
 from bloqade.stim.passes.repeat_eligible import get_repeat_range
 from bloqade.stim.passes.hint_const_in_loops import HintConstInLoops
 
 
+@dataclass
 class SelectiveForLoop(ForLoop):
-    """ForLoop rewrite that skips REPEAT-eligible outermost loops.
-
-    Only the outermost REPEAT-eligible loop is preserved. If a loop is
-    nested inside another REPEAT-eligible loop, it gets unrolled.
+    """ForLoop rewrite that skips REPEAT-eligible loops.
+
+    By default, only the outermost REPEAT-eligible loop is preserved. If a
+    loop is nested inside another REPEAT-eligible loop, it gets unrolled.
+
+    With `speculative`, nested REPEAT-eligible loops are preserved as well, and
+    so are loops whose loop variable only indexes lists of measurements. These
+    loops become (nested) REPEAT blocks only if the measurement record offsets
+    in their body turn out to be the same in every iteration, so the result has
+    to be checked after the measurement ID analysis (see `SquinToStimPass`).
+    Loops setting observables are not preserved speculatively though: each
+    iteration of an unrolled loop sets a new observable, whereas every iteration
+    of a REPEAT block would include its measurements in the same one.
     """
 
+    speculative: bool = False
+
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, For):
             return RewriteResult()
         if get_repeat_range(node) is not None and not self._has_repeat_ancestor(node):
             return RewriteResult()
+        if (
+            self.speculative
+            and get_repeat_range(node, record_offsets=True) is not None
+            and not _sets_observable(node)
+        ):
+            return RewriteResult()
         return super().rewrite_Statement(node)
 
     def _has_repeat_ancestor(self, node: For) -> bool:
@@ -47,9 +66,27 @@ class SelectiveForLoop(ForLoop):
         return False
 
 
+def _sets_observable(node: ir.Statement) -> bool:
+    """Check if a statement, or a method it (transitively) invokes, sets an observable."""
+    visited: set[int] = set()
+    worklist = [node]
+    while worklist:
+        stmt = worklist.pop()
+        for inner in stmt.walk():
+            if isinstance(inner, SetObservable):
+                return True
+            if isinstance(inner, func.Invoke) and id(inner.callee) not in visited:
+                visited.add(id(inner.callee))
+                worklist.append(inner.callee.code)
+    return False
+
+
 @dataclass
 class Flatten(Pass):
 
+    speculative: bool = field(default=False, kw_only=True)
+    """Also preserve the loops that may become nested REPEAT blocks, or REPEAT
+    blocks with relative measurement record targets, see `SelectiveForLoop`."""
     simplify_if: StimSimplifyIfs = field(init=False)
     hint_const: HintConst = field(init=False)
     hint_const_in_loops: HintConstInLoops = field(init=False)
@@ -59,7 +96,7 @@ class Flatten(Pass):
         self.simplify_if = StimSimplifyIfs(self.dialects, no_raise=self.no_raise)
         self.hint_const = HintConst(self.dialects, no_raise=self.no_raise)
         self.hint_const_in_loops = HintConstInLoops(
-            self.dialects, no_raise=self.no_raise
+            self.dialects, no_raise=self.no_raise, record_offsets=self.speculative
         )
         self.typeinfer = TypeInfer(self.dialects, no_raise=self.no_raise)
 
@@ -85,7 +122,11 @@ class Flatten(Pass):
         # --- selective unroll (preserve REPEAT-eligible outer loops) ---
         result = self.hint_const_in_loops.unsafe_run(mt).join(result)
         result = Walk(PickIfElse()).rewrite(mt.code).join(result)
-        result = Walk(SelectiveForLoop()).rewrite(mt.code).join(result)
+        result = (
+            Walk(SelectiveForLoop(speculative=self.speculative))
+            .rewrite(mt.code)
+            .join(result)
+        )
 
         # --- re-fold + type infer after unrolling ---
         kirin_fold = Fold(self.dialects, no_raise=self.no_raise)
@@ -9,7 +9,7 @@ hint), plus a few specialized rules for cases that need static-type info
 or scf.For-aware traversal.
 """
 
-from dataclasses import dataclass
+from dataclasses import field, dataclass
 
 from kirin import ir, types, interp
 from kirin.rewrite import Walk, Chain
@@ -94,6 +94,7 @@ class HintLen(RewriteRule):
         return RewriteResult()
 
 
+@dataclass
 class PropagateInitializerHints(RewriteRule):
     """Propagate hints and types from For loop initializers to body block args and results.
 
@@ -101,10 +102,13 @@ class PropagateInitializerHints(RewriteRule):
     downstream GetItem and ilist.New use chains.
     """
 
+    record_offsets: bool = False
+    """Also apply to loops whose loop variable only indexes measurements."""
+
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, For):
             return RewriteResult()
-        if get_repeat_range(node) is None:
+        if get_repeat_range(node, record_offsets=self.record_offsets) is None:
             return RewriteResult()
 
         has_done_something = False
@@ -257,6 +261,7 @@ def _detect_concat_yield_delta(
     return ms_type.vars[0], ms_type.vars[1].data
 
 
+@dataclass
 class PropagateBodyArgTypes(RewriteRule):
     """For preserved scf.For loops where an iter_arg follows the concat
     accumulator pattern (``acc = acc + ms`` or ``acc = ms + acc``), refine
@@ -266,10 +271,13 @@ class PropagateBodyArgTypes(RewriteRule):
     (e.g., ``[acc[-1]]``, ``acc[-2:]``).
     """
 
+    record_offsets: bool = False
+    """Also apply to loops whose loop variable only indexes measurements."""
+
     def rewrite_Statement(self, node: ir.Statement) -> RewriteResult:
         if not isinstance(node, For):
             return RewriteResult()
-        if get_repeat_range(node) is None:
+        if get_repeat_range(node, record_offsets=self.record_offsets) is None:
             return RewriteResult()
 
         body_block = node.body.blocks[0]
@@ -304,8 +312,12 @@ class HintConstInLoops(Pass):
     Also installs the early-terminating constprop override for scf.For.
     """
 
+    record_offsets: bool = field(default=False, kw_only=True)
+    """Also apply to loops whose loop variable only indexes measurements, see
+    `bloqade.stim.passes.repeat_eligible.get_repeat_range`."""
+
     def unsafe_run(self, mt: ir.Method) -> RewriteResult:
-        result = Walk(PropagateInitializerHints()).rewrite(mt.code)
+        result = Walk(PropagateInitializerHints(self.record_offsets)).rewrite(mt.code)
         result = (
             Walk(
                 Chain(
@@ -316,5 +328,9 @@ class HintConstInLoops(Pass):
             .rewrite(mt.code)
             .join(result)
         )
-        result = Walk(PropagateBodyArgTypes()).rewrite(mt.code).join(result)
+        result = (
+            Walk(PropagateBodyArgTypes(self.record_offsets))
+            .rewrite(mt.code)
+            .join(result)
+        )
         return result
@@ -1,15 +1,35 @@
 """Utility for checking if an scf.For is eligible for REPEAT conversion."""
 
+from kirin import ir, types
 from kirin.analysis import const
+from kirin.dialects import py, ilist
 from kirin.dialects.scf.stmts import For
 
+from bloqade.types import MeasurementResultType
 
-def get_repeat_range(node: For) -> range | None:
+MeasurementListType = ilist.IListType[MeasurementResultType, types.Any]
+
+
+def get_repeat_range(node: For, record_offsets: bool = False) -> range | None:
     """Extract the range from a REPEAT-eligible scf.For, or None if not eligible.
 
     Eligible means:
     - iterable has a const.Value hint containing a range (possibly wrapped in IList)
-    - loop variable (first block arg) has no uses
+    - loop variable (first block arg) has no uses, or, if `record_offsets` is
+      set, is only used to index lists of measurements (see
+      `only_indexes_measurements`)
+
+    Args:
+        node (For): The loop to check.
+        record_offsets (bool): Also accept loops whose loop variable only
+            indexes lists of measurements. Such a loop becomes a REPEAT only if
+            the measurement record offsets it refers to are the same in every
+            iteration, which is known after the measurement ID analysis.
+            Defaults to False.
+
+    Returns:
+        range | None: The range iterated over, or None if the loop is not eligible.
+
     """
     hint = node.iterable.hints.get("const")
     if not isinstance(hint, const.Value):
@@ -27,7 +47,37 @@ def get_repeat_range(node: For) -> range | None:
 
     body_block = node.body.blocks[0]
     loop_var = body_block.args[0]
-    if len(loop_var.uses) > 0:
+    if len(loop_var.uses) > 0 and not (
+        record_offsets and only_indexes_measurements(loop_var)
+    ):
         return None
 
     return r
+
+
+def only_indexes_measurements(value: ir.SSAValue) -> bool:
+    """Check if an integer is only used, possibly after arithmetic, to index
+    lists of measurements.
+
+    Args:
+        value (ir.SSAValue): The integer, e.g. a loop variable.
+
+    Returns:
+        bool: True if every use of `value` is either the index of a `py.GetItem`
+            on a list of measurements, or a pure arithmetic statement whose
+            result satisfies the same condition.
+
+    """
+    worklist = [value]
+    while worklist:
+        value = worklist.pop()
+        for use in value.uses:
+            stmt = use.stmt
+            if isinstance(stmt, py.GetItem) and stmt.index is value:
+                if not stmt.obj.type.is_subseteq(MeasurementListType):
+                    return False
+            elif isinstance(stmt, (py.binop.BinOp, py.unary.UnaryOp)):
+                worklist.extend(stmt.results)
+            else:
+                return False
+    return True
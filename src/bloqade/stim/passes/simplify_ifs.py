@@ -10,10 +10,13 @@ from kirin.rewrite import (
     DeadCodeElimination,
     CommonSubexpressionElimination,
 )
-from kirin.dialects.scf.trim import UnusedYield
 from kirin.dialects.ilist.passes import ConstList2IList
 
-from ..rewrite.ifs_handling import StimLiftThenBody, StimSplitIfStmts
+from ..rewrite.ifs_handling import (
+    StimUnusedYield,
+    StimLiftThenBody,
+    StimSplitIfStmts,
+)
 
 
 @dataclass
@@ -22,7 +25,7 @@ class StimSimplifyIfs(Pass):
     def unsafe_run(self, mt: ir.Method):
 
         result = Chain(
-            Walk(UnusedYield()),
+            Walk(StimUnusedYield()),
             Walk(StimLiftThenBody()),
             # remove yields (if possible), then lift out as much stuff as possible
             Walk(DeadCodeElimination()),
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import warnings
+from dataclasses import field, dataclass
 
 from kirin.rewrite import (
     Walk,
@@ -7,6 +8,7 @@ from kirin.rewrite import (
     DeadCodeElimination,
     CommonSubexpressionElimination,
 )
+from kirin.dialects import scf, func
 from kirin.ir.method import Method
 from kirin.passes.abc import Pass
 from kirin.rewrite.abc import RewriteResult
@@ -30,6 +32,7 @@ from bloqade.stim.rewrite import (
 from bloqade.squin.rewrite import SquinU3ToClifford
 from bloqade.rewrite.passes import CanonicalizeIList
 from bloqade.analysis.address import AddressAnalysis
+from bloqade.analysis.manager import AnalysisManager
 from bloqade.record_idx_helper import dialect as record_idx_helper_dialect
 from bloqade.analysis.measure_id import MeasurementIDAnalysis
 from bloqade.stim.passes.flatten import Flatten
@@ -51,12 +54,52 @@ class SquinToStimPass(Pass):
     a diagram. ``TICK`` is a timing-only annotation, so enabling this does not
     change measurement-record or detector/observable indexing. Default off to
     keep existing Stim output unchanged."""
+    analysis_manager: AnalysisManager = field(
+        default_factory=AnalysisManager, kw_only=True
+    )
+    """Cache of analysis results, shared with the other passes of a pipeline."""
+    preserve_loops: bool = field(default=True, kw_only=True)
+    """Lower nested loops, and loops whose loop variable only indexes
+    measurements, to (nested) ``REPEAT`` blocks with relative ``rec[-k]``
+    targets instead of unrolling them. This holds only if the measurement
+    record offsets of their body are the same in every iteration; otherwise
+    the kernel is lowered again with these loops unrolled. Loops setting
+    observables are unrolled as without this option, so that every iteration
+    still sets its own observable."""
 
     def unsafe_run(self, mt: Method) -> RewriteResult:
         """Run the squin-to-stim lowering rewrites in place on ``mt``."""
-        rewrite_result = Flatten(dialects=mt.dialects, no_raise=self.no_raise).fixpoint(
-            mt
-        )
+        if not (self.preserve_loops and _may_have_loops(mt)):
+            return self._lower(mt, preserve_loops=False)
+
+        # NOTE: the trial is discarded unless it lowers the whole kernel to stim,
+        # in which case the kernel is lowered as before: its warnings and errors
+        # are raised by that lowering instead.
+        trial = mt.similar()
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                self._lower(trial, preserve_loops=True)
+            lowered = all(
+                stmt.dialect is None or stmt.dialect in stim_main
+                for stmt in trial.callable_region.walk()
+            )
+        except Exception:
+            lowered = False
+        finally:
+            self.analysis_manager.invalidate(trial)
+
+        if not lowered:
+            # e.g. the record offsets of a preserved loop depend on the iteration
+            return self._lower(mt, preserve_loops=False)
+
+        mt.code = trial.code
+        return self.analysis_manager.update(mt, RewriteResult(has_done_something=True))
+
+    def _lower(self, mt: Method, preserve_loops: bool) -> RewriteResult:
+        rewrite_result = Flatten(
+            dialects=mt.dialects, no_raise=self.no_raise, speculative=preserve_loops
+        ).fixpoint(mt)
 
         validation = StimFromSquinValidation()
         _, validation_errors = validation.run(mt)
@@ -66,11 +109,13 @@ class SquinToStimPass(Pass):
                 errors=validation_errors,
             )
 
-        address_analysis = AddressAnalysis(dialects=mt.dialects)
-        addresses = address_analysis.run(mt)[0].entries
+        self.analysis_manager.update(mt, rewrite_result)
+        addresses = self.analysis_manager.run(AddressAnalysis, mt).frame.entries
 
         # --- prepare hints + analyses ---
-        hint_const_in_loops = HintConstInLoops(self.dialects, no_raise=self.no_raise)
+        hint_const_in_loops = HintConstInLoops(
+            self.dialects, no_raise=self.no_raise, record_offsets=preserve_loops
+        )
         rewrite_result = hint_const_in_loops.unsafe_run(mt).join(rewrite_result)
 
         # Assign canonical observable indices once so partial and resolve
@@ -162,4 +207,20 @@ class SquinToStimPass(Pass):
         if self.insert_ticks:
             rewrite_result = Walk(InsertTicks()).rewrite(mt.code).join(rewrite_result)
 
-        return rewrite_result
+        return self.analysis_manager.update(mt, rewrite_result)
+
+
+def _may_have_loops(mt: Method, seen: set[Method] | None = None) -> bool:
+    """Check if a method, or a method it calls, may contain an scf.For."""
+    seen = set() if seen is None else seen
+    seen.add(mt)
+    for stmt in mt.callable_region.walk():
+        if isinstance(stmt, (scf.For, func.Call, func.Lambda)):
+            return True
+        if (
+            isinstance(stmt, func.Invoke)
+            and stmt.callee not in seen
+            and _may_have_loops(stmt.callee, seen)
+        ):
+            return True
+    return False
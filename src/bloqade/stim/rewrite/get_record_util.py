@@ -2,7 +2,7 @@ from kirin import ir
 from kirin.dialects import py
 
 from bloqade.stim.dialects import auxiliary
-from bloqade.analysis.measure_id.lattice import RawMeasureId, MeasureIdTuple
+from bloqade.analysis.measure_id.lattice import MeasureIdTuple
 
 
 def insert_get_records(
@@ -11,10 +11,11 @@ def insert_get_records(
     """
     Insert GetRecord statements before the given node
     """
+    indices = measure_id_tuple.indices()
+    assert indices is not None
+
     get_record_ssas = []
-    for measure_id in measure_id_tuple.data:
-        assert isinstance(measure_id, RawMeasureId)
-        target_rec_idx = (measure_id.idx - 1) - meas_count_at_stmt
+    for target_rec_idx in (indices - (meas_count_at_stmt + 1)).tolist():
         idx_stmt = py.constant.Constant(target_rec_idx)
         idx_stmt.insert_before(node)
         get_record_stmt = auxiliary.GetRecord(idx_stmt.result)
@@ -3,6 +3,7 @@ from dataclasses import field, dataclass
 from kirin import ir
 from kirin.dialects import scf, func
 from kirin.rewrite.abc import RewriteResult
+from kirin.dialects.scf.trim import UnusedYield
 
 from bloqade.squin import gate
 from bloqade.rewrite.rules import LiftThenBody, SplitIfStmts
@@ -109,3 +110,29 @@ class StimSplitIfStmts(IsIfElseSimplifiable, SplitIfStmts):
             return RewriteResult()
 
         return super().rewrite_Statement(node)
+
+
+class StimUnusedYield(UnusedYield):
+    """Trim unused results from `scf.For` and `scf.IfElse` statements.
+
+    Unlike `UnusedYield`, a result of an `scf.For` is only trimmed if its block
+    argument is unused as well: trimming it replaces the block argument by the
+    initializer, which is wrong when the body reads the loop-carried value, e.g.
+    a history of measurements only used by the detectors inside the loop.
+    """
+
+    def scan_unused(self, node: ir.Statement):
+        if not isinstance(node, scf.For):
+            return super().scan_unused(node)
+
+        any_unused = False
+        uses: list[int] = []
+        results: list[ir.ResultValue] = []
+        block_args = node.body.blocks[0].args[1:]
+        for idx, (result, block_arg) in enumerate(zip(node.results, block_args)):
+            if result.uses or block_arg.uses:
+                uses.append(idx)
+                results.append(result)
+            else:
+                any_unused = True
+        return any_unused, set(uses), results
@@ -7,11 +7,6 @@ from kirin.rewrite.abc import RewriteRule, RewriteResult
 from bloqade.analysis.measure_id import MeasureIDFrame
 from bloqade.analysis.observable_idx import ObservableIdxFrame
 from bloqade.stim.dialects.auxiliary import Detector, GetRecord, ObservableInclude
-from bloqade.analysis.measure_id.lattice import (
-    RawMeasureId,
-    MeasureIdBool,
-    MeasureIdTuple,
-)
 from bloqade.decoders.dialects.annotate.stmts import SetDetector, SetObservable
 from bloqade.stim.rewrite.set_detector_partial import extract_coord_ssas
 
@@ -49,19 +44,12 @@ class ResolveSetAnnotate(RewriteRule):
         a concrete MeasureIdTuple, num_measures_at_stmt missing, or an
         element isn't a concrete RawMeasureId / MeasureIdBool).
         """
-        tup = self.measure_id_frame.entries.get(measurements)
-        if not isinstance(tup, MeasureIdTuple):
-            return None
-
-        num_measures_here = self.measure_id_frame.num_measures_at_stmt.get(node)
-        if num_measures_here is None:
+        offsets = self.measure_id_frame.record_offsets(measurements, node)
+        if offsets is None:
             return None
 
         get_record_ssas: list[ir.SSAValue] = []
-        for elem in tup.data:
-            if not isinstance(elem, (RawMeasureId, MeasureIdBool)):
-                return None
-            rec_idx = (elem.idx - 1) - num_measures_here
+        for rec_idx in offsets.tolist():
             idx_const = py.Constant(rec_idx)
             idx_const.insert_before(node)
             get_record = GetRecord(id=idx_const.result)
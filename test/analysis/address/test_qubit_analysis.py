@@ -292,3 +292,18 @@ def test_for_loop_body_values():
     assert address.ConstResult(const.Value(0)) in for_analysis
     assert address.ConstResult(const.Value(None)) in for_analysis
     assert address.Unknown() in for_analysis
+
+
+def test_address_reg_compact():
+    reg = address.AddressReg(data=(3, 5, 7, 9))
+    assert reg.data == range(3, 11, 2)
+    assert reg == address.AddressReg(data=range(3, 10, 2))
+    assert reg.is_subseteq(address.AddressReg(data=[3, 5, 7, 9]))
+    assert reg.qubits == tuple(address.AddressQubit(i) for i in (3, 5, 7, 9))
+
+    assert address.AddressReg(data=(4,)).data == range(4, 5)
+    assert address.AddressReg(data=()).data == range(0)
+
+    reg = address.AddressReg(data=[0, 1, 3])
+    assert reg.data == (0, 1, 3)
+    assert not reg.is_subseteq(address.AddressReg(data=range(3)))
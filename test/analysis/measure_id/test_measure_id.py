@@ -7,13 +7,16 @@ from bloqade.stim.passes.flatten import Flatten
 from bloqade.analysis.measure_id.lattice import (
     Predicate,
     DetectorId,
+    AnyMeasureId,
     NotMeasureId,
     ObservableId,
     RawMeasureId,
     MeasureIdBool,
+    MeasureIdRange,
     MeasureIdTuple,
     InvalidMeasureId,
 )
+from bloqade.decoders.dialects.annotate.stmts import SetDetector, SetObservable
 
 
 def results_at(kern, block_id, stmt_id):
@@ -49,6 +52,63 @@ def test_subset_eq_MeasureIdBool():
     assert not m0.is_subseteq(m3)
 
 
+def test_measure_id_range():
+    ids = MeasureIdRange(range(1, 5), Predicate.IS_ONE)
+    as_tuple = tuple(MeasureIdBool(idx, Predicate.IS_ONE) for idx in range(1, 5))
+
+    assert len(ids) == 4
+    assert ids[1] == MeasureIdBool(2, Predicate.IS_ONE)
+    assert ids == as_tuple and as_tuple == ids
+    assert ids[1:3] == MeasureIdRange(range(2, 4), Predicate.IS_ONE)
+    assert ids != MeasureIdRange(range(1, 5))
+    assert ids[:2] + ids[2:] == ids
+    assert isinstance(ids[:2] + ids[2:], MeasureIdRange)
+    assert () + ids == as_tuple
+
+    t0 = MeasureIdTuple(data=MeasureIdRange(range(1, 5)), obj_type=ilist.IList)
+    t1 = MeasureIdTuple(data=MeasureIdRange(range(5, 9)), obj_type=ilist.IList)
+    raw = MeasureIdTuple(
+        data=tuple(RawMeasureId(idx) for idx in range(1, 5)), obj_type=ilist.IList
+    )
+
+    assert t0 == raw
+    assert t0.is_subseteq(raw) and raw.is_subseteq(t0)
+    assert not t0.is_subseteq(t1)
+    assert t0.join(raw) == t0
+    assert t0.join(t1) == MeasureIdTuple(
+        data=(AnyMeasureId(),) * 4, obj_type=ilist.IList
+    )
+    assert t0.meet(t1) == MeasureIdTuple(
+        data=(InvalidMeasureId(),) * 4, obj_type=ilist.IList
+    )
+
+
+def test_record_offsets():
+    @squin.kernel
+    def test():
+        q = squin.qalloc(3)
+        m0 = squin.broadcast.measure(q)
+        m1 = squin.broadcast.measure(q)
+        squin.set_detector([m1[2], m0[0]], coordinates=[0, 0])
+        squin.set_observable(m0 + m1)
+
+    Flatten(test.dialects).fixpoint(test)
+    frame, _ = MeasurementIDAnalysis(test.dialects).run(test)
+
+    ranged = MeasureIdTuple(data=MeasureIdRange(range(2, 5)), obj_type=ilist.IList)
+    assert ranged.indices().tolist() == [2, 3, 4]
+    partial = MeasureIdTuple(data=(RawMeasureId(1), AnyMeasureId()), obj_type=tuple)
+    assert partial.indices() is None
+
+    offsets = {}
+    for stmt in test.callable_region.walk():
+        if isinstance(stmt, (SetDetector, SetObservable)):
+            offsets[type(stmt)] = frame.record_offsets(stmt.measurements, stmt)
+
+    assert offsets[SetDetector].tolist() == [-1, -6]
+    assert offsets[SetObservable].tolist() == [-6, -5, -4, -3, -2, -1]
+
+
 def test_add():
     @squin.kernel
     def test():
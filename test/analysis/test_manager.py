@@ -0,0 +1,77 @@
+from kirin.rewrite import Walk
+from kirin.rewrite.abc import RewriteResult
+
+from bloqade import qasm2
+from bloqade.analysis import address
+from bloqade.qasm2.rewrite import RaiseRegisterRule
+from bloqade.analysis.manager import AnalysisManager
+from bloqade.qasm2.passes.fold import QASM2Fold
+from bloqade.qasm2.passes.glob import GlobalToParallel
+from bloqade.qasm2.passes.parallel import ParallelToUOp
+
+
+def make_kernel():
+    @qasm2.extended
+    def main():
+        q = qasm2.qreg(2)
+        qasm2.h(q[0])
+        qasm2.cx(q[0], q[1])
+
+    return main
+
+
+def test_cache():
+    main = make_kernel()
+    manager = AnalysisManager()
+
+    result = manager.run(address.AddressAnalysis, main)
+    assert isinstance(result.analysis, address.AddressAnalysis)
+    assert result.analysis.qubit_count == 2
+    assert manager.run(address.AddressAnalysis, main) is result
+    assert (manager.hits, manager.misses) == (1, 1)
+
+    # unchanged method
+    manager.update(main, RewriteResult())
+    assert manager.run(address.AddressAnalysis, main) is result
+
+    # reported rewrite
+    manager.update(main, RewriteResult(has_done_something=True))
+    assert manager.run(address.AddressAnalysis, main) is not result
+    assert (manager.hits, manager.misses) == (2, 2)
+
+    # unreported rewrite
+    result = manager.run(address.AddressAnalysis, main)
+    assert Walk(RaiseRegisterRule()).rewrite(main.code).has_done_something
+    assert manager.run(address.AddressAnalysis, main) is not result
+
+    # different dialects
+    result = manager.run(address.AddressAnalysis, main)
+    assert (
+        manager.run(
+            address.AddressAnalysis, main, main.dialects.discard(qasm2.dialects.glob)
+        )
+        is not result
+    )
+
+    manager.invalidate()
+    assert manager.run(address.AddressAnalysis, main) is not result
+
+
+def test_maxsize():
+    kernels = [make_kernel() for _ in range(3)]
+    manager = AnalysisManager(maxsize=2)
+    results = [manager.run(address.AddressAnalysis, mt) for mt in kernels]
+
+    assert manager.run(address.AddressAnalysis, kernels[2]) is results[2]
+    assert manager.run(address.AddressAnalysis, kernels[0]) is not results[0]
+
+
+def test_shared_between_passes():
+    main = make_kernel()
+    QASM2Fold(main.dialects).fixpoint(main)
+    manager = AnalysisManager()
+
+    GlobalToParallel(main.dialects, analysis_manager=manager)(main)
+    ParallelToUOp(main.dialects, analysis_manager=manager)(main)
+    assert (manager.hits, manager.misses) == (1, 1)
+    assert manager.time_saved > 0
@@ -0,0 +1,75 @@
+import random
+import itertools
+
+import cirq
+import pytest
+
+from bloqade.cirq_utils.noise import OneZoneConflictGraph
+
+
+def pairwise_edges(moment: cirq.Moment) -> set:
+    """The conflict edges, comparing every pair of gates."""
+    gates = [op.qubits for op in moment.operations]
+    edges = set(gates)
+    for (a0, a1), (b0, b1) in itertools.combinations(gates, 2):
+        for axis in ("row", "col"):
+
+            def coord(qubit):
+                return getattr(qubit, axis)
+
+            if (coord(a0) == coord(b0)) ^ (coord(a1) == coord(b1)):
+                edges |= {(a0, b0), (a0, b1), (a1, b0), (a1, b1)}
+            if (coord(a0) < coord(b0)) ^ (coord(a1) < coord(b1)):
+                edges |= {(a0, b0), (a1, b1)}
+            if (coord(a1) < coord(b0)) ^ (coord(a0) < coord(b1)):
+                edges |= {(a0, b1), (a1, b0)}
+    return edges
+
+
+def random_moment(seed: int, side: int = 6) -> cirq.Moment:
+    rng = random.Random(seed)
+    qubits = cirq.GridQubit.rect(side, side)
+    chosen = rng.sample(qubits, rng.randrange(2, len(qubits), 2))
+    return cirq.Moment(cirq.CZ(a, b) for a, b in zip(chosen[::2], chosen[1::2]))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_edges(seed: int):
+    moment = random_moment(seed)
+    graph = OneZoneConflictGraph(moment)
+    graph.get_move_schedule()
+
+    assert graph.edges == pairwise_edges(moment)
+    for node, degree in graph.degrees.items():
+        assert degree == sum(node in edge for edge in graph.edges)
+
+
+@pytest.mark.parametrize("mover_limit", [1, 3, 10000])
+def test_move_schedule(mover_limit: int):
+    moment = random_moment(0)
+    graph = OneZoneConflictGraph(moment)
+    schedule = graph.get_move_schedule(mover_limit=mover_limit)
+
+    movers = [node for nodes in schedule.values() for node in nodes]
+    assert len(movers) == len(set(movers)) == len(moment.operations)
+    for op in moment.operations:
+        assert len(set(op.qubits) & set(movers)) == 1
+
+    for nodes in schedule.values():
+        assert len(nodes) <= mover_limit
+        for node1, node2 in itertools.combinations(nodes, 2):
+            assert (node1, node2) not in graph.edges
+            assert (node2, node1) not in graph.edges
+
+
+def test_full_array_moment():
+    # NOTE: neighbouring pairs on every row of a 40x40 array, too slow to build by
+    # comparing every pair of gates
+    moment = cirq.Moment(
+        cirq.CZ(cirq.GridQubit(row, 2 * col), cirq.GridQubit(row, 2 * col + 1))
+        for row in range(40)
+        for col in range(20)
+    )
+    schedule = OneZoneConflictGraph(moment).get_move_schedule()
+
+    assert sum(len(nodes) for nodes in schedule.values()) == len(moment.operations)
@@ -175,3 +175,39 @@ def test_one_zone_model_parallelizes_interleaved_circuit(monkeypatch):
     model.noisy_moments(circuit.moments, qubits)
 
     assert len(calls) == 1
+
+
+def test_one_zone_model_delayed_measurement_errors():
+    """Mid-circuit measurements get a bit flip growing with the CZ layers left."""
+    qubits = cirq.LineQubit.range(2)
+    circuit = cirq.Circuit(
+        cirq.measure(qubits[0], key="a"),
+        cirq.CZ(*qubits),
+        cirq.measure(qubits[1], key="b"),
+        cirq.CZ(*qubits),
+        cirq.CZ(*qubits),
+        cirq.measure(*qubits, key="c"),
+    )
+
+    model = GeminiOneZoneNoiseModel()
+    noisy = transform_circuit(circuit, to_native_gateset=False, model=model)
+
+    flips = [
+        (op.qubits, op.gate.p)
+        for op in noisy.all_operations()
+        if isinstance(op.gate, cirq.BitFlipChannel)
+    ]
+
+    pm = 2 * model.sitter_pauli_rates[0]
+    ps = 2 * model.cz_unpaired_pauli_rates[0]
+    p = 2 * pm * (1 - ps) * (1 - pm) + (1 - pm) ** 2 * ps + pm**2 * ps
+    expected = [
+        (qubits[:1], (1 - (1 - 2 * p) ** 3) / 2),
+        (qubits[1:], (1 - (1 - 2 * p) ** 2) / 2),
+        (qubits[:1], 0.0),
+        (qubits[1:], 0.0),
+    ]
+    assert len(flips) == len(expected)
+    for (qs, prob), (expected_qs, expected_prob) in zip(flips, expected):
+        assert qs == tuple(expected_qs)
+        assert math.isclose(prob, expected_prob)
@@ -0,0 +1,48 @@
+import random
+
+import pytest
+
+from bloqade.cirq_utils.noise import _two_zone_utils
+
+
+def apply_swaps(source, swaps):
+    state = _two_zone_utils.expand(source)
+    for swap in swaps:
+        _two_zone_utils.apply_swap(state, swap)
+    return _two_zone_utils.regroup(state)
+
+
+@pytest.mark.parametrize(
+    "source, target, num_swaps",
+    [
+        ([(0, 1), (2, 3)], [(0, 1), (2, 3)], 0),
+        ([(0, 1), (2, 3)], [(2, 3), (0, 1)], 0),
+        ([(0, 1), (2, 3)], [(0, 2), (1, 3)], 1),
+        ([(0, 1), (2, 3), (4, 5)], [(0, 3), (2, 5), (4, 1)], 2),
+        ([(0, 1), (2,), ()], [(0, 2), (1,), ()], 1),
+        ([(0,), (1,), ()], [(0, 1), (), ()], 1),
+    ],
+)
+def test_get_equivalent_swaps(source, target, num_swaps):
+    swaps = _two_zone_utils.get_equivalent_swaps(source, target)
+
+    assert len(swaps) == num_swaps
+    assert _two_zone_utils.canonical_form(
+        apply_swaps(source, swaps)
+    ) == _two_zone_utils.canonical_form(target)
+
+
+def test_get_equivalent_swaps_wide_layer():
+    rng = random.Random(0)
+    qubits = list(range(1000))
+    rng.shuffle(qubits)
+    source = list(zip(qubits[::2], qubits[1::2]))
+    rng.shuffle(qubits)
+    target = list(zip(qubits[::2], qubits[1::2]))
+
+    swaps = _two_zone_utils.get_equivalent_swaps(source, target)
+
+    assert len(swaps) < len(qubits)
+    assert _two_zone_utils.canonical_form(
+        apply_swaps(source, swaps)
+    ) == _two_zone_utils.canonical_form(target)
@@ -1,3 +1,5 @@
+import numpy as np
+
 from bloqade.cirq_utils.lineprog import Variable, LPProblem
 
 
@@ -33,3 +35,43 @@ def test3():
     problem = LPProblem()
     problem.add_abs(v1 - 1)
     print("Test 3:", problem.solve())
+
+
+def test_assemble():
+    v1 = Variable()
+    v2 = Variable()
+
+    problem = LPProblem()
+    problem.add_gez(v2 - v1 - 1.0)
+    problem.add_eqz(v1 + 2.0)
+    problem.add_quadratic(2 * v1 + v2 - 3)
+    problem.add_linear(v1)
+    problem.add_linear(v1 + v2)
+
+    basis, A_gez, B_gez, A_eqz, B_eqz, Q, C = problem._assemble()
+
+    assert basis == [v1, v2]
+    assert np.array_equal(A_gez.toarray(), [[-1.0, 1.0]])
+    assert np.array_equal(B_gez, [-1.0])
+    assert np.array_equal(A_eqz.toarray(), [[1.0, 0.0]])
+    assert np.array_equal(B_eqz, [2.0])
+    assert np.array_equal(Q.toarray(), [[4.0, 2.0], [2.0, 1.0]])
+    assert np.array_equal(C, [2.0 - 6.0, 1.0 - 3.0])
+
+
+def test_add_linear_does_not_modify_objective():
+    v1 = Variable()
+    v2 = Variable()
+
+    objective = 2 * v2
+    problem = LPProblem(linear_objective=objective)
+    problem.add_linear(v1 + v2)
+    problem.add_linear(v1)
+
+    assert objective.coeffs == {v2: 2}
+    basis, *_, C = problem._assemble()
+    assert basis == [v2, v1]
+    assert np.array_equal(C, [3.0, 2.0])
+
+    combined = problem + LPProblem(linear_objective=1.0 * v1)
+    assert combined.linear_objective.coeffs == {v2: 3, v1: 3}
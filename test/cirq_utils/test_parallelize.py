@@ -7,6 +7,7 @@ import pytest
 from bloqade.cirq_utils import (
     parallelize,
     remove_tags,
+    auto_similarity,
     block_similarity,
     moment_similarity,
 )
@@ -127,3 +128,58 @@ def test_random_circuits(n_qubits: int, depth: int, op_density: float):
         print("Parallelized Circuit:")
         print(parallelized_circuit)
         raise e
+
+
+def test_auto_similarity_buckets():
+    q = cirq.LineQubit.range(4)
+    phxz = cirq.PhasedXZGate(x_exponent=0.5, z_exponent=0.25, axis_phase_exponent=0)
+    # NOTE: same unitary as `phxz` up to a global phase
+    phxz2 = cirq.PhasedXZGate(x_exponent=-1.5, z_exponent=0.25, axis_phase_exponent=0)
+    other = cirq.PhasedXZGate(x_exponent=0.5, z_exponent=0.5, axis_phase_exponent=0)
+    circuit = cirq.Circuit(
+        phxz(q[0]),
+        phxz2(q[1]),
+        other(q[2]),
+        phxz(q[0]),
+        cirq.CZ(q[0], q[1]),
+        cirq.CZ(q[2], q[3]),
+    )
+
+    tagged, weights = auto_similarity(circuit, weight_1q=1.0, weight_2q=2.0)
+    ops = list(tagged.all_operations())
+
+    assert weights == {"AUTO:0": 1.0, "AUTO:1": 1.0, "AUTO:4": 2.0}
+    assert ops[0].tags == ("AUTO:0",)
+    assert ops[1].tags == ("AUTO:0", "AUTO:1")
+    assert ops[2].tags == ()
+    assert ops[3].tags == ("AUTO:1",)
+    assert ops[4].tags == ops[5].tags == ("AUTO:4",)
+
+
+@pytest.mark.parametrize(
+    "window_depth, window_overlap, max_workers",
+    [(1, 0, 1), (3, 0, 1), (3, 2, 1), (4, 1, 2)],
+)
+def test_parallelize_windowed(window_depth: int, window_overlap: int, max_workers: int):
+    circuit = cirq.testing.random_circuit(
+        cirq.LineQubit.range(4), n_moments=10, op_density=0.8, random_state=7
+    )
+    parallelized = parallelize(
+        circuit,
+        window_depth=window_depth,
+        window_overlap=window_overlap,
+        max_workers=max_workers,
+    )
+
+    assert cirq.allclose_up_to_global_phase(
+        cirq.unitary(circuit), cirq.unitary(parallelized), atol=1e-6
+    )
+    assert all(not op.tags for op in parallelized.all_operations())
+
+
+def test_parallelize_windowed_invalid():
+    circuit = cirq.Circuit(cirq.H(cirq.LineQubit(0)))
+    with pytest.raises(ValueError):
+        parallelize(circuit, window_depth=0)
+    with pytest.raises(ValueError):
+        parallelize(circuit, window_depth=2, window_overlap=-1)
@@ -1,5 +1,6 @@
 from unittest.mock import Mock, call
 
+import numpy as np
 import pytest
 from kirin import ir
 
@@ -35,7 +36,7 @@ def test_pauli_channel():
         return q
 
     rng_state = Mock()
-    rng_state.choice.side_effect = ["y", "i"]
+    rng_state.choice.side_effect = [np.array([2]), np.array([0])]
     sim_reg = run_mock(test_atom_loss, rng_state)
     sim_reg.assert_has_calls([call.y(0)])
 
@@ -92,8 +93,8 @@ def test_cz_pauli_channel_false():
         return q
 
     rng_state = Mock()
-    rng_state.choice.side_effect = ["y"]
-    rng_state.uniform.return_value = 0.5
+    rng_state.choice.side_effect = [np.array([2])]
+    rng_state.uniform.side_effect = lambda size: np.full(size, 0.5)
     sim_reg = run_mock(test_atom_loss, rng_state)
     sim_reg.assert_has_calls([call.mcz([0], 1), call.m(0), call.y(1)])
 
@@ -133,8 +134,8 @@ def test_cz_pauli_channel_true():
         return q
 
     rng_state = Mock()
-    rng_state.choice.side_effect = ["y", "x"]
-    rng_state.uniform.return_value = 0.5
+    rng_state.choice.side_effect = [np.array([2]), np.array([1])]
+    rng_state.uniform.side_effect = lambda size: np.full(size, 0.5)
     sim_reg = run_mock(test_atom_loss, rng_state)
 
     sim_reg.assert_has_calls([call.y(0), call.x(1), call.mcz([0], 1)])
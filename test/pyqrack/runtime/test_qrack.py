@@ -1,13 +1,16 @@
 import math
+import multiprocessing
 from unittest.mock import Mock, call
 
 import cirq
 import numpy as np
+import pytest
 from kirin import ir
+from kirin.dialects import func
 
 from bloqade import qasm2, squin
 from pyqrack.pauli import Pauli
-from bloqade.pyqrack import StackMemorySimulator
+from bloqade.pyqrack import CRegister, StackMemorySimulator
 from bloqade.pyqrack.base import MockMemory, PyQrackInterpreter
 
 
@@ -368,6 +371,35 @@ def test_get_qubits():
     assert len(qubits2) == 6
 
 
+def test_address_analysis_cache():
+    @squin.kernel
+    def program():
+        q = squin.qalloc(2)
+        squin.h(q[0])
+        squin.cx(q[0], q[1])
+        return q
+
+    emulator = StackMemorySimulator()
+    emulator.task(program)
+    emulator.task(program)
+    assert emulator.analysis_cache_hits == 1
+    assert emulator.analysis_cache_misses == 1
+
+    # rewriting the kernel invalidates the cached analysis
+    stmt = next(
+        stmt
+        for stmt in program.callable_region.walk()
+        if isinstance(stmt, func.Invoke) and not stmt.result.uses
+    )
+    stmt.delete()
+    emulator.task(program).run()
+    assert emulator.analysis_cache_hits == 1
+    assert emulator.analysis_cache_misses == 2
+
+    emulator.clear_analysis_cache()
+    assert emulator.analysis_cache_hits == emulator.analysis_cache_misses == 0
+
+
 def test_batch_run():
     @squin.kernel
     def coinflip():
@@ -397,6 +429,210 @@ def test_batch_run_IList_converter():
     assert len(set(results.keys()).symmetric_difference({(False,), (True,)})) == 0
 
 
+def test_batch_run_terminal_sampling():
+    @squin.kernel
+    def ghz():
+        q = squin.qalloc(3)
+        squin.h(q[0])
+        squin.cx(q[0], q[1])
+        squin.cx(q[1], q[2])
+        return squin.broadcast.measure(q)
+
+    task = StackMemorySimulator(min_qubits=3).task(ghz)
+    results: dict = task.batch_run(1000, terminal_sampling=True)
+    assert set(results.keys()) <= {(False,) * 3, (True,) * 3}
+    assert abs(results[(True,) * 3] - 0.5) < 0.1
+
+    @qasm2.main
+    def bell():
+        q = qasm2.qreg(2)
+        c = qasm2.creg(2)
+        qasm2.h(q[0])
+        qasm2.cx(q[0], q[1])
+        qasm2.measure(q, c)
+        return c
+
+    task = StackMemorySimulator(min_qubits=2).task(bell)
+    results = task.batch_run(1000, terminal_sampling=True)
+    assert set(results.keys()) <= {(0, 0), (1, 1)}
+    assert abs(sum(results.values()) - 1.0) < 1e-12
+
+    @squin.kernel
+    def constant():
+        q = squin.qalloc(1)
+        squin.x(q[0])
+        return 1
+
+    task = StackMemorySimulator(min_qubits=1).task(constant)
+    assert task.batch_run(10, terminal_sampling=True) == {1: 1.0}
+    assert task.batch_run(0, terminal_sampling=True) == {}
+
+
+def test_batch_run_terminal_sampling_fallback():
+    @squin.kernel
+    def mid_circuit():
+        q = squin.qalloc(1)
+        squin.h(q[0])
+        m0 = squin.measure(q[0])
+        squin.x(q[0])
+        m1 = squin.measure(q[0])
+        return [m0, m1]
+
+    task = StackMemorySimulator(min_qubits=1).task(mid_circuit)
+    results: dict = task.batch_run(1000, terminal_sampling=True)
+    assert set(results.keys()) == {(False, True), (True, False)}
+
+    @squin.kernel
+    def noisy():
+        q = squin.qalloc(1)
+        squin.bit_flip(1.0, q[0])
+        return squin.measure(q[0])
+
+    task = StackMemorySimulator(min_qubits=1).task(noisy)
+    results = task.batch_run(10, terminal_sampling=True)
+    assert results == {True: 1.0}
+
+
+def test_batch_run_tape():
+    @squin.kernel
+    def mid_circuit():
+        q = squin.qalloc(2)
+        squin.h(q[0])
+        squin.cx(q[0], q[1])
+        m0 = squin.measure(q[0])
+        squin.x(q[0])
+        m1 = squin.measure(q[0])
+        return [m0, m1, squin.measure(q[1])]
+
+    task = StackMemorySimulator().task(mid_circuit)
+    tape = task.compile_tape()
+    assert tape is not None
+    assert sum(is_measurement for *_, is_measurement in tape.instructions) == 3
+
+    results: dict = task.batch_run(1000, tape=True)
+    assert set(results.keys()) == {(False, True, False), (True, False, True)}
+
+    @qasm2.main
+    def bell():
+        q = qasm2.qreg(2)
+        c = qasm2.creg(2)
+        qasm2.h(q[0])
+        qasm2.cx(q[0], q[1])
+        qasm2.measure(q, c)
+        return c
+
+    task = StackMemorySimulator().task(bell)
+    tape = task.compile_tape()
+    assert tape is not None
+    result = task.run_tape(tape)
+    assert isinstance(result, CRegister)
+    assert result[0] == result[1]
+
+    @squin.kernel
+    def noisy():
+        q = squin.qalloc(1)
+        squin.bit_flip(1.0, q[0])
+        return squin.measure(q[0])
+
+    task = StackMemorySimulator().task(noisy)
+    assert task.compile_tape() is None
+    assert task.batch_run(10, tape=True) == {True: 1.0}
+
+
+def test_batch_run_fuse_gates():
+    @squin.kernel
+    def program():
+        q = squin.qalloc(2)
+        # NOTE: H S S H = X
+        squin.h(q[0])
+        squin.s(q[0])
+        squin.s(q[0])
+        squin.h(q[0])
+        # NOTE: the T gates commute with the CZ and cancel out
+        squin.t(q[1])
+        squin.cz(q[0], q[1])
+        squin.t_adj(q[1])
+        return squin.broadcast.measure(q)
+
+    task = StackMemorySimulator().task(program)
+    tape = task.compile_tape()
+    fused = task.compile_tape(fuse_gates=True)
+    assert tape is not None and fused is not None
+
+    names = [method.__name__ for method, *_ in fused.instructions]
+    assert names == ["mtrx", "mcz", "m", "m"]
+    assert len(fused.instructions) < len(tape.instructions)
+    assert task.batch_run(100, tape=True, fuse_gates=True) == {(True, False): 1.0}
+
+
+def test_fuse_gates_state():
+    from pyqrack import QrackSimulator
+    from bloqade.pyqrack.fusion import fuse_gates
+
+    @squin.kernel
+    def program():
+        q = squin.qalloc(3)
+        squin.u3(0.1, 0.2, 0.3, q[0])
+        squin.rx(0.4, q[0])
+        squin.sqrt_y(q[1])
+        squin.rz(0.5, q[1])
+        squin.cx(q[0], q[1])
+        squin.s(q[0])
+        squin.ry(0.6, q[0])
+        squin.rz(0.7, q[2])
+        squin.cz(q[1], q[2])
+        squin.x(q[2])
+        squin.h(q[2])
+
+    tape = StackMemorySimulator().task(program).compile_tape()
+    assert tape is not None
+    fused = fuse_gates(tape)
+    assert len(fused.instructions) < len(tape.instructions)
+
+    states = []
+    for t in (tape, fused):
+        sim_reg = QrackSimulator(3)
+        t.replay(sim_reg)
+        states.append(np.array(sim_reg.out_ket()))
+
+    # NOTE: up to a global phase, which is not tracked by PyQrack
+    assert math.isclose(abs(np.vdot(*states)), 1.0, abs_tol=1e-5)
+
+
+def test_batch_run_workers():
+    @squin.kernel
+    def noisy_coinflip():
+        q = squin.qalloc(2)
+        squin.h(q[0])
+        squin.bit_flip(0.5, q[1])
+        return squin.broadcast.measure(q)
+
+    emulator = StackMemorySimulator(min_qubits=2, rng_state=np.random.default_rng(1))
+    task = emulator.task(noisy_coinflip)
+    results: dict = task.batch_run(1001, workers=3)
+    assert len(results) == 4
+    assert abs(sum(results.values()) - 1.0) < 1e-12
+    assert all(abs(p - 0.25) < 0.1 for p in results.values())
+
+    with pytest.raises(ValueError):
+        task.batch_run(10, workers=0)
+
+
+def test_batch_run_workers_without_fork(monkeypatch):
+    @squin.kernel
+    def coinflip():
+        q = squin.qalloc(1)
+        squin.h(q[0])
+        return squin.qubit.measure(q[0])
+
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    task = StackMemorySimulator(min_qubits=1).task(coinflip)
+    with pytest.warns(RuntimeWarning, match="workers=2"):
+        results: dict = task.batch_run(100, workers=2)
+
+    assert abs(sum(results.values()) - 1.0) < 1e-12
+
+
 def test_batch_state1():
     """
     Averaging with no selector function
@@ -3,6 +3,7 @@ from pathlib import Path
 from contextlib import redirect_stdout
 
 from bloqade import qasm2
+from bloqade.qasm2.emit import main as emit_main
 
 
 def test_qasm2_custom_gate():
@@ -37,3 +38,70 @@ def test_qasm2_custom_gate():
         qasm2.parse.pprint(ast)
     generated = buf.getvalue()
     assert generated.strip() == target.strip()
+
+
+def test_qasm2_custom_gate_emitted_again():
+    @qasm2.gate
+    def custom_gate(a: qasm2.Qubit, b: qasm2.Qubit):
+        qasm2.cx(a, b)
+
+    @qasm2.main
+    def main():
+        qreg = qasm2.qreg(2)
+        custom_gate(qreg[0], qreg[1])
+
+    @qasm2.main
+    def main2():
+        qreg = qasm2.qreg(3)
+        custom_gate(qreg[1], qreg[2])
+
+    target = qasm2.emit.QASM2(custom_gate=True)
+    expected = target.emit_str(main)
+    assert "gate custom_gate a, b {" in expected
+    # NOTE: each emitter has its own table of names, so emitting again neither
+    # drops the definition nor renames the gate
+    assert target.emit_str(main) == expected
+    program = target.emit_str(main2)
+    assert "gate custom_gate a, b {" in program
+    assert "custom_gate_1" not in program
+
+
+def test_qasm2_custom_gate_cache(monkeypatch):
+    @qasm2.gate
+    def custom_gate(a: qasm2.Qubit, b: qasm2.Qubit):
+        qasm2.cx(a, b)
+
+    @qasm2.main
+    def main():
+        qreg = qasm2.qreg(2)
+        custom_gate(qreg[0], qreg[1])
+
+    @qasm2.main
+    def main2():
+        qreg = qasm2.qreg(3)
+        custom_gate(qreg[1], qreg[2])
+
+    emitted = []
+    emit_gate = emit_main._emit_gate
+
+    def counting_emit_gate(gate_emitter, node):
+        emitted.append(node.sym_name)
+        return emit_gate(gate_emitter, node)
+
+    monkeypatch.setattr(emit_main, "_emit_gate", counting_emit_gate)
+
+    target = qasm2.emit.QASM2(custom_gate=True)
+    expected = target.emit_str(main)
+    assert target.emit_str(main) == expected
+    assert "gate custom_gate a, b {" in target.emit_str(main2)
+    assert emitted == ["custom_gate"]
+
+    # different dialects emit the gate again
+    qasm2.emit.QASM2(custom_gate=True, allow_parallel=True).emit(main)
+    assert emitted == ["custom_gate", "custom_gate"]
+
+    # so does rewriting the gate in place
+    cx = custom_gate.code.body.blocks[0].stmts.at(0)
+    cx.replace_by(qasm2.uop.CZ(ctrl=cx.ctrl, qarg=cx.qarg))
+    assert "  cz a, b;" in target.emit_str(main)
+    assert emitted == ["custom_gate", "custom_gate", "custom_gate"]
@@ -309,4 +309,21 @@ CX q[2], q[3];
     )
 
 
+def test_emit_to_file(tmp_path):
+
+    @qasm2.main
+    def bell():
+        q = qasm2.qreg(2)
+        c = qasm2.creg(2)
+        qasm2.h(q[0])
+        qasm2.cx(q[0], q[1])
+        qasm2.measure(q, c)
+
+    target = qasm2.emit.QASM2()
+    path = tmp_path / "bell.qasm"
+    target.emit_to_file(bell, path)
+    assert path.read_text() == target.emit_str(bell)
+    assert qasm2.parse.loadfile(path) == target.emit(bell)
+
+
 test_if()
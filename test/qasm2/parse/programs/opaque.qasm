@@ -0,0 +1,6 @@
+OPENQASM 2.0;
+opaque magic(theta, phi) a, b;
+opaque flip a;
+qreg q[2];
+magic(0.5, pi) q[0], q[1];
+flip q[1];
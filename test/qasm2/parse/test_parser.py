@@ -0,0 +1,36 @@
+import pathlib
+
+from bloqade.qasm2 import parse
+from bloqade.qasm2.parse import parser
+
+
+def test_parser_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    parser.get_parser.cache_clear()
+    try:
+        lark_parser = parser.get_parser()
+        assert parser.get_parser() is lark_parser
+        assert parse.lark_parser is lark_parser
+        assert parser.qasm2_parser is lark_parser
+        assert len(list((tmp_path / "bloqade").glob("qasm2-*.cache"))) == 1
+
+        # NOTE: rebuilt from the cache file
+        parser.get_parser.cache_clear()
+        ast = parse.loads("OPENQASM 2.0;\nqreg q[2];\n")
+        assert parse.loads(parse.spprint(ast)) == ast
+    finally:
+        parser.get_parser.cache_clear()
+
+
+def test_iter_programs():
+    path = pathlib.Path(__file__).parent / "programs"
+    for file in path.glob("*.qasm"):
+        expected = parse.loadfile(file)
+        for batch_size, block_size in [(1, 1), (64, 7), (1 << 20, 1 << 16)]:
+            with file.open() as f:
+                programs = list(
+                    parse.iter_programs(f, batch_size=batch_size, block_size=block_size)
+                )
+            assert all(program.header == expected.header for program in programs)
+            statements = [stmt for program in programs for stmt in program.statements]
+            assert statements == expected.statements, f"Failed for {file}"
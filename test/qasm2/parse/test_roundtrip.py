@@ -1,10 +1,12 @@
+import io
 import os
 import pathlib
 
 import pytest
+from rich.console import Console
 from lark.exceptions import UnexpectedToken
 
-from bloqade.qasm2.parse import loads, spprint, loadfile
+from bloqade.qasm2.parse import dumps, loads, pprint, spprint, loadfile
 
 
 def roundtrip(file, dirname):
@@ -26,3 +28,13 @@ def test_invalids():
     for file in path.glob("*.qasm"):
         with pytest.raises(UnexpectedToken):
             roundtrip(file.name, dirname)
+
+
+def test_dumps():
+    path = pathlib.Path(__file__).parent / "programs"
+    for file in path.glob("*.qasm"):
+        ast = loadfile(file)
+        console = Console(file=io.StringIO(), force_terminal=False, record=True)
+        pprint(ast, console=console)
+        assert dumps(ast) == console.export_text(), f"Failed dumps for {file}"
+        assert loads(dumps(ast)) == ast
@@ -155,3 +155,28 @@ def test_if_lowering():
             qasm2.x(q[0])
 
     main2.print()
+
+
+def test_loadfile_streaming():
+    source = lines + textwrap.dedent("""
+    // comment with a ; and a {
+    gate g(theta) a, b { rx(theta) a; CX a, b; }
+    if (c == 1) g(pi) q[0], q[1];
+    measure q[0] -> c[0];
+    """)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        file = pathlib.Path(f"{tmp_dir}/test.qasm")
+        file.write_text(source)
+
+        expected = qasm2.loadfile(file)
+        mt = qasm2.loadfile(file, streaming=True)
+
+        with file.open() as f:
+            programs = qasm2.parse.iter_programs(f, batch_size=1, block_size=8)
+            region = QASM2(qasm2.main).get_frame_from_stream(programs).curr_region
+
+    assert mt.code.is_structurally_equal(expected.code)
+    assert region.is_structurally_equal(
+        QASM2(qasm2.main).run(qasm2.parse.loads(source))
+    )
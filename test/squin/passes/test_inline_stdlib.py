@@ -0,0 +1,97 @@
+import math
+
+import numpy as np
+from kirin.dialects import func
+
+from bloqade import squin
+from bloqade.pyqrack import StackMemorySimulator
+from bloqade.squin.passes import InlineStdlibPass
+from bloqade.squin.rewrite.inline_stdlib import is_stdlib_method
+
+
+def invoked(mt):
+    return [
+        stmt.callee.sym_name
+        for stmt in mt.callable_region.walk()
+        if isinstance(stmt, func.Invoke)
+    ]
+
+
+def stdlib_invoked(mt):
+    return [
+        stmt.callee.sym_name
+        for stmt in mt.callable_region.walk()
+        if isinstance(stmt, func.Invoke) and is_stdlib_method(stmt.callee)
+    ]
+
+
+@squin.kernel
+def layer(q):
+    squin.h(q[0])
+    squin.cx(q[0], q[1])
+
+
+def circuit():
+    q = squin.qalloc(3)
+    squin.h(q[0])
+    squin.rx(math.pi / 3, q[1])
+    squin.u3(0.1, 0.2, 0.3, q[2])
+    squin.broadcast.t([q[0], q[2]])
+    layer(q)
+    squin.cz(q[1], q[2])
+    squin.s_adj(q[2])
+
+
+def test_inline_stdlib_pass():
+    main = squin.kernel(circuit)
+    reference = main.similar()
+
+    InlineStdlibPass(main.dialects)(main)
+    main.verify()
+
+    assert stdlib_invoked(reference)
+    assert invoked(main) == ["qalloc", "layer"]
+
+    sim = StackMemorySimulator(min_qubits=3)
+    expected = np.asarray(sim.state_vector(reference))
+    result = np.asarray(sim.state_vector(main))
+    assert math.isclose(abs(np.vdot(expected, result)), 1.0, abs_tol=1e-6)
+
+
+def test_inline_stdlib_kernel_option():
+    main = squin.kernel(circuit, inline_stdlib=True)
+    reference = squin.kernel(circuit)
+
+    assert invoked(main) == ["qalloc", "layer"]
+    assert not stdlib_invoked(main)
+
+    sim = StackMemorySimulator(min_qubits=3)
+    expected = np.asarray(sim.state_vector(reference))
+    result = np.asarray(sim.state_vector(main))
+    assert math.isclose(abs(np.vdot(expected, result)), 1.0, abs_tol=1e-6)
+
+
+def test_inline_stdlib_measure():
+
+    @squin.kernel(inline_stdlib=True)
+    def main():
+        q = squin.qalloc(1)
+        squin.x(q[0])
+        return squin.measure(q[0])
+
+    assert not stdlib_invoked(main)
+    assert StackMemorySimulator(min_qubits=1).run(main) == 1
+
+
+def test_inline_stdlib_unknown_length():
+
+    @squin.kernel(inline_stdlib=True)
+    def main(n: int):
+        q = squin.qalloc(n)
+        squin.broadcast.cx(q[:2], q[2:])
+        squin.broadcast.h(q)
+        squin.x(q[0])
+
+    # NOTE: the lengths of the slices are unknown, which the gate statement would not accept
+    assert invoked(main) == ["qalloc", "cx"]
+    main.verify_type()
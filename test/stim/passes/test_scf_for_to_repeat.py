@@ -1,6 +1,7 @@
 import io
 import os
 
+import pytest
 from kirin import ir
 from kirin.dialects import ilist
 
@@ -264,8 +265,22 @@ def test_unused_named_loop_var_becomes_repeat():
     assert "H" in result
 
 
+def test_nested_repeat():
+    """Two nested for _ in range(N) loops become nested REPEAT blocks."""
+
+    @squin.kernel
+    def test():
+        qs = squin.qalloc(3)
+        for _ in range(5):
+            for _ in range(3):
+                squin.broadcast.h(qs)
+
+    SquinToStimPass(dialects=test.dialects)(test)
+    assert codegen(test) == load_reference_program("nested_repeat.stim").rstrip()
+
+
 def test_no_nested_repeat():
-    """Two nested for _ in range(N) loops - only outermost becomes REPEAT.
+    """With preserve_loops disabled, only the outermost loop becomes REPEAT,
     while what is capable of being unrolled in the body is unrolled."""
 
     @squin.kernel
@@ -275,10 +290,72 @@ def test_no_nested_repeat():
             for _ in range(3):
                 squin.broadcast.h(qs)
 
-    SquinToStimPass(dialects=test.dialects)(test)
+    SquinToStimPass(dialects=test.dialects, preserve_loops=False)(test)
     result = codegen(test)
-    print(result)
     assert result.count("REPEAT") == 1
+    assert result.count("H") == 3
+
+
+def test_nested_repeat_with_detectors():
+    @squin.kernel
+    def test():
+        qs = squin.qalloc(3)
+        curr_ms = squin.broadcast.measure(qs)
+        for _ in range(5):
+            for _ in range(3):
+                prev_ms = curr_ms
+                squin.broadcast.h(qs)
+                curr_ms = squin.broadcast.measure(qs)
+                squin.set_detector([curr_ms[0], prev_ms[0]], coordinates=[0, 0])
+            squin.broadcast.x(qs)
+        squin.set_observable([curr_ms[1]])
+
+    SquinToStimPass(dialects=test.dialects)(test)
+    assert (
+        codegen(test)
+        == load_reference_program("nested_repeat_with_detectors.stim").rstrip()
+    )
+
+
+def test_nested_repeat_falls_back_to_unroll():
+    """The first iteration of the inner loop refers to a measurement of the
+    outer loop body, so its record offsets differ from the other iterations:
+    the inner loop is unrolled instead."""
+
+    @squin.kernel
+    def test():
+        qs = squin.qalloc(2)
+        for _ in range(3):
+            curr_ms = squin.broadcast.measure(qs)
+            squin.measure(qs[0])
+            for _ in range(2):
+                prev_ms = curr_ms
+                curr_ms = squin.broadcast.measure(qs)
+                squin.set_detector([curr_ms[0], prev_ms[0]], coordinates=[0, 0])
+
+    SquinToStimPass(dialects=test.dialects)(test)
+    assert (
+        codegen(test) == load_reference_program("nested_repeat_fallback.stim").rstrip()
+    )
+
+
+def test_loop_var_as_record_offset():
+    """`for r in range(N)` where `r` only indexes measurements, at the same
+    record offsets in every iteration, becomes a REPEAT with relative targets."""
+
+    @squin.kernel
+    def test():
+        qs = squin.qalloc(2)
+        history = squin.broadcast.measure(qs)
+        for r in range(4):
+            squin.broadcast.h(qs)
+            history = history + squin.broadcast.measure(qs)
+            squin.set_detector([history[2 * r + 2], history[2 * r]], coordinates=[0, 0])
+
+    SquinToStimPass(dialects=test.dialects)(test)
+    assert (
+        codegen(test) == load_reference_program("loop_var_record_offset.stim").rstrip()
+    )
 
 
 def test_loop_var_used_in_body_unrolled_not_repeated():
@@ -330,3 +407,54 @@ def test_range_zero_iterations_emits_nothing():
     SquinToStimPass(dialects=test.dialects)(test)
     result = codegen(test)
     assert result == ""
+
+
+@squin.kernel
+def _set_first_observable(ms):
+    squin.set_observable([ms[0]])
+
+
+def _observable_indexed_by_loop_var():
+    qs = squin.qalloc(2)
+    history = squin.broadcast.measure(qs)
+    for r in range(3):
+        squin.broadcast.h(qs)
+        history = history + squin.broadcast.measure(qs)
+        squin.set_observable([history[2 * r]])
+
+
+def _observable_in_nested_loop():
+    qs = squin.qalloc(2)
+    for _ in range(2):
+        for _ in range(3):
+            squin.broadcast.h(qs)
+            ms = squin.broadcast.measure(qs)
+            squin.set_observable([ms[0]])
+
+
+def _observable_in_nested_callee():
+    qs = squin.qalloc(2)
+    for _ in range(2):
+        for _ in range(3):
+            squin.broadcast.h(qs)
+            _set_first_observable(squin.broadcast.measure(qs))
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        _observable_indexed_by_loop_var,
+        _observable_in_nested_loop,
+        _observable_in_nested_callee,
+    ],
+)
+def test_preserved_loops_keep_observables(body):
+    """Each iteration of an unrolled loop sets a new observable, so loops setting
+    observables are not preserved unless they would be without `preserve_loops`."""
+
+    def lower(preserve_loops: bool):
+        mt = squin.kernel(body)
+        SquinToStimPass(dialects=mt.dialects, preserve_loops=preserve_loops)(mt)
+        return stim.Circuit(codegen(mt)).flattened()
+
+    assert lower(True) == lower(False)
@@ -0,0 +1,90 @@
+import pytest
+from kirin.dialects import ilist
+
+from bloqade import stim, squin
+from bloqade.squin import kernel
+from bloqade.stim.cache import CompileCache, get_compile_cache
+
+
+@pytest.fixture
+def compile_cache(tmp_path):
+    cache = stim.enable_compile_cache(maxsize=2, directory=tmp_path)
+    yield cache
+    stim.disable_compile_cache()
+
+
+def make_kernel(p: float):
+    @kernel
+    def main():
+        q = squin.qalloc(2)
+        squin.h(q[0])
+        squin.cx(q[0], q[1])
+        squin.depolarize(p, q[0])
+        squin.measure(q)
+
+    return main
+
+
+def test_structural_key():
+    assert CompileCache.key(make_kernel(0.1)) == CompileCache.key(make_kernel(0.1))
+    assert CompileCache.key(make_kernel(0.1)) != CompileCache.key(make_kernel(0.2))
+    assert CompileCache.key(make_kernel(0.1)) != CompileCache.key(
+        make_kernel(0.1), insert_ticks=True
+    )
+
+
+def make_for_each_kernel(gate):
+    @kernel
+    def apply(q):
+        gate(q)
+
+    @kernel
+    def main():
+        q = squin.qalloc(2)
+        ilist.for_each(apply, q)
+        squin.measure(q)
+
+    return main
+
+
+def test_structural_key_constant_callee():
+    # NOTE: the kernels only differ by the body of the function passed to for_each
+    assert CompileCache.key(make_for_each_kernel(squin.h)) != CompileCache.key(
+        make_for_each_kernel(squin.x)
+    )
+
+
+def test_compile_cache_constant_callee(compile_cache: CompileCache):
+    assert str(stim.Circuit(make_for_each_kernel(squin.h))).startswith("H 0 1")
+    assert str(stim.Circuit(make_for_each_kernel(squin.x))).startswith("X 0 1")
+    assert (compile_cache.hits, compile_cache.misses) == (0, 2)
+
+
+def test_compile_cache(compile_cache: CompileCache, tmp_path):
+    assert get_compile_cache() is compile_cache
+
+    expected = stim.Circuit(make_kernel(0.1))
+    assert (compile_cache.hits, compile_cache.misses) == (0, 1)
+
+    assert stim.Circuit(make_kernel(0.1)) == expected
+    assert (compile_cache.hits, compile_cache.misses) == (1, 1)
+
+    stim.Circuit(make_kernel(0.1), insert_ticks=True)
+    stim.Circuit(make_kernel(0.2))
+    assert (compile_cache.hits, compile_cache.misses) == (1, 3)
+    assert len(list(tmp_path.glob("*.stim"))) == 3
+
+    # NOTE: evicted from memory, but still persisted on disk
+    other = CompileCache(directory=tmp_path)
+    program = other.get(CompileCache.key(make_kernel(0.1)))
+    assert stim.Circuit(program) == expected
+    assert other.hits == 1
+
+    compile_cache.clear()
+    assert not list(tmp_path.glob("*.stim"))
+
+
+def test_compile_cache_disabled():
+    stim.disable_compile_cache()
+    assert get_compile_cache() is None
+    assert str(stim.Circuit(make_kernel(0.1))).startswith("H 0")
@@ -1,7 +1,14 @@
+import io
+import math
+
+import pytest
+
 import stim
 from bloqade import squin
-from bloqade.stim import Circuit
+from bloqade.stim import Circuit, emit_to_file, emit_to_stream
 from bloqade.squin import kernel
+from bloqade.stim.circuit import _codegen, _CircuitWriter
+from bloqade.stim.emit.direct import build_circuit
 
 
 def test_circuit():
@@ -46,3 +53,114 @@ def test_circuit_from_string_matches_native():
     program_text = "H 0\nCX 0 1"
 
     assert str(Circuit(program_text)) == str(stim.Circuit(program_text))
+
+
+def test_circuit_repeat_chunks():
+    """A REPEAT block is never split across chunks when building the circuit."""
+
+    @kernel
+    def main():
+        q = squin.qalloc(2)
+        for _ in range(5):
+            squin.h(q[0])
+            squin.cx(q[0], q[1])
+            squin.measure(q)
+
+    expected = stim.Circuit(_codegen(main))
+    assert "REPEAT" in str(expected)
+
+    circuit = stim.Circuit()
+    writer = _CircuitWriter(circuit, chunk_size=2)
+    emit_to_stream(main, writer)  # type: ignore
+    writer.flush()
+    assert circuit == expected
+    assert Circuit(main) == expected
+
+
+def test_emit_to_file(tmp_path):
+    """emit_to_file writes the same program as the string code generator."""
+
+    @kernel
+    def main():
+        q = squin.qalloc(2)
+        squin.h(q[0])
+        squin.cx(q[0], q[1])
+
+    path = tmp_path / "main.stim"
+    emit_to_file(main, path)
+    assert path.read_text().strip() == _codegen(main)
+
+    buf = io.StringIO()
+    emit_to_stream(main, buf, insert_ticks=True)
+    assert stim.Circuit(buf.getvalue()) == Circuit(main, insert_ticks=True)
+
+
+def test_emit_to_stream_appends():
+    """emit_to_stream keeps the content already written to the stream."""
+
+    @kernel
+    def main():
+        q = squin.qalloc(2)
+        squin.h(q[0])
+        squin.cx(q[0], q[1])
+
+    buf = io.StringIO()
+    buf.write("X 1\n")
+    emit_to_stream(main, buf)
+    emit_to_stream(main, buf)
+    assert stim.Circuit(buf.getvalue()) == stim.Circuit(
+        "X 1\n" + _codegen(main) + "\n" + _codegen(main)
+    )
+
+
+@pytest.mark.parametrize("insert_ticks", [False, True])
+def test_circuit_direct(insert_ticks: bool):
+    """A flat kernel is built directly into the circuit of the full lowering."""
+
+    @kernel
+    def main():
+        q = squin.qalloc(4)
+        squin.h(q[0])
+        squin.broadcast.cx(q[:2], q[2:])
+        squin.s_adj(q[1])
+        squin.t(q[2])
+        squin.sqrt_x_adj(q[3])
+        squin.swap(q[0], q[1])
+        squin.depolarize(0.01, q[0])
+        squin.broadcast.depolarize2(0.123456789, q[:2], q[2:])
+        squin.single_qubit_pauli_channel(0.01, 0.02, 0.03, q[1])
+        squin.broadcast.qubit_loss(0.1, q)
+        squin.broadcast.correlated_qubit_loss(0.2, [q[:2], q[2:]])
+        m = squin.broadcast.measure(q)
+        squin.set_detector([m[0], m[1]], coordinates=[0, 1.5])
+        squin.broadcast.reset(q)
+        m2 = squin.broadcast.measure(q)
+        squin.set_detector([m[2], m2[2]], coordinates=[1, 0])
+        squin.set_observable([m2[0]])
+        squin.set_observable([m2[1], m[3]])
+
+    expected = stim.Circuit(_codegen(main, insert_ticks=insert_ticks))
+    assert build_circuit(main, insert_ticks=insert_ticks) == expected
+    assert Circuit(main, insert_ticks=insert_ticks) == expected
+
+
+def test_circuit_direct_fallback():
+    """Kernels out of the subset of the direct builder are lowered by the pass."""
+
+    @kernel
+    def rotation():
+        q = squin.qalloc(2)
+        squin.rx(math.pi / 2, q[0])
+        squin.rz(0.3, q[1])
+
+    @kernel
+    def feed_forward():
+        q = squin.qalloc(2)
+        m = squin.measure(q[0])
+        if squin.is_one(m):
+            squin.x(q[1])
+
+    for main in (rotation, feed_forward):
+        with pytest.raises(Exception):
+            build_circuit(main)
+        assert Circuit(main) == stim.Circuit(_codegen(main))